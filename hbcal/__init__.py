@@ -1,4 +1,23 @@
 # flake8: noqa
-from .main import main, get_output_line
+import sys
+
 from .ordinal import ordinal_suffix
 from .version import __version__
+
+# The command line interface (and its dependencies, e.g. argparse and
+# bidi) is only imported when main or get_output_line is first used, so
+# that importing hbcal for conversions is fast.
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name not in ('main', 'get_output_line'):
+            raise AttributeError("module {0!r} has no attribute {1!r}".format(
+                __name__, name))
+        from importlib import import_module
+        module = import_module('.main', __name__)
+        # Importing the module binds it as hbcal.main, so bind the functions
+        # (as the eager import does).
+        globals().update(main=module.main,
+                         get_output_line=module.get_output_line)
+        return globals()[name]
+else:
+    from .main import main, get_output_line
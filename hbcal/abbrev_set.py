@@ -15,6 +15,14 @@
 # along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
 from hbcal.my_collections import OrderedSet
 
+# The value found by PrefixTrie.find for the start of keys with different
+# values
+AMBIGUOUS = object()
+_MISSING = object()
+
+# The items of a node of a PrefixTrie
+_CHILDREN, _SHARED, _EXACT = range(3)
+
 
 class AmbiguousKeyError(KeyError):
     """An exception class raised by AbbrevSet if the supplied key could be
@@ -26,24 +34,111 @@ class AbbrevSet(OrderedSet):
     """This class provides a set with lookup by key. Only the
     start of the key needs to be provided - if it matches one of the keys
     the key is returned. If it matches more than one key, an exception
-    (AmbiguousKeyError) is raised."""
+    (AmbiguousKeyError) is raised.
+
+    The members are held in a PrefixTrie, so a lookup takes one step per
+    character of the key. The trie is rebuilt (on the next lookup) when
+    the set is changed."""
+
+    def __init__(self, iterator=None):
+        self._trie = None
+        super(AbbrevSet, self).__init__(iterator)
+
+    def _members(self):
+        if self._trie is None:
+            self._trie = PrefixTrie((x, x) for x in self)
+        return self._trie
 
     def __getitem__(self, item):
-        found = None
-        for set_item in self:
-            if set_item.startswith(item):
-                if found is None:
-                    found = set_item
-                else:
-                    raise AmbiguousKeyError
-        if found is None:
-            raise KeyError
-        return found
+        return self._members()[item]
 
     def __contains__(self, item):
-        try:
-            self[item]
-        except KeyError:
-            return False
-        else:
-            return True
+        return self._members().find(item, AMBIGUOUS) is not AMBIGUOUS
+
+    def add(self, value):
+        self._trie = None
+        super(AbbrevSet, self).add(value)
+
+    def discard(self, value):
+        self._trie = None
+        super(AbbrevSet, self).discard(value)
+
+
+class PrefixTrie(object):
+    """This class provides a mapping from strings to values with lookup by
+    the start of a key.
+
+    Each node of the trie records the value of the key that ends there (if
+    any), and the value shared by every key that starts with its prefix (or
+    AMBIGUOUS if they have different values), so a lookup takes one step
+    per character whatever the number of keys. Like AbbrevSet, a prefix of
+    keys with different values is ambiguous, even if it is itself a key,
+    unless the trie is created with exact_first=True, when such a prefix
+    finds the value of that key (e.g. Adar, rather than Adar I or Adar II).
+    Values are compared by identity, so several keys (e.g. different
+    spellings of a name) may have the same value without making their
+    prefixes ambiguous."""
+
+    def __init__(self, items=(), exact_first=False):
+        self._root = [{}, _MISSING, _MISSING]
+        self._len = 0
+        self._exact_first = exact_first
+        for key, value in items:
+            self[key] = value
+
+    def __setitem__(self, key, value):
+        """Add a key. A key cannot be given a different value once it
+        has been added."""
+        existing = self._node(key)
+        if existing is not None and existing[_EXACT] is not _MISSING:
+            if existing[_EXACT] is not value:
+                raise ValueError("Key already has a different value")
+            return
+        node = self._root
+        self._share(node, value)
+        for char in key:
+            node = node[_CHILDREN].setdefault(char, [{}, _MISSING, _MISSING])
+            self._share(node, value)
+        node[_EXACT] = value
+        self._len += 1
+
+    @staticmethod
+    def _share(node, value):
+        if node[_SHARED] is _MISSING:
+            node[_SHARED] = value
+        elif node[_SHARED] is not value:
+            node[_SHARED] = AMBIGUOUS
+
+    def _node(self, prefix):
+        node = self._root
+        for char in prefix:
+            node = node[_CHILDREN].get(char)
+            if node is None:
+                break
+        return node
+
+    def find(self, prefix, default=None):
+        """Return the value of a key that starts with prefix (or, if the
+        trie was created with exact_first=True, of a key that is prefix). If
+        there is no such key, default is returned; if there are several with
+        different values, AMBIGUOUS is returned."""
+        node = self._node(prefix)
+        if node is None:
+            return default
+        if self._exact_first and node[_EXACT] is not _MISSING:
+            return node[_EXACT]
+        return default if node[_SHARED] is _MISSING else node[_SHARED]
+
+    def __getitem__(self, prefix):
+        value = self.find(prefix, _MISSING)
+        if value is _MISSING:
+            raise KeyError(prefix)
+        if value is AMBIGUOUS:
+            raise AmbiguousKeyError(prefix)
+        return value
+
+    def __contains__(self, prefix):
+        return self.find(prefix, AMBIGUOUS) is not AMBIGUOUS
+
+    def __len__(self):
+        return self._len
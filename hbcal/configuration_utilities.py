@@ -324,7 +324,16 @@ class ArgumentParser(argparse.ArgumentParser):
     pipe or a file). Unredirected output seems OK. See
     http://bugs.python.org/issue9779
     This class fixes it. It is not needed in Python 3.
+
+    The epilog may also be a function (with no arguments) that returns the
+    epilog, so that it is only built if help is output.
     """
+
+    def format_help(self):
+        if callable(self.epilog):
+            self.epilog = self.epilog()
+        return super().format_help()
+
     if PY2:
         def _print_message(self, message, _file=None):
             """Output message to file, encoded as UTF-8 """
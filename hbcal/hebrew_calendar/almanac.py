@@ -0,0 +1,191 @@
+"""This module contains an almanac for a civil year.
+
+The almanac holds the Hebrew date, weekday, daf yomi and weekly sedrah of
+every day of a civil year in compact arrays. They are calculated in one
+pass, stepping through the Hebrew year and the Daf Yomi cycle, so looking
+up a day of the year is array indexing rather than a conversion. Almanacs
+are cached (with LRU eviction) by civil_almanac.
+
+Exports:
+    CivilAlmanac
+    civil_almanac
+"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+try:
+    from functools import lru_cache
+except ImportError:
+    from functools32 import lru_cache
+
+from future.builtins import range
+
+from .abs_time import DAY
+from .civil_year import BritishYear
+from .daf_yomi import DafYomiCycle
+from .date import Date
+from .hebrew_year import HebrewYear, HebrewMonth, Sedrah
+from .weekday import DAYS_IN_WEEK, Weekday
+
+ALMANAC_CACHE_SIZE = 16
+
+
+def _fill(first_year, start, days, months, dates, years):
+    """Fill arrays with the months and dates of consecutive days.
+
+    Args:
+        first_year: The year (an instance of a subclass of Year) containing
+                    the first day
+        start:      The number of days from the start of first_year to the
+                    first day
+        days:       The number of days
+        months:     An array for the month of each day
+        dates:      An array for the date of each day
+        years:      An array for the year value of each day
+
+    Returns:
+        A dictionary mapping each year value to its year.
+    """
+    year = first_year
+    found = {year.value: year}
+    day = start
+    for _ in range(days):
+        if day >= year.days_in_year():
+            day -= year.days_in_year()
+            year = year + 1
+            found[year.value] = year
+        month, date = year.month_and_date(day)
+        months.append(month)
+        dates.append(date)
+        years.append(year.value)
+        day += 1
+    return found
+
+
+class CivilAlmanac(object):
+    """Hebrew dates, dapim and sedrahs for every day of a civil year.
+
+    The Hebrew date of a civil day is the one whose daytime falls on it.
+    Days are indexed from 0 (1st January). The arrays are public, but must
+    not be modified:
+
+        hebrew_years:   The Hebrew year of each day
+        hebrew_months:  The Hebrew month (HebrewMonth value) of each day
+        hebrew_dates:   The Hebrew date of each day
+        weekdays:       The weekday (Weekday value) of each day
+        daf_cycles:     The Daf Yomi cycle of each day (0 before the first
+                        cycle)
+        tractates:      The tractate (Tractate value) of each day (0 before
+                        the first cycle)
+        dapim:          The daf of each day (0 before the first cycle)
+        sedrahs:        The sedrah (Sedrah value) of the Shabbat on or after
+                        each day
+    """
+
+    def __init__(self, year, year_class=BritishYear, israel=False):
+        """Calculate the almanac.
+
+        Args:
+            year:       The civil year (integer)
+            year_class: The subclass of Year for the civil year
+            israel:     True for Israel sedrahs, False for the Diaspora
+        """
+        self.year = year_class(year)
+        self.israel = israel
+        start = self.year.start
+        days = ((self.year + 1).start - start).days
+        weekday = start.days
+
+        self.hebrew_years = array('h')
+        self.hebrew_months = array('b')
+        self.hebrew_dates = array('b')
+        hebrew = Date(HebrewYear, start)
+        self._hebrew_years = _fill(hebrew.year,
+                                   (start - hebrew.year.start).days, days,
+                                   self.hebrew_months, self.hebrew_dates,
+                                   self.hebrew_years)
+
+        self.weekdays = array('b', ((weekday + day) % DAYS_IN_WEEK
+                                    for day in range(days)))
+
+        self.daf_cycles = array('h')
+        self.tractates = array('b')
+        self.dapim = array('B')
+        before = max(0, min(days, (DafYomiCycle.START_FIRST_YEAR -
+                                   start).days))
+        for arr in (self.daf_cycles, self.tractates, self.dapim):
+            arr.extend([0] * before)
+        if before < days:
+            first = start + before * DAY
+            cycle = Date(DafYomiCycle, first).year
+            _fill(cycle, (first - cycle.start).days, days - before,
+                  self.tractates, self.dapim, self.daf_cycles)
+
+        # The sedrah is the same for every day up to the next Shabbat, so
+        # it only needs to be calculated once per week (except in Tishri,
+        # where it depends on the festivals).
+        self.sedrahs = array('b')
+        sedrah = None
+        for day in range(days):
+            if (sedrah is None or self.weekdays[day] == Weekday.SUNDAY or
+                    self.hebrew_months[day] == HebrewMonth.TISHRI):
+                hebrew_year = self._hebrew_years[self.hebrew_years[day]]
+                sedrah = hebrew_year.sedrah(self.hebrew_months[day],
+                                            self.hebrew_dates[day], israel)
+            self.sedrahs.append(sedrah)
+
+    def __len__(self):
+        return len(self.weekdays)
+
+    def index(self, month, date):
+        """Return the index of a civil month and date in the arrays."""
+        month, date = self.year.adjust_date(month, date)
+        return (self.year.day_start(month, date) - self.year.start).days
+
+    def hebrew_date(self, month, date):
+        """Return the Hebrew date (Date) of a civil month and date."""
+        day = self.index(month, date)
+        return Date(HebrewYear(self._hebrew_years[self.hebrew_years[day]]),
+                    self.hebrew_months[day], self.hebrew_dates[day])
+
+    def weekday(self, month, date):
+        """Return the weekday (Weekday) of a civil month and date."""
+        return Weekday(self.weekdays[self.index(month, date)])
+
+    def daf(self, month, date):
+        """Return the daf yomi (Date with a DafYomiCycle) of a civil month
+        and date, or None if it is before the first cycle."""
+        day = self.index(month, date)
+        if not self.daf_cycles[day]:
+            return None
+        return Date(DafYomiCycle(self.daf_cycles[day]), self.tractates[day],
+                    self.dapim[day])
+
+    def sedrah(self, month, date):
+        """Return the sedrah (Sedrah) of the Shabbat on or after a civil
+        month and date."""
+        return Sedrah(self.sedrahs[self.index(month, date)])
+
+
+@lru_cache(maxsize=ALMANAC_CACHE_SIZE)
+def civil_almanac(year, year_class=BritishYear, israel=False):
+    """Return the almanac (CivilAlmanac) for a civil year.
+
+    The most recently used almanacs are cached, so they must not be
+    modified."""
+    return CivilAlmanac(year, year_class, israel)
@@ -0,0 +1,210 @@
+"""This module calculates anniversaries (yahrzeits and birthdays) of Hebrew
+dates in bulk.
+
+The observed date of an anniversary depends only on the month and date of
+the original date, on a few facts about the original year (whether it was a
+leap year, and whether the following year had a 30th day of the month) and
+on the customary rules being followed. Original dates are grouped by these
+values, and the observed date is calculated once per group for each target
+year.
+
+Exports:
+    AdarRule
+    ShortMonthRule
+    AnniversaryRule
+    Anniversary
+    YAHRZEIT
+    BIRTHDAY
+    anniversaries
+    iter_anniversaries
+"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import namedtuple, OrderedDict
+from enum import IntEnum
+
+from .civil_year import BritishYear
+from .date import Date
+from .hebrew_year import HebrewYear, HebrewMonth, SIX_HOURS
+
+
+class AdarRule(IntEnum):
+    """Where an anniversary of a date in Adar of a regular year falls in a
+    leap year."""
+    ADAR_RISHON = 0
+    ADAR_SHENI = 1
+
+
+class ShortMonthRule(IntEnum):
+    """Where an anniversary of the 30th of a month falls in a year in which
+    the month has only 29 days.
+
+    This applies to 30th Cheshvan, 30th Kislev and 30th Adar Rishon.
+
+    ROLL_FORWARD:   The 1st of the following month (as HebrewYear.adjust_date)
+    LAST_DAY:       The 29th of the month
+    FIRST_YEAR:     The customary rule for yahrzeits. If the year after the
+                    original date had a 30th of the month, as ROLL_FORWARD.
+                    Otherwise, the first yahrzeit was on the 29th, and so
+                    are all yahrzeits in years in which the month is short.
+                    30th Adar Rishon is the first day of Rosh Chodesh Adar,
+                    so in a regular year it is observed on 30th Shevat.
+    """
+    ROLL_FORWARD = 0
+    LAST_DAY = 1
+    FIRST_YEAR = 2
+
+
+AnniversaryRule = namedtuple('AnniversaryRule', ['adar', 'short_month'])
+AnniversaryRule.__doc__ = """The customary rules for an anniversary.
+
+    adar:           An AdarRule
+    short_month:    A ShortMonthRule
+"""
+
+YAHRZEIT = AnniversaryRule(AdarRule.ADAR_RISHON, ShortMonthRule.FIRST_YEAR)
+BIRTHDAY = AnniversaryRule(AdarRule.ADAR_SHENI, ShortMonthRule.ROLL_FORWARD)
+
+Anniversary = namedtuple('Anniversary', ['hebrew', 'civil'])
+Anniversary.__doc__ = """The observed date of an anniversary.
+
+    hebrew: The Hebrew date (Date)
+    civil:  The civil date (Date) containing the daytime of the Hebrew date
+
+    Anniversary objects are shared by all original dates in the same group,
+    so the dates must not be modified.
+"""
+
+SHORT_MONTHS = (HebrewMonth.CHESHVAN, HebrewMonth.KISLEV,
+                HebrewMonth.ADAR_RISHON)
+
+
+def _group_key(date, rule):
+    """Return the group of an original date.
+
+    The group is a tuple comprising the month, the date, whether the month
+    is Adar of a regular year, and whether the month had a 30th day in the
+    following year. The last two are only set when they are relevant under
+    the rule."""
+    year = date.year
+    month = date.month
+    regular_adar = (month == HebrewMonth.ADAR_RISHON and
+                    rule.adar == AdarRule.ADAR_SHENI and
+                    year.months_in_year() == year.MONTHS_IN_SIMPLE_YEAR)
+    had_30th = True
+    if (date.date == HebrewYear.LONG_MONTH and
+            month in (HebrewMonth.CHESHVAN, HebrewMonth.KISLEV) and
+            rule.short_month == ShortMonthRule.FIRST_YEAR):
+        had_30th = ((year + 1).days_in_month(month) ==
+                    HebrewYear.LONG_MONTH)
+    return month, date.date, regular_adar, had_30th
+
+
+def _observed_date(year, key, rule):
+    """Return the observed month and date of a group in a target year."""
+    month, date, regular_adar, had_30th = key
+    if regular_adar and year.months_in_year() == year.MONTHS_IN_LEAP_YEAR:
+        month = HebrewMonth.ADAR_SHENI
+    if (date == HebrewYear.LONG_MONTH and month in SHORT_MONTHS and
+            year.days_in_month(month) < HebrewYear.LONG_MONTH):
+        if rule.short_month == ShortMonthRule.LAST_DAY:
+            date = HebrewYear.SHORT_MONTH
+        elif rule.short_month == ShortMonthRule.FIRST_YEAR:
+            if month == HebrewMonth.ADAR_RISHON:
+                month = HebrewMonth.SHEVAT
+            elif not had_30th:
+                date = HebrewYear.SHORT_MONTH
+    return year.adjust_date(month, date)
+
+
+def _group(dates, rule):
+    """Group original dates.
+
+    Returns an OrderedDict mapping each group key to a list of (index,
+    original year) tuples."""
+    groups = OrderedDict()
+    for index, date in enumerate(dates):
+        if not isinstance(date.year, HebrewYear):
+            date = Date(HebrewYear, date.day_start)
+        groups.setdefault(_group_key(date, rule), []).append(
+            (index, date.year.value))
+    return groups
+
+
+def _resolve(groups, count, year, rule, year_class):
+    """Return the anniversaries of grouped dates in a target year."""
+    result = [None] * count
+    for key, members in groups.items():
+        anniversary = None
+        for index, original_year in members:
+            if original_year < year.value:
+                if anniversary is None:
+                    month, date = _observed_date(year, key, rule)
+                    hebrew = Date(HebrewYear(year), month, date)
+                    civil = Date(year_class, hebrew.day_start + SIX_HOURS)
+                    anniversary = Anniversary(hebrew, civil)
+                result[index] = anniversary
+    return result
+
+
+def anniversaries(dates, year, rule=YAHRZEIT, year_class=BritishYear):
+    """Return the anniversaries of a list of dates in a Hebrew year.
+
+    Args:
+        dates:      A sequence of original dates (Date objects, normally
+                    with a HebrewYear)
+        year:       The target Hebrew year (integer)
+        rule:       The customary rules (AnniversaryRule), e.g. YAHRZEIT or
+                    BIRTHDAY
+        year_class: The subclass of Year for the civil dates
+
+    Returns:
+        A list with an element for each original date. The element is an
+        Anniversary object, or None if the target year is not after the
+        year of the original date.
+    """
+    return _resolve(_group(dates, rule), len(dates), HebrewYear(year), rule,
+                    year_class)
+
+
+def iter_anniversaries(dates, start, stop, rule=YAHRZEIT,
+                       year_class=BritishYear):
+    """A generator for the anniversaries of a list of dates in a range of
+    Hebrew years.
+
+    The dates are only grouped once.
+
+    Args:
+        dates:      A sequence of original dates (Date objects, normally
+                    with a HebrewYear)
+        start:      The first target Hebrew year (integer)
+        stop:       The Hebrew year after the last target year (integer)
+        rule:       The customary rules (AnniversaryRule)
+        year_class: The subclass of Year for the civil dates
+
+    Yields:
+        A tuple for each target year, comprising the year (integer) and a
+        list as returned by anniversaries.
+    """
+    if start >= stop:
+        return
+    groups = _group(dates, rule)
+    year = HebrewYear(start)
+    for value in range(start, stop):
+        yield value, _resolve(groups, len(dates), year, rule, year_class)
+        year += 1
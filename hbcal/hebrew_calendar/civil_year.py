@@ -16,10 +16,16 @@
 # You should have received a copy of the GNU General Public License
 # along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
 
+try:
+    from functools import lru_cache
+except ImportError:
+    from functools32 import lru_cache
+
 from future.builtins import super
 
-from .abs_time import AbsTime, DAY
-from .date import Month, Date, BadDate, RegularYear, Year
+from .abs_time import AbsTime, RelTime, DAY
+from .abstract_attribute import AbstractAttribute
+from .date import Month, Date, BadDate, Year
 
 
 class CivilMonth(Month):
@@ -70,6 +76,41 @@ class CivilYear(Year):
         """
         return NotImplementedError
 
+    @classmethod
+    def _days_before_year(cls, year_value):
+        """Return the number of days from 1st January of year 0 to 1st
+        January of the specified year (negative for years before year 0).
+
+        This should be an abstract class method, but abstract class methods
+        do not work in python 2 (fixed in python 3.4).
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def _year_of_day(cls, days):
+        """Return the year containing a day, given the number of days from
+        1st January of year 0.
+
+        This is the inverse of _days_before_year. It should be an abstract
+        class method, but abstract class methods do not work in python 2
+        (fixed in python 3.4).
+        """
+        raise NotImplementedError
+
+    @Year.value.setter
+    def value(self, value):
+        self._start = self.START_FIRST_YEAR + RelTime(
+            0, self._days_before_year(value) -
+            self._days_before_year(self.FIRST_YEAR))
+        self._value = value
+
+    @classmethod
+    def current_year(cls, atime):
+        days = ((atime - cls.START_FIRST_YEAR).days +
+                cls._days_before_year(cls.FIRST_YEAR))
+        year = cls(cls._year_of_day(days))
+        return year, atime - year.start
+
     def days_in_year(self):
         """Return the number of days in the year."""
         return self.DAYS_IN_LEAP_YEAR if self.leap_year(self._value) \
@@ -98,7 +139,7 @@ class CivilYear(Year):
         return CivilMonth
 
 
-class JulianYear(CivilYear, RegularYear):
+class JulianYear(CivilYear):
     """Subclass of Year for the Julian calendar.
 
     This calendar was replaced in 1752 (in Britain)
@@ -109,35 +150,32 @@ class JulianYear(CivilYear, RegularYear):
     START_FIRST_YEAR = AbsTime(0, 102, 6)
 
     def __init__(self, year):
-        if isinstance(year, CivilYear) and \
-                hasattr(year.__class__, "LAST_JULIAN_DATE") and \
-                year.value <= year.__class__.LAST_JULIAN_DATE.year.value:
-            self._value = year.value
-            self._start = year.start
-        else:
-            super().__init__(year)
+        # A year of a ReformYear class up to the change is a Julian year.
+        if isinstance(year, ReformYear) and \
+                year.value <= year.LAST_JULIAN_DATE.year.value:
+            year = year.value
+        super().__init__(year)
 
     @classmethod
     def leap_year(cls, year_value):
         """Return a Boolean - True if the lear is a leap year."""
         return year_value % 4 == 0
 
-    # Not all years are the same length, but there is a cycle of 4 years
-    # where the length of a cycle is fixed.
+    # Every 4th year (starting with year 0) is a leap year, so the number of
+    # days in a cycle of 4 years is fixed.
     @classmethod
-    def _years_per_cycle(cls):
-        """Return number of years in a cycle."""
-        return cls.YEARS_IN_CYCLE
+    def _days_before_year(cls, year_value):
+        return (cls.DAYS_IN_YEAR * year_value +
+                (year_value + cls.YEARS_IN_CYCLE - 1) // cls.YEARS_IN_CYCLE)
 
     @classmethod
-    def _cycle_duration(cls):
-        """Return length of a cycle (RelTime)."""
-        return ((cls.YEARS_IN_CYCLE - cls.LEAP_YEARS_IN_CYCLE) *
-                cls.DAYS_IN_YEAR +
-                cls.LEAP_YEARS_IN_CYCLE * cls.DAYS_IN_LEAP_YEAR) * DAY
+    def _year_of_day(cls, days):
+        return (cls.YEARS_IN_CYCLE * days //
+                (cls.YEARS_IN_CYCLE * cls.DAYS_IN_YEAR +
+                 cls.LEAP_YEARS_IN_CYCLE))
 
 
-class GregorianYear(CivilYear, RegularYear):
+class GregorianYear(CivilYear):
     """Subclass of Year for the Gregorian calendar.
 
     This calendar replaced the Julian calendar in 1752 (in Britain)."""
@@ -146,16 +184,19 @@ class GregorianYear(CivilYear, RegularYear):
     LEAP_YEARS_IN_CYCLE = 97
     START_FIRST_YEAR = AbsTime(0, 132, 6)
 
+    # Not all years are the same length, but there is a cycle of 400 years
+    # where the length of a cycle is fixed.
+    DAYS_IN_CYCLE = (YEARS_IN_CYCLE * CivilYear.DAYS_IN_YEAR +
+                     LEAP_YEARS_IN_CYCLE)
+    DAYS_IN_CENTURY = 100 * CivilYear.DAYS_IN_YEAR + 24
+    DAYS_IN_4_YEARS = 4 * CivilYear.DAYS_IN_YEAR + 1
+
     def __init__(self, year):
-        if isinstance(year, CivilYear) and \
-                hasattr(year.__class__, "FIRST_GREGORIAN_DATE") and \
-                year.value >= year.__class__.FIRST_GREGORIAN_DATE.year.value:
-            self._value = year.value
-            self._start = year.start
-            if year.value == year.__class__.FIRST_GREGORIAN_DATE.year.value:
-                self._start -= year.__class__.DAYS_SKIPPED * DAY
-        else:
-            super().__init__(year)
+        # A year of a ReformYear class from the change is a Gregorian year.
+        if isinstance(year, ReformYear) and \
+                year.value >= year.FIRST_GREGORIAN_DATE.year.value:
+            year = year.value
+        super().__init__(year)
 
     @classmethod
     def leap_year(cls, year_value):
@@ -163,72 +204,66 @@ class GregorianYear(CivilYear, RegularYear):
         return (year_value % 4 == 0 and
                 year_value % 100 != 0) or year_value % 400 == 0
 
-    # Not all years are the same length, but there is a cycle of 400 years
-    # where the length of a cycle is fixed.
     @classmethod
-    def _years_per_cycle(cls):
-        """Return number of years in a cycle."""
-        return cls.YEARS_IN_CYCLE
+    def _days_before_year(cls, year_value):
+        return (cls.DAYS_IN_YEAR * year_value + (year_value + 3) // 4 -
+                (year_value + 99) // 100 + (year_value + 399) // 400)
 
     @classmethod
-    def _cycle_duration(cls):
-        """Return length of a cycle (RelTime)."""
-        return ((cls.YEARS_IN_CYCLE - cls.LEAP_YEARS_IN_CYCLE) *
-                cls.DAYS_IN_YEAR +
-                cls.LEAP_YEARS_IN_CYCLE * cls.DAYS_IN_LEAP_YEAR) * DAY
-
-
-class BritishYear(CivilYear):
-    """Combination of JulianYear and GregorianYear, as used in Britain.
-
-    The calendar used the Julian calendar upto and including 2nd September
-    1752, after which it jumped to 14th September (Gregorian calendar)."""
-
-    LAST_JULIAN_DATE = Date(JulianYear(1752), 9, 2)
-    FIRST_GREGORIAN_DATE = Date(GregorianYear(1752), 9, 14)
-    YEAR_AFTER_CHANGEOVER = FIRST_GREGORIAN_DATE.year + 1
-    DAYS_SKIPPED = 11  # Do we need this?
+    def _year_of_day(cls, days):
+        # As datetime.date.fromordinal - count from 1st January of year 1
+        # (the start of a cycle of 400 years without a leap year first).
+        cycles, days = divmod(days - cls.DAYS_IN_LEAP_YEAR, cls.DAYS_IN_CYCLE)
+        centuries, days = divmod(days, cls.DAYS_IN_CENTURY)
+        quads, days = divmod(days, cls.DAYS_IN_4_YEARS)
+        years = days // cls.DAYS_IN_YEAR
+        year = (cls.YEARS_IN_CYCLE * cycles + 100 * centuries + 4 * quads +
+                years + 1)
+        # The last day of a 4 year or 400 year cycle is in the previous year
+        return year - 1 if years == 4 or centuries == 4 else year
+
+
+class ReformYear(CivilYear):
+    """Abstract base class for civil years that changed from the Julian
+    calendar to the Gregorian calendar.
+
+    Subclasses (one for each date of the change) are created by
+    ReformCalendar. The change is described by class attributes calculated
+    once when the subclass is created, so conversions on either side of the
+    change do not depend on the distance from it."""
+    # value and current_year are overridden to use JulianYear and
+    # GregorianYear, so the day numbers of CivilYear are not used.
+    # pylint: disable=abstract-method
+
+    LAST_JULIAN_DATE = AbstractAttribute("The last date (Date) of the "
+                                         "Julian calendar")
+    FIRST_GREGORIAN_DATE = AbstractAttribute("The first date (Date) of the "
+                                             "Gregorian calendar")
+    CHANGEOVER = AbstractAttribute("The start (AbsTime) of the first "
+                                   "Gregorian date")
+    _JULIAN_END = AbstractAttribute("The last date of the Julian calendar, "
+                                    "as a tuple (year, month, date)")
+    _GREGORIAN_START = AbstractAttribute("The first date of the Gregorian "
+                                         "calendar, as a tuple (year, month, "
+                                         "date)")
+    _LAST_JULIAN_DAY = AbstractAttribute("The day of the year of the last "
+                                         "Julian date")
+    # The number of days skipped after the last Julian date, if the first
+    # Gregorian date is in the same year
+    DAYS_SKIPPED = 0
 
     FIRST_YEAR = JulianYear.FIRST_YEAR
     START_FIRST_YEAR = JulianYear.START_FIRST_YEAR
 
     def __init__(self, year):
-        if isinstance(year, JulianYear) and \
-                year.value <= self.LAST_JULIAN_DATE.year.value:
-            self._value = year.value
-            self._start = year.start
-        elif isinstance(year, GregorianYear) and \
-                year.value > self.FIRST_GREGORIAN_DATE.year.value:
-            self._value = year.value
-            self._start = year.start
-        else:
-            super().__init__(year)
-
-    def adjust_date(self, month, date):
-        """Check if the month and date supplied are valid for the current year.
+        super().__init__(year.value if isinstance(year, (JulianYear,
+                                                         GregorianYear))
+                         else year)
 
-        Returns a tuple comprising the month and date, adjusted if necessary
-        to make them valid. """
-
-        # Allow negative values of date (count back from end of month)
-        # Most cases are handled by the base class, but we need to handle
-        # September 1752 here (before the changeover)
-        if ((self.FIRST_GREGORIAN_DATE.year.value == self._value and
-             self.FIRST_GREGORIAN_DATE.month == month and
-             date < self.FIRST_GREGORIAN_DATE.date -
-             self.last_day(month) - 1)):
-            date -= self.DAYS_SKIPPED
-
-        if (self.LAST_JULIAN_DATE.year.value,
-                self.LAST_JULIAN_DATE.month,
-                self.LAST_JULIAN_DATE.date) < \
-                (self._value, month, date) < \
-                (self.FIRST_GREGORIAN_DATE.year.value,
-                 self.FIRST_GREGORIAN_DATE.month,
-                 self.FIRST_GREGORIAN_DATE.date):
-            raise BadDate("Dates from 3rd to 13th September 1752 are invalid")
-        else:
-            return super().adjust_date(month, date)
+    @classmethod
+    def _julian(cls, year_value, month, date):
+        """Return True if a date is in the Julian calendar."""
+        return (year_value, month, date) <= cls._JULIAN_END
 
     @classmethod
     def _base_year(cls, year_value):
@@ -237,58 +272,123 @@ class BritishYear(CivilYear):
         :param year_value:
         :return:A subclass of CivilYear (JulianYear or GregorianYear)
         """
-        return JulianYear if year_value <= cls.LAST_JULIAN_DATE.year.value \
+        return JulianYear if year_value <= cls._JULIAN_END[0] \
             else GregorianYear
 
     @Year.value.setter
     def value(self, value):
-        old_class = self._base_year(self.value)
-        new_class = self._base_year(value)
-        year = new_class(self if old_class == new_class
-                         else new_class.FIRST_YEAR)
-        year.value = value
-        self.__init__(year)
+        self._start = self._base_year(value)(value).start
+        self._value = value
 
     @classmethod
     def leap_year(cls, year_value):
-        return cls._base_year(year_value).leap_year(year_value)
+        # In a year with both calendars, February follows the calendar in
+        # use at its end.
+        cls2 = JulianYear if cls._julian(year_value, CivilMonth.FEBRUARY,
+                                         CivilYear.SHORT_FEBRUARY) \
+            else GregorianYear
+        return cls2.leap_year(year_value)
 
     @classmethod
     def current_year(cls, atime):
-        cls2 = JulianYear if atime < cls.YEAR_AFTER_CHANGEOVER.start \
-            else GregorianYear
-        year, remainder = cls2.current_year(atime)
-        return cls(year), remainder
+        cls2 = JulianYear if atime < cls.CHANGEOVER else GregorianYear
+        year = cls(cls2.current_year(atime)[0].value)
+        return year, atime - year.start
+
+    def adjust_date(self, month, date):
+        """Check if the month and date supplied are valid for the current year.
+
+        Returns a tuple comprising the month and date, adjusted if necessary
+        to make them valid. """
+
+        # Allow negative values of date (count back from end of month)
+        # Most cases are handled by the base class, but we need to handle
+        # the month of the change here (before the changeover)
+        if ((self.FIRST_GREGORIAN_DATE.year.value == self._value and
+             self.FIRST_GREGORIAN_DATE.month == month and
+             self.LAST_JULIAN_DATE.month == month and
+             date < self.FIRST_GREGORIAN_DATE.date -
+             self.last_day(month) - 1)):
+            date -= (self.FIRST_GREGORIAN_DATE.date -
+                     self.LAST_JULIAN_DATE.date - 1)
+
+        if self._JULIAN_END < (self._value, month, date) < \
+                self._GREGORIAN_START:
+            raise BadDate("Dates after {0:%-d %B %Y} and before "
+                          "{1:%-d %B %Y} are invalid".format(
+                              self.LAST_JULIAN_DATE,
+                              self.FIRST_GREGORIAN_DATE))
+        else:
+            return super().adjust_date(month, date)
 
     def day_start(self, month, date):
         """Return the start (AbsTime) of the specified month and date."""
-        cls = JulianYear if ((self._value, month, date) <=
-                             (self.LAST_JULIAN_DATE.year.value,
-                              self.LAST_JULIAN_DATE.month,
-                              self.LAST_JULIAN_DATE.date)) \
+        cls = JulianYear if self._julian(self._value, month, date) \
             else GregorianYear
-        return cls.day_start(cls(self), month, date)
+        return cls(self._value).day_start(month, date)
+
+    def month_and_date(self, day_of_year):
+        """Return the month and date for a day of the year.
+
+        In the year of the change, days after the last Julian date are later
+        in the month offsets (which include the skipped days)."""
+        if (self._value == self._GREGORIAN_START[0] and
+                day_of_year > self._LAST_JULIAN_DAY):
+            day_of_year += self.DAYS_SKIPPED
+        return super().month_and_date(day_of_year)
 
     def add_days(self, month, date, days):
-        julian_old = (self._value, month, date) <= \
-                     (self.LAST_JULIAN_DATE.year.value,
-                      self.LAST_JULIAN_DATE.month,
-                      self.LAST_JULIAN_DATE.date)
-        self.year, month, date = super().add_days(month, date, days)
-        if julian_old:
-            if (self._value, month, date) > \
-                    (self.LAST_JULIAN_DATE.year.value,
-                     self.LAST_JULIAN_DATE.month,
-                     self.LAST_JULIAN_DATE.date):
-                (self.year,
-                 month, date) = super().add_days(month, date,
-                                                 self.DAYS_SKIPPED)
-        else:
-            if (self._value, month, date) < \
-                    (self.FIRST_GREGORIAN_DATE.year.value,
-                     self.FIRST_GREGORIAN_DATE.month,
-                     self.FIRST_GREGORIAN_DATE.date):
-                (self.year,
-                 month, date) = super().add_days(month, date,
-                                                 -self.DAYS_SKIPPED)
-        return self.year, month, date
+        # Convert to and from a time, so days skipped in the change are not
+        # counted.
+        year, remainder = self.current_year(self.day_start(month, date) +
+                                            days * DAY)
+        return (year,) + year.month_and_date(remainder.days)
+
+
+@lru_cache(maxsize=None)
+def ReformCalendar(year, month, date, name=None):
+    # pylint: disable=invalid-name,protected-access
+    """Return a subclass of ReformYear for a change from the Julian calendar
+    to the Gregorian calendar.
+
+    Subclasses are cached, so calling this again with the same arguments
+    returns the same class.
+
+    Args:
+        year:   The year (integer) of the last date of the Julian calendar
+        month:  The month (integer) of the last date of the Julian calendar
+        date:   The last date (integer) of the Julian calendar
+        name:   The name of the class (default ReformYear<year>)
+
+    Returns:
+        A subclass of ReformYear. The day after the specified Julian date is
+        the first date of the Gregorian calendar.
+    """
+    last_julian = Date(JulianYear(year), month, date)
+    changeover = last_julian.day_start + DAY
+    first_gregorian = Date(GregorianYear, changeover)
+    cls = type(str(name or "ReformYear{0}".format(year)), (ReformYear,), {
+        "LAST_JULIAN_DATE": last_julian,
+        "FIRST_GREGORIAN_DATE": first_gregorian,
+        "CHANGEOVER": changeover,
+        "_JULIAN_END": (year, last_julian.month, last_julian.date),
+        "_GREGORIAN_START": (first_gregorian.year.value,
+                             first_gregorian.month, first_gregorian.date),
+        # The months up to the last Julian date have the same lengths as in
+        # the Julian year.
+        "_LAST_JULIAN_DAY": last_julian.year.day_of_year(last_julian.month,
+                                                         last_julian.date),
+        "__module__": __name__})
+    # If the change is within a year, the offsets from the start of the year
+    # to the first Gregorian date include the skipped days.
+    if first_gregorian.year.value == year:
+        cls.DAYS_SKIPPED = (cls(year).day_of_year(first_gregorian.month,
+                                                  first_gregorian.date) -
+                            cls._LAST_JULIAN_DAY - 1)
+    return cls
+
+
+# The calendar used in Britain (and its colonies) used the Julian calendar
+# upto and including 2nd September 1752, after which it jumped to 14th
+# September (Gregorian calendar).
+BritishYear = ReformCalendar(1752, CivilMonth.SEPTEMBER, 2, "BritishYear")
@@ -19,8 +19,9 @@
 
 from __future__ import division
 from abc import ABCMeta, abstractmethod
+from bisect import bisect_right
+from collections import OrderedDict
 from enum import IntEnum
-import logging
 
 from future.builtins import range
 from future.utils import PY2, with_metaclass
@@ -170,10 +171,8 @@ class Date(FormatPercentString):
                 raise BadDate
             year, remainder = year.current_year(month)
             self.year = year
-            self.month = year.month_class().start_year_month()
-            self.date = year.first_day()
-            days = remainder.days_chalakim[0]
-            self.__iadd__(days)
+            month, self.date = year.month_and_date(remainder.days)
+            self.month = year.month_class()(month)
         else:
             self.year = year
             (month, self.date) = year.adjust_date(month, date)
@@ -253,8 +252,31 @@ class Date(FormatPercentString):
         'd': 'format_day_of_month'
     }
 
+    # The weekday only depends on the day of the week, and the month name
+    # on the month, the date and (for Hebrew leap years) the number of
+    # months in the year.
+    FORMAT_KEYS = {
+        'format_year': lambda date: date.year.value,
+        'format_weekday': lambda date: date.day_start.days,
+        'format_month_name': lambda date: (date.year.months_in_year(),
+                                           date.month, date.date),
+        'format_day_of_month': lambda date: date.date
+    }
+
+
+def _log():
+    """Return the logger of this module.
 
-LOG = logging.getLogger(__name__)
+    logging is only imported when something is logged, which is rare, so
+    that importing the calendar modules stays fast."""
+    import logging
+    return logging.getLogger(__name__)
+
+
+# Month offsets are shared between all years with the same class and length
+# (see Year.month_offsets and Year.month_and_date).
+MONTH_OFFSETS = {}
+MONTH_STARTS = {}
 
 
 class Year(with_metaclass(ABCMeta, FormatPercentString)):
@@ -434,16 +456,48 @@ class Year(with_metaclass(ABCMeta, FormatPercentString)):
         """
         raise NotImplementedError
 
+    def month_offsets(self):
+        """Return the offset (in days) of each month from the start of year.
+
+        The result is an OrderedDict mapping each month (in the order given
+        by months()) to the number of days from the start of the year to the
+        first day of the month. Do not modify it - it is shared by all years
+        of the same class with the same number of days."""
+        key = (self.__class__, self.days_in_year())
+        offsets = MONTH_OFFSETS.get(key)
+        if offsets is None:
+            offsets = OrderedDict()
+            day_count = 0
+            for month in self.months():
+                offsets[month] = day_count
+                day_count += self.days_in_month(month)
+            MONTH_OFFSETS[key] = offsets
+        return offsets
+
+    def day_of_year(self, month, date):
+        """Return the number of days from the start of the year to the
+        specified month and date."""
+        return self.month_offsets()[month] + date - self.first_day()
+
+    def month_and_date(self, day_of_year):
+        """Return the month and date for a day of the year.
+
+        This is the inverse of day_of_year. day_of_year must be in the range
+        0 to days_in_year() - 1."""
+        key = (self.__class__, self.days_in_year())
+        months_starts = MONTH_STARTS.get(key)
+        if months_starts is None:
+            offsets = self.month_offsets()
+            months_starts = (list(offsets), list(offsets.values()))
+            MONTH_STARTS[key] = months_starts
+        months, starts = months_starts
+        index = bisect_right(starts, day_of_year) - 1
+        return (months[index],
+                day_of_year - starts[index] + self.first_day())
+
     def day_start(self, month, date):
         """Return the start (AbsTime) of the specified month and date."""
-        day_count = 0
-        for month_count in self.months():
-            if month == month_count:
-                day_count += date - self.first_day()
-                break
-            else:
-                day_count += self.days_in_month(month_count)
-        return self.start + RelTime(0, day_count)
+        return self.start + RelTime(0, self.day_of_year(month, date))
 
     def __repr__(self):
         return "{0}({1})".format(type(self).__name__, self._value)
@@ -546,8 +600,8 @@ class RegularYear(Year):
             year += 1
 
         if estimate != year.value:
-            LOG.debug("Calculating year for %s, estimated %s actual %s",
-                      atime, estimate, year.value)
+            _log().debug("Calculating year for %s, estimated %s actual %s",
+                         atime, estimate, year.value)
 
         # We now have the right year.
         return year, atime - year.start
@@ -662,10 +716,8 @@ class DateTime(FormatPercentString):
         :param atime: An AbsTime object (a point in time)
         """
         year, remainder = cls.current_year(atime)
-        month = year.month_class().start_year_month()
-        self.date = Date(year, month, year.first_day())
         days, remainder = remainder.days_chalakim
-        self.date += days
+        self.date = Date(year, *year.month_and_date(days))
         self.time = RelTime(0, 0, 0, remainder)
         self.date.day_start = atime - self.time
 
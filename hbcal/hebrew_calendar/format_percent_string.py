@@ -1,4 +1,5 @@
-"""This module defines a mix-in class for formatting strings"""
+"""This module defines a mix-in class for formatting strings, and functions
+for formatting one or many objects"""
 
 # Copyright 2019 Mark Stern
 #
@@ -16,16 +17,87 @@
 # You should have received a copy of the GNU General Public License
 # along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
 
-import logging
+from collections import OrderedDict
+
 from future.utils import iteritems
 from future.builtins import super
 try:
-    from functools import cached_property
+    from functools import lru_cache
 except ImportError:
-    from cached_property import cached_property
+    from functools32 import lru_cache
+
+
+# Compiled formatting strings, keyed by the class of the object (or another
+# key determining its escapes) and the formatting string. Formatting
+# strings may contain arbitrary text (e.g. names of festivals), so the
+# number cached is limited; the oldest are discarded first.
+COMPILED_FORMATS = OrderedDict()
+COMPILED_FORMATS_SIZE = 1024
+ESCAPES_CACHE_SIZE = 256
+SPLIT_ESCAPE_CACHE_SIZE = 1024
+
+
+def _store(cache, key, value, size):
+    """ Add a value to a cache (OrderedDict), discarding the oldest value
+    if the cache is full """
+    if len(cache) >= size:
+        cache.popitem(last=False)
+    cache[key] = value
+
+
+def _compiled(cache_key, cls, escapes, fmt):
+    """ Return a compiled formatting string (see compile_percent_string)
+    from COMPILED_FORMATS, compiling and caching it if necessary """
+    segments = COMPILED_FORMATS.get(cache_key)
+    if segments is None:
+        segments = compile_percent_string(cls, escapes, fmt)
+        _store(COMPILED_FORMATS, cache_key, segments, COMPILED_FORMATS_SIZE)
+    return segments
+
+
+def compile_percent_string(cls, escapes, fmt):
+    """ Compile a formatting string for objects of a class
 
+    Args:
+        cls:        the class of the objects to format
+        escapes:    a mapping whose keys are single characters (see
+                    format_percent_string)
+        fmt:        a string specifying how to format the objects
 
-def format_percent_string(obj, escapes, fmt):
+    Returns:
+        A tuple of (handler, argument) pairs. If handler is None, argument is
+        literal text. Otherwise handler is a method of cls (not bound to an
+        object), which is called with the object and argument (the escape
+        sequence, followed by any hash and options).
+    """
+    fmt1, sep, option = fmt.partition('#')
+    segments, literal, escape_sequence = [], '', ''
+    for char in fmt1:
+        if escape_sequence:
+            if char in escapes:
+                escape_sequence += char
+                if escapes[char] is not None:
+                    if literal:
+                        segments.append((None, literal))
+                        literal = ''
+                    segments.append((getattr(cls, escapes[char]),
+                                     escape_sequence + sep + option))
+                    escape_sequence = ''
+            else:
+                escape_sequence = ''
+                literal += char
+        else:
+            if char == '%':
+                escape_sequence += char
+            else:
+                literal += char
+    literal += escape_sequence
+    if literal:
+        segments.append((None, literal))
+    return tuple(segments)
+
+
+def format_percent_string(obj, escapes, fmt, key=None):
     """ Format an object using a formatting string
 
     Args:
@@ -33,6 +105,8 @@ def format_percent_string(obj, escapes, fmt):
                     them
         escapes:    a mapping whose keys are single characters
         fmt:        a string specifying how to format the object
+        key:        a hashable key determining escapes (by default, the
+                    class of obj)
 
     Returns:
         A formatted string
@@ -44,7 +118,8 @@ def format_percent_string(obj, escapes, fmt):
     %[<flag>]<option>
 
     where <flag> is a key in escapes with value None and <option> is a key in
-    escapes whose value is a string. The string is a method name in obj.
+    escapes whose value is a string. The string is the name of a method of
+    obj (not a class or static method).
     The method will be called with a single parameter (the escape sequence)
     and the returned string from the object method will replace the escape
     sequence in the returned string from this function.
@@ -56,27 +131,128 @@ def format_percent_string(obj, escapes, fmt):
     If fmt contains a hash ('#'), the hash and everything after it will not be
     processed as above, but will instead be appended to the escape string
     whenever a method in obj is called as above.
+
+    The formatting string is compiled once for each key, so escapes must be
+    the same for every object with the same key.
     """
-    fmt1, sep, option = fmt.partition('#')
-    formatted, escape_sequence = '', ''
-    for char in fmt1:
-        if escape_sequence:
-            if char in escapes:
-                escape_sequence += char
-                if escapes[char] is not None:
-                    fmt = escape_sequence + sep + option
-                    formatted += getattr(obj, escapes[char])(fmt)
-                    escape_sequence = ''
-            else:
-                escape_sequence = ''
-                formatted += char
-        else:
-            if char == '%':
-                escape_sequence += char
-            else:
-                formatted += char
-    formatted += escape_sequence
-    return formatted
+    cache_key = (obj.__class__ if key is None else key, fmt)
+    return _render(obj, _compiled(cache_key, obj.__class__, escapes, fmt))
+
+
+def _render(obj, segments):
+    """ Format an object using a compiled formatting string """
+    return u''.join([argument if handler is None else handler(obj, argument)
+                     for handler, argument in segments])
+
+
+def format_many(objects, fmt):
+    """ Format a sequence of objects using the same formatting string
+
+    Args:
+        objects:    a sequence of FormatPercentString objects
+        fmt:        a string specifying how to format the objects
+
+    Returns:
+        A list of formatted strings (the same as format(obj, fmt) for each
+        object)
+
+    The objects are grouped by their format keys, and the formatting string
+    is compiled once for each group. Each escape sequence is then formatted
+    for the whole group (a column at a time). If the class of the objects
+    has a FORMAT_KEYS entry for the method of an escape sequence, the method
+    is only called once for each distinct key in the group.
+    """
+    objects = list(objects)
+    groups = {}
+    for index, obj in enumerate(objects):
+        groups.setdefault(obj.format_key, []).append(index)
+    result = [None] * len(objects)
+    for format_key, indices in iteritems(groups):
+        group = [objects[index] for index in indices]
+        first = group[0]
+        segments = _compiled((format_key, fmt), first.__class__,
+                             first.escapes, fmt)
+        columns = [_format_column(group, handler, argument,
+                                  first.FORMAT_KEYS)
+                   for handler, argument in segments]
+        for index, row in zip(indices, zip(*columns) if columns else
+                              [()] * len(indices)):
+            result[index] = u''.join(row)
+    return result
+
+
+def format_all(obj, fmts):
+    """ Format an object using several formatting strings
+
+    Args:
+        obj:        a FormatPercentString object
+        fmts:       a sequence of formatting strings
+
+    Returns:
+        A list of formatted strings (the same as format(obj, fmt) for each
+        formatting string)
+
+    Each escape sequence (with any options after a hash) is only formatted
+    once, and the result is shared by all the formatting strings that
+    contain it.
+    """
+    format_key = obj.format_key
+    formatted = {}
+    result = []
+    for fmt in fmts:
+        segments = _compiled((format_key, fmt), obj.__class__, obj.escapes,
+                             fmt)
+        parts = []
+        for handler, argument in segments:
+            if handler is not None:
+                text = formatted.get((handler, argument))
+                if text is None:
+                    text = handler(obj, argument)
+                    formatted[(handler, argument)] = text
+                argument = text
+            parts.append(argument)
+        result.append(u''.join(parts))
+    return result
+
+
+def _format_column(objects, handler, argument, format_keys):
+    """ Format one segment of a compiled formatting string for a list of
+    objects (see format_many) """
+    if handler is None:
+        return [argument] * len(objects)
+    field_key = format_keys.get(handler.__name__)
+    if field_key is None:
+        return [handler(obj, argument) for obj in objects]
+    formatted = {}
+    column = []
+    for obj in objects:
+        key = field_key(obj)
+        text = formatted.get(key)
+        if text is None:
+            text = formatted[key] = handler(obj, argument)
+        column.append(text)
+    return column
+
+
+@lru_cache(maxsize=SPLIT_ESCAPE_CACHE_SIZE)
+def split_escape(fmt):
+    """ Split an escape sequence into its flag and option
+
+    Args:
+        fmt:    an escape sequence of the form %[<flags>]<character>, possibly
+                followed by a hash and options
+
+    Returns:
+        A tuple comprising the last flag ('' if there is none) and the
+        options after the hash ('' if there is no hash).
+    """
+    fmt1, _, option = fmt.partition('#')
+    return fmt1[-2:-1] if len(fmt1) > 2 else '', option
+
+
+# The escapes of each key (see FormatPercentString.format_key), limited to
+# ESCAPES_CACHE_SIZE keys
+ESCAPES_CACHE = OrderedDict()
 
 
 class UnknownFlagError(TypeError):
@@ -106,19 +282,45 @@ class FormatPercentString(object):
 
     ESCAPES = {}
     SUBFORMATTERS = tuple()
+    # Functions of an object that determine the result of a formatting
+    # method (given the escape sequence), keyed by the name of the method.
+    # These are used by format_many to format each distinct value once.
+    FORMAT_KEYS = {}
+
+    @property
+    def format_key(self):
+        """ A hashable key that determines the valid escape characters.
+
+        It depends on the class and on any subformatters that are objects
+        rather than classes, since (for example) the escapes of a date
+        depend on the class of its year."""
+        key = self.__class__
+        for attr_name in self.SUBFORMATTERS:
+            attr = getattr(self, attr_name)
+            if not isinstance(attr, type):
+                key = (key, getattr(attr, 'format_key', attr.__class__))
+        return key
 
-    @cached_property
+    @property
     def escapes(self):
         """ Collects all the valid escape characters from subformatters """
-        escapes = self.ESCAPES.copy()
-        for attr_name in self.SUBFORMATTERS:
-            attr = getattr(self, attr_name)
-            escapes.update((key, "format_" + attr_name if value else value)
-                           for key, value in iteritems(attr.escapes))
+        format_key = self.format_key
+        escapes = ESCAPES_CACHE.get(format_key)
+        if escapes is None:
+            escapes = self.ESCAPES.copy()
+            for attr_name in self.SUBFORMATTERS:
+                attr = getattr(self, attr_name)
+                escapes.update((key, "format_" + attr_name if value else value)
+                               for key, value in iteritems(attr.escapes))
+            _store(ESCAPES_CACHE, format_key, escapes, ESCAPES_CACHE_SIZE)
         return escapes
 
     def __format__(self, fmt):
-        return format_percent_string(self, self.escapes, fmt)
+        format_key = self.format_key
+        segments = COMPILED_FORMATS.get((format_key, fmt))
+        if segments is None:
+            return format_percent_string(self, self.escapes, fmt, format_key)
+        return _render(self, segments)
 
     @staticmethod
     def format_number(value, places, fmt, validate_flag=False):
@@ -130,10 +332,7 @@ class FormatPercentString(object):
         If the flag is unknown, an exception is (optionally) raised.
         The calling function can catch this exception to process
         other flags. """
-        fmt1, _, _ = fmt.partition('#')
-        flag = fmt1[1:-1]
-        if len(flag) > 1:
-            flag = flag[-1]
+        flag, _ = split_escape(fmt)
         fmt = '0{places}d'.format(places=places)
         if flag == '-':
             fmt = 'd'
@@ -166,6 +365,3 @@ class Formatter:
             return self
         new_func = self.func.__get__(obj, obj_type)
         return self.__class__(new_func)
-
-
-LOG = logging.getLogger(__name__)
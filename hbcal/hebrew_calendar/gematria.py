@@ -1,5 +1,6 @@
 """This module contains functions (mostly internal) for
-   converting numbers to Hebrew letters with equivalent values. """
+   converting numbers to Hebrew letters with equivalent values, and
+   for converting Hebrew letters back to numbers. """
 
 # Copyright 2019 Mark Stern
 #
@@ -17,6 +18,13 @@
 # You should have received a copy of the GNU General Public License
 # along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
 
+try:
+    from functools import lru_cache
+except ImportError:
+    from functools32 import lru_cache
+
+from future.builtins import range
+
 from .hebrew_letters import HEBREW_LETTERS
 
 HUNDREDS = ['', HEBREW_LETTERS['QOF'], HEBREW_LETTERS['RESH'],
@@ -32,6 +40,29 @@ UNITS = ['', HEBREW_LETTERS['ALEF'], HEBREW_LETTERS['BET'],
          HEBREW_LETTERS['HE'], HEBREW_LETTERS['VAV'], HEBREW_LETTERS['ZAYIN'],
          HEBREW_LETTERS['CHET'], HEBREW_LETTERS['TET']]
 
+# The value of each letter (including final forms)
+LETTER_VALUES = dict(
+    [(letter, value) for value, letter in enumerate(UNITS) if letter] +
+    [(letter, value * 10) for value, letter in enumerate(TENS) if letter] +
+    [(letter, value * 100) for value, letter in enumerate(HUNDREDS)
+     if letter] +
+    [(HEBREW_LETTERS['TAV'], 400), (HEBREW_LETTERS['FINAL_KAF'], 20),
+     (HEBREW_LETTERS['FINAL_MEM'], 40), (HEBREW_LETTERS['FINAL_NUN'], 50),
+     (HEBREW_LETTERS['FINAL_PE'], 80), (HEBREW_LETTERS['FINAL_TZADE'], 90)])
+
+# Apostrophes and quotation marks are often used instead of geresh and
+# gershayim.
+GERESH_CHARACTERS = frozenset((HEBREW_LETTERS['GERESH'], u"'", u"\u2019"))
+GERSHAYIM_CHARACTERS = frozenset((HEBREW_LETTERS['GERSHAYIM'], u'"',
+                                  u"\u201D"))
+
+# The numbers whose letters are calculated once (when first needed): all
+# numbers below 1000 (dates, dapim and years without thousands) and the
+# years of the current millennium. Other numbers are cached.
+TABLE_RANGES = ((1, 1000), (5000, 6000))
+LETTERS_TABLE = {}
+LETTERS_CACHE_SIZE = 1024
+
 
 def to_letters(value, abbreviate=True):
     """ Convert number to Hebrew letters with equivalent values
@@ -52,9 +83,85 @@ def to_letters(value, abbreviate=True):
     Returns:
         string:
     """
+    if isinstance(value, int) and (abbreviate or value < 1000):
+        if not LETTERS_TABLE:
+            LETTERS_TABLE.update((number, _to_letters(number))
+                                 for start, stop in TABLE_RANGES
+                                 for number in range(start, stop))
+        letters = LETTERS_TABLE.get(value)
+        if letters is not None:
+            return letters
+    return _cached_letters(value, abbreviate)
+
+
+@lru_cache(maxsize=LETTERS_CACHE_SIZE, typed=True)
+def _cached_letters(value, abbreviate):
+    """ Convert number to Hebrew letters (see to_letters) """
     return _to_letters(value, abbreviate=abbreviate)
 
 
+def from_letters(letters):
+    """ Convert Hebrew letters to the number with an equivalent value
+
+    This is the inverse of to_letters, for numbers below a million.
+
+    Args:
+        letters: a string of Hebrew letters, with or without geresh and
+        gershayim (or apostrophes and quotation marks). Letters followed
+        by a geresh are thousands, unless the geresh is at the end after a
+        single letter (e.g. Alef geresh is 1). If there is no geresh,
+        thousands are recognised by a letter with a lower value than the
+        letter after it (e.g. He Tav Shin Pe He is 5785).
+
+    Returns:
+        integer:
+
+    Raises:
+        ValueError if letters contains any other characters, or no letters,
+        or if the letters of a group (of thousands or units) are not a
+        number (e.g. Alef Alef, or Kaf Yod).
+    """
+    total = group = group_letters = gereshes = previous = 0
+    for char in letters:
+        value = LETTER_VALUES.get(char)
+        if value is not None:
+            if gereshes or value > previous:
+                total += group * 1000 ** max(gereshes, 1)
+                group = group_letters = gereshes = 0
+            elif not _may_follow(previous, value):
+                raise ValueError(
+                    u"invalid Hebrew number: {letters}".format(
+                        letters=letters))
+            group += value
+            group_letters += 1
+            previous = value
+        elif char in GERESH_CHARACTERS and group_letters:
+            gereshes += 1
+        elif char not in GERSHAYIM_CHARACTERS or not group_letters:
+            raise ValueError(
+                u"invalid Hebrew number: {letters}".format(letters=letters))
+    if not group_letters:
+        raise ValueError(
+            u"invalid Hebrew number: {letters}".format(letters=letters))
+    if group_letters == 1 and gereshes:
+        gereshes -= 1
+    return total + group * 1000 ** gereshes
+
+
+def _may_follow(previous, value):
+    """ Return True if a letter may follow a letter with the same or a
+    higher value in the same group of a number.
+
+    Only Tav may be repeated, and there may only be one other letter of
+    hundreds, one of tens and one of units - except Tet Vav and Tet Zayin
+    (15 and 16). """
+    if previous == 400:
+        return True
+    if value < 10 <= previous or value < 100 <= previous:
+        return True
+    return (previous, value) in ((9, 6), (9, 7))
+
+
 def _to_letters(value, abbreviate=True, force=False):
     """ Convert number to Hebrew letters with equivalent values
 
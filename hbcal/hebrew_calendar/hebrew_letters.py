@@ -2,6 +2,7 @@
 
 Exports:
     hebrew_letters
+    resolve_names
 """
 
 # Copyright 2015, 2019 Mark Stern
@@ -32,3 +33,11 @@ HEBREW_LETTERS = {'ALEF': u"\u05D0", 'BET': u"\u05D1", 'GIMEL': u"\u05D2",
                   'QOF': u"\u05E7", 'RESH': u"\u05E8", 'SHIN': u"\u05E9",
                   'TAV': u"\u05EA", 'GERESH': u"\u05F3",
                   'GERSHAYIM': u"\u05F4"}
+
+
+def resolve_names(templates):
+    """Return a tuple of names, replacing the letter names (e.g. {ALEF}) in
+    each template by Hebrew letters. None entries are unchanged."""
+    return tuple(None if template is None
+                 else template.format(**HEBREW_LETTERS)
+                 for template in templates)
@@ -25,6 +25,7 @@
 #  Tishri, Pesach would sometimes occur in the 7th month (Nissan) and
 #  sometimes in the 8th month (Nissan in a leap year).
 from __future__ import division
+from collections import namedtuple
 from enum import IntEnum
 
 from future.builtins import range, super
@@ -32,12 +33,13 @@ from future.builtins import range, super
 from . import abs_time
 from .abs_time import DAY
 from .weekday import DAYS_IN_WEEK, Weekday
-from .hebrew_letters import HEBREW_LETTERS
-from .date import MonthNotInRange, DateNotInRange, Month, RegularYear
+from .hebrew_letters import resolve_names
+from .date import MonthNotInRange, DateNotInRange, Month, RegularYear, Date
+from .civil_year import BritishYear
 from .gematria import to_letters
-from .format_percent_string import UnknownFlagError
+from .format_percent_string import split_escape
 
-HEBREW_MONTH_NAMES = [
+HEBREW_MONTH_NAMES = resolve_names([
     None,
     u"{NUN}{YOD}{SAMECH}{FINAL_NUN}",
     u"{ALEF}{YOD}{YOD}{RESH}",
@@ -51,7 +53,7 @@ HEBREW_MONTH_NAMES = [
     u"{TET}{BET}{TAV}",
     u"{SHIN}{BET}{TET}",
     u"{ALEF}{DALET}{RESH} {ALEF}{GERESH}",
-    u"{ALEF}{DALET}{RESH} {BET}{GERESH}"]
+    u"{ALEF}{DALET}{RESH} {BET}{GERESH}"])
 
 
 class HebrewMonth(Month):
@@ -73,8 +75,8 @@ class HebrewMonth(Month):
     def __format__(self, fmt):
         _, _, option = fmt.partition('#')
         if option == "":
-            return self.name()
-        return HEBREW_MONTH_NAMES[self].format(**HEBREW_LETTERS)
+            return MONTH_NAMES[self]
+        return HEBREW_MONTH_NAMES[self]
 
     def format_month_name(self, fmt, year, date):
         formatted = format(self, fmt)
@@ -91,7 +93,10 @@ class HebrewMonth(Month):
         return HebrewMonth.ELLUL
 
 
-HEBREW_SEDRAH_NAMES = [
+MONTH_NAMES = (None,) + tuple(month.name() for month in HebrewMonth)
+
+
+HEBREW_SEDRAH_NAMES = resolve_names([
     None,
     u"{BET}{RESH}{ALEF}{SHIN}{YOD}{TAV}",
     u"{NUN}{CHET}",
@@ -153,7 +158,7 @@ HEBREW_SEDRAH_NAMES = [
     u"{BET}{HE}{RESH} - {BET}{CHET}{QOF}{TAV}{YOD}",
     u"{CHET}{QOF}{TAV} - {BET}{LAMED}{QOF}",
     u"{MEM}{TET}{VAV}{TAV} - {MEM}{SAMECH}{AYIN}{YOD}",
-    u"{NUN}{TZADE}{BET}{YOD}{FINAL_MEM} - {VAV}{YOD}{LAMED}{FINAL_KAF}"]
+    u"{NUN}{TZADE}{BET}{YOD}{FINAL_MEM} - {VAV}{YOD}{LAMED}{FINAL_KAF}"])
 
 
 class Sedrah(IntEnum):
@@ -224,10 +229,14 @@ class Sedrah(IntEnum):
         return self._name_.title()
 
     def __format__(self, fmt):
-        return (self.__str__().replace("_",
-                                       "-" if self > Sedrah.VZOTH_HABERACHAH
-                                       else " ") if fmt == ""
-                else HEBREW_SEDRAH_NAMES[self]).format(**HEBREW_LETTERS)
+        return SEDRAH_NAMES[self] if fmt == "" else HEBREW_SEDRAH_NAMES[self]
+
+
+# Combined sedrahs (after VZOTH_HABERACHAH) are joined by hyphens.
+SEDRAH_NAMES = (None,) + tuple(
+    str(sedrah).replace("_", "-" if sedrah > Sedrah.VZOTH_HABERACHAH
+                        else " ")
+    for sedrah in Sedrah)
 
 
 RH_SAT_TABLE = (Sedrah.HAAZINU,           # Rosh Hashonah
@@ -507,6 +516,21 @@ FIRST_MOLAD = abs_time.AbsTime(0, Weekday.FRIDAY, 14)
 
 SIX_HOURS = abs_time.RelTime(0, 0, 6)
 
+# The omer is counted for 49 days from the 16th of Nissan. Since Nissan to
+# Ellul always have the same number of days, the first day of the omer is
+# always 162 days before Rosh Hashonah of the following year.
+OMER_DAYS = 49
+OMER_START_TO_ROSH_HASHONAH = 162
+
+OmerDay = namedtuple('OmerDay', ['civil', 'hebrew', 'count'])
+OmerDay.__doc__ = """A day of the omer.
+
+    civil:  The civil date (Date) of the day after the evening on which the
+            omer is counted
+    hebrew: The Hebrew date (Date)
+    count:  The day of the omer (1 to 49)
+"""
+
 
 class BadYearType(ValueError):
     """An exception class for an invalid Year Type"""
@@ -751,21 +775,15 @@ class HebrewYear(RegularYear):
 
     @classmethod
     def format_number(cls, value, places, fmt):
-        try:
-            return super().format_number(value, places, fmt, True)
-        except UnknownFlagError as exception:
-            if exception.flag == '~':
-                return to_letters(value)
-            raise exception
+        if split_escape(fmt)[0] == '~':
+            return to_letters(value)
+        return super().format_number(value, places, fmt, True)
 
     def format_short_year(self, fmt):
-        try:
-            return super().format_number(self.value % 100, 2, fmt, True)
-        except UnknownFlagError as exception:
-            if exception.flag == '~':
-                short_value = self.value % 1000
-                return to_letters(short_value) if short_value else ''
-            raise exception
+        if split_escape(fmt)[0] == '~':
+            short_value = self.value % 1000
+            return to_letters(short_value) if short_value else ''
+        return super().format_number(self.value % 100, 2, fmt, True)
 
     def sedrah(self, month, date, israel):
         """Returns the sedrah for the month and date in the current year.
@@ -831,3 +849,59 @@ class HebrewYear(RegularYear):
             return ((self.day_start(month, date) -
                      self.day_start(HebrewMonth.NISSAN, 15)) // DAY)
         return None
+
+    def omer_calendar(self, year_class=BritishYear):
+        """Return a list of the days of the omer in the current year.
+
+        The list comprises an OmerDay object for each of the 49 days. Civil
+        dates are in the calendar defined by year_class (a subclass of Year).
+        """
+        return list(_omer_days(self, (self + 1).start, year_class))
+
+
+def _omer_days(year, next_rosh_hashonah, year_class):
+    """A generator for the days of the omer in a Hebrew year.
+
+    Args:
+        year:               The Hebrew year (HebrewYear)
+        next_rosh_hashonah: The start of the following year (AbsTime)
+        year_class:         The subclass of Year for the civil dates
+
+    Yields:
+        An OmerDay object for each day of the omer.
+    """
+    day_start = next_rosh_hashonah - OMER_START_TO_ROSH_HASHONAH * DAY
+    # The civil date is the one containing the daytime of the Hebrew date.
+    civil = Date(year_class, day_start + SIX_HOURS)
+    month, date = HebrewMonth.NISSAN, 16
+    for count in range(1, OMER_DAYS + 1):
+        hebrew = Date(HebrewYear(year), month, date)
+        hebrew.day_start = day_start
+        civil_date = Date(year_class(civil.year), civil.month, civil.date)
+        civil_date.day_start = day_start + SIX_HOURS
+        yield OmerDay(civil_date, hebrew, count)
+        civil += 1
+        day_start += DAY
+        date += 1
+        if date > year.days_in_month(month):
+            month, date = month + 1, 1
+
+
+def iter_omer(start_year, stop_year, year_class=BritishYear):
+    """A generator for the days of the omer in a range of Hebrew years.
+
+    Args:
+        start_year: The first Hebrew year (integer)
+        stop_year:  The Hebrew year after the last year (integer)
+        year_class: The subclass of Year for the civil dates
+
+    Yields:
+        An OmerDay object for each day of the omer in each year.
+    """
+    if start_year >= stop_year:
+        return
+    next_year = HebrewYear(start_year)
+    for _ in range(start_year, stop_year):
+        year, next_year = next_year, next_year + 1
+        for omer_day in _omer_days(year, next_year.start, year_class):
+            yield omer_day
@@ -0,0 +1,224 @@
+"""This file contains class Holiday and class YearHolidays.
+
+YearHolidays holds one bit mask per Holiday for a Hebrew year. Bit n of a
+mask is set if the holiday falls on day n of the year (1st Tishri is day
+0). The masks depend only on the keviah of the year (the weekday of Rosh
+Hashonah and the number of days in the year) and on whether the year is
+for Israel or the Diaspora, so they are only calculated once for each
+combination.
+"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+from enum import IntEnum
+
+from future.builtins import range
+
+from .hebrew_letters import resolve_names
+from .hebrew_year import HebrewMonth
+from .weekday import DAYS_IN_WEEK, Weekday
+
+HEBREW_HOLIDAY_NAMES = resolve_names([
+    u"{YOD}{VAV}{FINAL_MEM} {TET}{VAV}{BET}",
+    u"{CHET}{VAV}{LAMED} {HE}{MEM}{VAV}{AYIN}{DALET}",
+    u"{TAV}{AYIN}{NUN}{YOD}{TAV}",
+    u"{RESH}{ALEF}{SHIN} {CHET}{VAV}{DALET}{SHIN}",
+    u"{SHIN}{BET}{TAV} {SHIN}{QOF}{LAMED}{YOD}{FINAL_MEM}",
+    u"{SHIN}{BET}{TAV} {ZAYIN}{KAF}{VAV}{RESH}",
+    u"{SHIN}{BET}{TAV} {PE}{RESH}{HE}",
+    u"{SHIN}{BET}{TAV} {HE}{CHET}{VAV}{DALET}{SHIN}"])
+
+
+class Holiday(IntEnum):
+    """An enumeration class for festivals and special days.
+
+    The value of each member is its bit number in a set of flags."""
+    YOM_TOV = 0
+    CHOL_HAMOED = 1
+    FAST_DAY = 2
+    ROSH_CHODESH = 3
+    SHABBAT_SHEKALIM = 4
+    SHABBAT_ZACHOR = 5
+    SHABBAT_PARAH = 6
+    SHABBAT_HACHODESH = 7
+
+    def __str__(self):
+        return self._name_.replace('_', ' ').title()
+
+    def __format__(self, fmt):
+        _, _, option = fmt.partition('#')
+        if option == "":
+            return HOLIDAY_NAMES[self]
+        return HEBREW_HOLIDAY_NAMES[self]
+
+
+HOLIDAY_NAMES = tuple(str(holiday) for holiday in Holiday)
+
+# As for HebrewYear.SIMCHAT_TORAH, the following tables are indexed by
+# israel (False for the Diaspora, True for Israel).
+YOM_TOV_DATES = (
+    ((HebrewMonth.TISHRI, 1), (HebrewMonth.TISHRI, 2),
+     (HebrewMonth.TISHRI, 10), (HebrewMonth.TISHRI, 15),
+     (HebrewMonth.TISHRI, 16), (HebrewMonth.TISHRI, 22),
+     (HebrewMonth.TISHRI, 23), (HebrewMonth.NISSAN, 15),
+     (HebrewMonth.NISSAN, 16), (HebrewMonth.NISSAN, 21),
+     (HebrewMonth.NISSAN, 22), (HebrewMonth.SIVAN, 6),
+     (HebrewMonth.SIVAN, 7)),
+    ((HebrewMonth.TISHRI, 1), (HebrewMonth.TISHRI, 2),
+     (HebrewMonth.TISHRI, 10), (HebrewMonth.TISHRI, 15),
+     (HebrewMonth.TISHRI, 22), (HebrewMonth.NISSAN, 15),
+     (HebrewMonth.NISSAN, 21), (HebrewMonth.SIVAN, 6)))
+
+CHOL_HAMOED_DATES = (
+    tuple((HebrewMonth.TISHRI, x) for x in range(17, 22)) +
+    tuple((HebrewMonth.NISSAN, x) for x in range(17, 21)),
+    tuple((HebrewMonth.TISHRI, x) for x in range(16, 22)) +
+    tuple((HebrewMonth.NISSAN, x) for x in range(16, 21)))
+
+# Fasts (other than Yom Kippur and Taanit Esther) falling on Shabbat are
+# postponed until Sunday.
+POSTPONED_FASTS = ((HebrewMonth.TISHRI, 3),   # Tzom Gedaliah
+                   (HebrewMonth.TAMMUZ, 17),
+                   (HebrewMonth.AV, 9))
+FIXED_FASTS = ((HebrewMonth.TISHRI, 10),      # Yom Kippur
+               (HebrewMonth.TEVETH, 10))
+TAANIT_ESTHER = 13  # Brought forward to Thursday if it falls on Shabbat.
+
+# Calculated masks, keyed by (weekday of Rosh Hashonah, days in year, israel)
+HOLIDAY_MASKS = {}
+
+
+def _holiday_masks(rh_day, offsets, israel):
+    """Calculate the masks for a keviah.
+
+    Args:
+        rh_day:  The weekday of Rosh Hashonah
+        offsets: The month offsets of the year (see Year.month_offsets)
+        israel:  True for Israel, False for the Diaspora
+
+    Returns:
+        A tuple of bit masks, indexed by Holiday.
+    """
+    def day(month, date):
+        """Return the day of the year for a month and date."""
+        return offsets[month] + date - 1
+
+    def weekday(day_of_year):
+        """Return the weekday of a day of the year."""
+        return (rh_day + day_of_year) % DAYS_IN_WEEK
+
+    def shabbat_on_or_before(day_of_year):
+        """Return the Shabbat on or before a day of the year."""
+        return day_of_year - (weekday(day_of_year) -
+                              Weekday.SATURDAY) % DAYS_IN_WEEK
+
+    def mask(days):
+        """Return a bit mask with a bit set for each day in days."""
+        result = 0
+        for day_of_year in days:
+            result |= 1 << day_of_year
+        return result
+
+    fasts = [day(*x) for x in FIXED_FASTS]
+    for month_date in POSTPONED_FASTS:
+        fast = day(*month_date)
+        fasts.append(fast + 1 if weekday(fast) == Weekday.SATURDAY
+                     else fast)
+
+    # Purim is in Adar Sheni in a leap year
+    adar = (HebrewMonth.ADAR_SHENI if HebrewMonth.ADAR_SHENI in offsets
+            else HebrewMonth.ADAR_RISHON)
+    fast = day(adar, TAANIT_ESTHER)
+    fasts.append(fast - 2 if weekday(fast) == Weekday.SATURDAY else fast)
+
+    # Rosh Hashonah is not Rosh Chodesh. For other months, the 30th of the
+    # previous month (if it exists) is also Rosh Chodesh.
+    rosh_chodesh = []
+    months = list(offsets.items())
+    for (_, previous), (_, offset) in zip(months, months[1:]):
+        rosh_chodesh.append(offset)
+        if offset - previous == 30:
+            rosh_chodesh.append(offset - 1)
+
+    # Shabbat Shekalim is on or before Rosh Chodesh Adar, Shabbat Zachor is
+    # before Purim and Shabbat Hachodesh is on or before Rosh Chodesh Nissan.
+    # Shabbat Parah is the week before Shabbat Hachodesh.
+    hachodesh = shabbat_on_or_before(day(HebrewMonth.NISSAN, 1))
+    return (mask(day(*x) for x in YOM_TOV_DATES[israel]),
+            mask(day(*x) for x in CHOL_HAMOED_DATES[israel]),
+            mask(fasts),
+            mask(rosh_chodesh),
+            mask([shabbat_on_or_before(day(adar, 1))]),
+            mask([shabbat_on_or_before(day(adar, TAANIT_ESTHER))]),
+            mask([hachodesh - DAYS_IN_WEEK]),
+            mask([hachodesh]))
+
+
+class YearHolidays(object):
+    """The festivals and special days of a Hebrew year.
+
+    Attributes:
+        year:   The Hebrew year (HebrewYear)
+        israel: True for Israel, False for the Diaspora
+        masks:  A tuple of bit masks, indexed by Holiday. Bit n of a mask is
+                set if the holiday falls on day n of the year.
+    """
+
+    def __init__(self, year, israel=False):
+        self.year = year
+        self.israel = bool(israel)
+        rh_day = year.start.days
+        offsets = year.month_offsets()
+        key = (rh_day, year.days_in_year(), self.israel)
+        masks = HOLIDAY_MASKS.get(key)
+        if masks is None:
+            masks = HOLIDAY_MASKS[key] = _holiday_masks(rh_day, offsets,
+                                                        self.israel)
+        self.masks = masks
+
+    def is_holiday(self, holiday, day_of_year):
+        """Return True if the holiday falls on the specified day of the year.
+        """
+        return bool(self.masks[holiday] >> day_of_year & 1)
+
+    def day_holidays(self, day_of_year):
+        """Return a list of the holidays falling on a day of the year."""
+        return [holiday for holiday in Holiday
+                if self.masks[holiday] >> day_of_year & 1]
+
+    def holidays(self, month, date):
+        """Return a list of the holidays falling on a month and date.
+
+        The month and date are validated (and adjusted) as for
+        HebrewYear.adjust_date."""
+        month, date = self.year.adjust_date(month, date)
+        return self.day_holidays(self.year.day_of_year(month, date))
+
+    def range_mask(self, holiday, start, stop):
+        """Return the bits of a mask for the days from start to stop.
+
+        Bit 0 of the result is for day start of the year. Days from stop
+        onwards are excluded."""
+        return self.masks[holiday] >> start & ((1 << (stop - start)) - 1)
+
+    def in_range(self, holiday, start, stop):
+        """Return a list of booleans for the days from start to stop.
+
+        Each boolean is True if the holiday falls on the corresponding day.
+        Days from stop onwards are excluded."""
+        bits = self.range_mask(holiday, start, stop)
+        return [bool(bits >> day & 1) for day in range(stop - start)]
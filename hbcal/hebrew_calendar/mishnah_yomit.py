@@ -0,0 +1,153 @@
+"""This file contains classes MishnahTractate and MishnahYomitCycle."""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+from .abs_time import AbsTime
+from .study_cycle import DateBeforeStudyCycle, StudyCycle
+from .tractates import TractateMonth
+
+# The tractates of the Mishnah, and the number of mishnayos in each chapter
+# of each tractate
+MISHNAH_CHAPTERS = (
+    ("BERACHOS", (5, 8, 6, 7, 5, 8, 5, 8, 5)),
+    ("PEAH", (6, 8, 8, 11, 8, 11, 8, 9)),
+    ("DEMAI", (4, 5, 6, 7, 11, 12, 8)),
+    ("KILAYIM", (9, 11, 7, 9, 8, 9, 8, 6, 10)),
+    ("SHEVIIS", (8, 10, 10, 10, 9, 6, 7, 11, 9, 9)),
+    ("TERUMOS", (10, 6, 9, 13, 9, 6, 7, 12, 7, 12, 10)),
+    ("MAASROS", (8, 10, 10, 6, 8)),
+    ("MAASER_SHENI", (7, 10, 13, 12, 15)),
+    ("CHALLAH", (9, 8, 10, 11)),
+    ("ORLAH", (9, 17, 9)),
+    ("BIKKURIM", (11, 11, 12, 5)),
+    ("SHABBOS", (11, 7, 6, 2, 4, 10, 4, 7, 7, 6, 6, 6, 7, 4, 3, 8, 8, 3, 6, 5,
+                 3, 6, 5, 5)),
+    ("ERUVIN", (10, 6, 9, 11, 9, 10, 11, 11, 4, 15)),
+    ("PESACHIM", (7, 8, 8, 9, 10, 6, 13, 8, 11, 9)),
+    ("SHEKALIM", (7, 5, 4, 9, 6, 6, 7, 8)),
+    ("YOMA", (8, 7, 11, 6, 7, 8, 5, 9)),
+    ("SUCCAH", (11, 9, 15, 10, 8)),
+    ("BEITZAH", (10, 10, 8, 7, 7)),
+    ("ROSH_HASHANAH", (9, 8, 9, 9)),
+    ("TAANIS", (7, 10, 9, 8)),
+    ("MEGILAH", (11, 6, 6, 10)),
+    ("MOED_KATAN", (10, 5, 9)),
+    ("CHAGIGAH", (8, 7, 8)),
+    ("YEVAMOS", (4, 10, 10, 13, 6, 6, 6, 6, 6, 9, 7, 6, 13, 9, 10, 7)),
+    ("KESUVOS", (10, 10, 9, 12, 9, 7, 10, 8, 9, 6, 6, 4, 11)),
+    ("NEDARIM", (4, 5, 11, 8, 6, 10, 9, 7, 10, 8, 12)),
+    ("NAZIR", (7, 10, 7, 7, 7, 11, 4, 2, 5)),
+    ("SOTAH", (9, 6, 8, 5, 5, 4, 8, 7, 15)),
+    ("GITIN", (6, 7, 8, 9, 9, 7, 9, 10, 10)),
+    ("KIDDUSHIN", (10, 10, 13, 14)),
+    ("BAVA_KAMA", (4, 6, 11, 9, 7, 6, 7, 7, 12, 10)),
+    ("BAVA_METZIA", (8, 11, 12, 12, 11, 8, 11, 9, 13, 6)),
+    ("BAVA_BASRA", (6, 14, 8, 9, 11, 8, 4, 8, 10, 8)),
+    ("SANHEDRIN", (6, 5, 8, 5, 5, 6, 11, 7, 6, 6, 6)),
+    ("MAKKOS", (10, 8, 16)),
+    ("SHEVUOS", (7, 5, 11, 13, 5, 7, 8, 6)),
+    ("EDUYOS", (14, 10, 12, 12, 7, 3, 9, 7)),
+    ("AVODA_ZARAH", (9, 7, 10, 12, 12)),
+    ("AVOS", (18, 16, 18, 22, 23, 11)),
+    ("HORAYOS", (5, 7, 8)),
+    ("ZEVACHIM", (4, 5, 6, 6, 8, 7, 6, 12, 7, 8, 8, 6, 8, 10)),
+    ("MENACHOS", (4, 5, 7, 5, 9, 7, 6, 7, 9, 9, 9, 5, 11)),
+    ("CHULIN", (7, 10, 7, 7, 5, 7, 6, 6, 8, 4, 2, 5)),
+    ("BECHOROS", (7, 9, 4, 10, 6, 12, 7, 10, 8)),
+    ("ERCHIN", (4, 6, 5, 4, 6, 5, 5, 7, 8)),
+    ("TEMURAH", (6, 3, 5, 4, 6, 5, 6)),
+    ("KERISUS", (7, 4, 10, 3, 8, 9)),
+    ("MEILAH", (4, 9, 8, 6, 5, 6)),
+    ("TAMID", (4, 5, 9, 3, 6, 3, 4)),
+    ("MIDDOS", (9, 6, 8, 7, 4)),
+    ("KINNIM", (4, 5, 6)),
+    ("KEILIM", (9, 8, 8, 4, 11, 4, 6, 11, 8, 8, 9, 8, 8, 8, 6, 8, 17, 9, 10, 7,
+                3, 10, 5, 17, 9, 9, 12, 10, 8, 4)),
+    ("OHALOS", (8, 7, 7, 3, 7, 7, 6, 6, 16, 7, 9, 8, 6, 7, 10, 5, 5, 10)),
+    ("NEGAIM", (6, 5, 8, 11, 5, 8, 5, 10, 3, 10, 12, 7, 12, 13)),
+    ("PARAH", (4, 5, 11, 4, 9, 5, 12, 11, 9, 6, 9, 11)),
+    ("TAHAROS", (9, 8, 8, 13, 9, 10, 9, 9, 9, 8)),
+    ("MIKVAOS", (8, 10, 4, 5, 6, 11, 7, 5, 7, 8)),
+    ("NIDAH", (7, 7, 7, 7, 9, 14, 5, 4, 11, 8)),
+    ("MACHSHIRIN", (6, 11, 8, 10, 11, 8)),
+    ("ZAVIM", (6, 4, 3, 7, 12)),
+    ("TEVUL_YOM", (5, 8, 6, 7)),
+    ("YADAYIM", (5, 4, 5, 8)),
+    ("UKTZIN", (6, 10, 12)))
+
+# An enumeration class of tractates of the Mishnah
+MishnahTractate = TractateMonth(
+    'MishnahTractate', [name for name, _ in MISHNAH_CHAPTERS],
+    module=__name__)
+
+# The number of mishnayos in each chapter, indexed by tractate
+MISHNAYOS = (None,) + tuple(chapters for _, chapters in MISHNAH_CHAPTERS)
+
+
+def chapter_and_mishnah(tractate, mishnah):
+    """Return the chapter and the number (in the chapter) of a mishnah.
+
+    Args:
+        tractate:   The tractate (MishnahTractate)
+        mishnah:    The number of the mishnah in the tractate (1 for the
+                    first mishnah of the tractate)
+    """
+    chapter = 1
+    for count in MISHNAYOS[tractate]:
+        if mishnah <= count:
+            break
+        mishnah -= count
+        chapter += 1
+    return chapter, mishnah
+
+
+class DateBeforeMishnahYomit(DateBeforeStudyCycle):
+    """An exception class for dates before the first Mishnah Yomit cycle."""
+
+
+class MishnahYomitCycle(StudyCycle):
+    """Subclass of StudyCycle for the Mishnah Yomit calendar.
+
+    Two mishnayos are studied each day. A cycle of Mishnah Yomit is
+    considered equivalent to a year and a tractate to a month. The date of
+    a day is its number among the days whose mishnayos start in the
+    tractate."""
+
+    # The first cycle started on 1st Sivan 5707.
+    START_FIRST_YEAR = AbsTime(297711, 2, 6, 0)
+    # The number of mishnayos in each tractate
+    PAGES = (None,) + tuple(sum(x) for x in MISHNAYOS[1:])
+    PAGES_PER_DAY = 2
+    BEFORE_FIRST_CYCLE = DateBeforeMishnahYomit
+
+    @classmethod
+    def month_class(cls):
+        return MishnahTractate
+
+    def format_pages(self, tractate, first, last, fmt):
+        """ Return the first and last mishnayos of a tractate studied on a
+        day, as chapter:mishnah (e.g. 1:1-2 or 1:5-2:1) """
+        first_chapter, first = chapter_and_mishnah(tractate, first)
+        last_chapter, last = chapter_and_mishnah(tractate, last)
+        result = u"{0}:{1}".format(self.format_number(first_chapter, 1, fmt),
+                                   self.format_number(first, 1, fmt))
+        if last_chapter != first_chapter:
+            result += u"-{0}:{1}".format(
+                self.format_number(last_chapter, 1, fmt),
+                self.format_number(last, 1, fmt))
+        elif last != first:
+            result += u"-" + self.format_number(last, 1, fmt)
+        return result
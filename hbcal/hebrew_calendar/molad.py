@@ -0,0 +1,102 @@
+"""This module contains a generator for successive molads.
+
+Exports:
+    Molad
+    iter_molads
+    KIDDUSH_LEVANA_EARLIEST
+    KIDDUSH_LEVANA_LATEST
+"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import namedtuple
+
+from .abs_time import AbsTime, RelTime
+from .civil_year import BritishYear
+from .date import DateTime
+from .hebrew_year import HebrewYear, LUNAR_CYCLE
+
+# Kiddush Levana may be said from 3 days after the molad (Rabbenu Yonah,
+# quoted by Beis Yosef OC 426). Some wait 7 days (Shulchan Aruch OC 426:4).
+KIDDUSH_LEVANA_EARLIEST = RelTime(0, 3)
+
+# Kiddush Levana may be said until half a lunar cycle after the molad
+# (Shulchan Aruch OC 426:3). Odd chalakim are rounded down.
+KIDDUSH_LEVANA_LATEST = LUNAR_CYCLE // 2
+
+Molad = namedtuple('Molad', ['year', 'month', 'hebrew', 'civil',
+                             'earliest', 'latest'])
+Molad.__doc__ = """The molad of a Hebrew month.
+
+    year:       The Hebrew year (an integer)
+    month:      The Hebrew month (HebrewMonth)
+    hebrew:     The molad (DateTime with a HebrewYear, time in chalakim)
+    civil:      The molad (DateTime for the civil calendar)
+    earliest:   The earliest time for Kiddush Levana (civil DateTime)
+    latest:     The latest time for Kiddush Levana (civil DateTime)
+"""
+
+
+def iter_molads(start, stop, year_class=BritishYear, columns=False,
+                earliest=KIDDUSH_LEVANA_EARLIEST):
+    """A generator for the molads of all months in a range of Hebrew years.
+
+    The molads are calculated by repeatedly adding the lunar cycle to the
+    molad of Tishri of the first year. Only one HebrewYear object is
+    created (to determine the number of months in each year).
+
+    Args:
+        start:      The first Hebrew year (integer)
+        stop:       The Hebrew year after the last year (integer)
+        year_class: The subclass of Year used for civil times
+        columns:    If true, yield tuples of integers instead of Molad
+                    objects (see below)
+        earliest:   The time (RelTime) after the molad from which Kiddush
+                    Levana may be said
+
+    Yields:
+        If columns is false, a Molad object for each month.
+        If columns is true, a tuple comprising:
+            the Hebrew year
+            the month number
+            the molad
+            the earliest time for Kiddush Levana
+            the latest time for Kiddush Levana
+        All times are in chalakim since the start of the first day of
+        creation. This is intended for export, and does not require any
+        date conversions.
+    """
+    if start >= stop:
+        return
+    year = HebrewYear(start)
+    chalakim = (year.molad() - AbsTime()).chalakim
+    for value in range(start, stop):
+        for month in year.months():
+            if columns:
+                yield (value, month.value, chalakim,
+                       chalakim + earliest.chalakim,
+                       chalakim + KIDDUSH_LEVANA_LATEST.chalakim)
+            else:
+                molad = AbsTime(chalakim=chalakim)
+                yield Molad(value, month,
+                            DateTime(HebrewYear, molad),
+                            DateTime(year_class, molad),
+                            DateTime(year_class, molad + earliest),
+                            DateTime(year_class,
+                                     molad + KIDDUSH_LEVANA_LATEST))
+            chalakim += LUNAR_CYCLE.chalakim
+        year += 1
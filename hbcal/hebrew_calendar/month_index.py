@@ -0,0 +1,100 @@
+"""This module contains queries on the starts of months.
+
+The queries use the month offsets of each year (Year.month_offsets), so they
+do not step through the days of a month. They can be used with any subclass
+of Year. For study cycles (such as DafYomiCycle), the months are units
+(such as tractates).
+
+Exports:
+    next_month_start
+    previous_month_start
+    month_bounds
+    iter_month_starts
+"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+from future.builtins import range
+
+from .date import Date
+
+
+def _month_start(year, month):
+    """Return the first day (Date) of a month.
+
+    The year (an instance of a subclass of Year) is copied."""
+    return Date(year.__class__(year), month, year.first_day())
+
+
+def _months(year):
+    """Return a list of the months of a year."""
+    return list(year.month_offsets())
+
+
+def next_month_start(date):
+    """Return the first day (Date) of the month after the month of date."""
+    months = _months(date.year)
+    index = months.index(date.month) + 1
+    if index < len(months):
+        return _month_start(date.year, months[index])
+    year = date.year + 1
+    return _month_start(year, _months(year)[0])
+
+
+def previous_month_start(date):
+    """Return the latest first day of a month (Date) before date.
+
+    If date is the first day of a month, this is the first day of the
+    previous month. Otherwise, it is the first day of the month of date."""
+    months = _months(date.year)
+    index = months.index(date.month)
+    if date.date == date.year.first_day():
+        index -= 1
+    if index >= 0:
+        return _month_start(date.year, months[index])
+    year = date.year - 1
+    return _month_start(year, _months(year)[-1])
+
+
+def month_bounds(date):
+    """Return the bounds of the month of date.
+
+    Returns:
+        A tuple comprising the first day (Date) of the month of date and the
+        first day of the following month.
+    """
+    return (_month_start(date.year, date.month), next_month_start(date))
+
+
+def iter_month_starts(year_class, start, stop):
+    """A generator for the first days of the months in a range of years.
+
+    Args:
+        year_class: The subclass of Year
+        start:      The first year (integer)
+        stop:       The year after the last year (integer)
+
+    Yields:
+        A Date for the first day of each month.
+    """
+    if start >= stop:
+        return
+    year = year_class(start)
+    for _ in range(start, stop):
+        for month in _months(year):
+            yield _month_start(year, month)
+        year += 1
@@ -0,0 +1,248 @@
+"""This file contains classes RambamSection and RambamCycle."""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+from .abs_time import AbsTime
+from .hebrew_letters import resolve_names
+from .study_cycle import DateBeforeStudyCycle, StudyCycle, StudyUnit
+
+
+HEBREW_RAMBAM_NAMES = resolve_names([
+    None,
+    u"{HE}{QOF}{DALET}{MEM}{HE}",
+    u"{MEM}{TZADE}{VAV}{VAV}{TAV} {AYIN}{SHIN}{HE}",
+    u"{MEM}{TZADE}{VAV}{VAV}{TAV} {LAMED}{ALEF} {TAV}{AYIN}{SHIN}{HE}",
+    u"{TAV}{VAV}{KAF}{FINAL_NUN} {HE}{CHET}{YOD}{BET}{VAV}{RESH}",
+    u"{YOD}{SAMECH}{VAV}{DALET}{YOD} {HE}{TAV}{VAV}{RESH}{HE}",
+    u"{DALET}{AYIN}{VAV}{TAV}",
+    u"{TAV}{LAMED}{MEM}{VAV}{DALET} {TAV}{VAV}{RESH}{HE}",
+    u"{AYIN}{BET}{VAV}{DALET}{HE} {ZAYIN}{RESH}{HE}",
+    u"{TAV}{SHIN}{VAV}{BET}{HE}",
+    u"{QOF}{RESH}{YOD}{ALEF}{TAV} {SHIN}{MEM}{AYIN}",
+    u"{TAV}{PE}{YOD}{LAMED}{HE}",
+    u"{TAV}{PE}{YOD}{LAMED}{YOD}{FINAL_NUN}",
+    u"{TZADE}{YOD}{TZADE}{YOD}{TAV}",
+    u"{BET}{RESH}{KAF}{VAV}{TAV}",
+    u"{MEM}{YOD}{LAMED}{HE}",
+    u"{SHIN}{BET}{TAV}",
+    u"{AYIN}{YOD}{RESH}{VAV}{BET}{YOD}{FINAL_NUN}",
+    u"{SHIN}{BET}{YOD}{TAV}{TAV} {AYIN}{SHIN}{VAV}{RESH}",
+    u"{SHIN}{BET}{YOD}{TAV}{TAV} {YOD}{VAV}{FINAL_MEM} {TET}{VAV}{BET}",
+    u"{CHET}{MEM}{FINAL_TZADE} {VAV}{MEM}{TZADE}{HE}",
+    u"{SHIN}{VAV}{PE}{RESH} {VAV}{SAMECH}{VAV}{KAF}{HE} "
+    u"{VAV}{LAMED}{VAV}{LAMED}{BET}",
+    u"{SHIN}{QOF}{LAMED}{YOD}{FINAL_MEM}",
+    u"{QOF}{YOD}{DALET}{VAV}{SHIN} {HE}{CHET}{VAV}{DALET}{SHIN}",
+    u"{TAV}{AYIN}{NUN}{YOD}{VAV}{TAV}",
+    u"{MEM}{GIMEL}{YOD}{LAMED}{HE} {VAV}{CHET}{NUN}{VAV}{KAF}{HE}",
+    u"{ALEF}{YOD}{SHIN}{VAV}{TAV}",
+    u"{GIMEL}{YOD}{RESH}{VAV}{SHIN}{YOD}{FINAL_NUN}",
+    u"{YOD}{BET}{VAV}{FINAL_MEM} {VAV}{CHET}{LAMED}{YOD}{TZADE}{HE}",
+    u"{NUN}{AYIN}{RESH}{HE} {BET}{TAV}{VAV}{LAMED}{HE}",
+    u"{SAMECH}{VAV}{TET}{HE}",
+    u"{ALEF}{YOD}{SAMECH}{VAV}{RESH}{YOD} {BET}{YOD}{ALEF}{HE}",
+    u"{MEM}{ALEF}{KAF}{LAMED}{VAV}{TAV} {ALEF}{SAMECH}{VAV}{RESH}{VAV}{TAV}",
+    u"{SHIN}{CHET}{YOD}{TET}{HE}",
+    u"{SHIN}{BET}{VAV}{AYIN}{VAV}{TAV}",
+    u"{NUN}{DALET}{RESH}{YOD}{FINAL_MEM}",
+    u"{NUN}{ZAYIN}{YOD}{RESH}{VAV}{TAV}",
+    u"{AYIN}{RESH}{KAF}{YOD}{FINAL_NUN} "
+    u"{VAV}{CHET}{RESH}{MEM}{YOD}{FINAL_NUN}",
+    u"{KAF}{LAMED}{ALEF}{YOD}{FINAL_MEM}",
+    u"{MEM}{TAV}{NUN}{VAV}{TAV} {AYIN}{NUN}{YOD}{YOD}{FINAL_MEM}",
+    u"{TAV}{RESH}{VAV}{MEM}{VAV}{TAV}",
+    u"{MEM}{AYIN}{SHIN}{RESH}",
+    u"{MEM}{AYIN}{SHIN}{RESH} {SHIN}{NUN}{YOD}",
+    u"{BET}{YOD}{KAF}{VAV}{RESH}{YOD}{FINAL_MEM}",
+    u"{SHIN}{MEM}{YOD}{TET}{HE} {VAV}{YOD}{VAV}{BET}{LAMED}",
+    u"{BET}{YOD}{TAV} {HE}{BET}{CHET}{YOD}{RESH}{HE}",
+    u"{KAF}{LAMED}{YOD} {HE}{MEM}{QOF}{DALET}{SHIN}",
+    u"{BET}{YOD}{ALEF}{TAV} {HE}{MEM}{QOF}{DALET}{SHIN}",
+    u"{ALEF}{YOD}{SAMECH}{VAV}{RESH}{YOD} {MEM}{ZAYIN}{BET}{CHET}",
+    u"{MEM}{AYIN}{SHIN}{HE} {HE}{QOF}{RESH}{BET}{NUN}{VAV}{TAV}",
+    u"{TAV}{MEM}{YOD}{DALET}{YOD}{FINAL_NUN} "
+    u"{VAV}{MEM}{VAV}{SAMECH}{PE}{YOD}{FINAL_NUN}",
+    u"{PE}{SAMECH}{VAV}{LAMED}{YOD} "
+    u"{HE}{MEM}{VAV}{QOF}{DALET}{SHIN}{YOD}{FINAL_NUN}",
+    u"{AYIN}{BET}{VAV}{DALET}{TAV} {YOD}{VAV}{FINAL_MEM} "
+    u"{HE}{KAF}{PE}{VAV}{RESH}{YOD}{FINAL_MEM}",
+    u"{MEM}{AYIN}{YOD}{LAMED}{HE}",
+    u"{QOF}{RESH}{BET}{FINAL_NUN} {PE}{SAMECH}{CHET}",
+    u"{CHET}{GIMEL}{YOD}{GIMEL}{HE}",
+    u"{BET}{KAF}{VAV}{RESH}{VAV}{TAV}",
+    u"{SHIN}{GIMEL}{GIMEL}{VAV}{TAV}",
+    u"{MEM}{CHET}{VAV}{SAMECH}{RESH}{YOD} {KAF}{PE}{RESH}{HE}",
+    u"{TAV}{MEM}{VAV}{RESH}{HE}",
+    u"{TET}{VAV}{MEM}{ALEF}{TAV} {MEM}{TAV}",
+    u"{PE}{RESH}{HE} {ALEF}{DALET}{VAV}{MEM}{HE}",
+    u"{TET}{VAV}{MEM}{ALEF}{TAV} {TZADE}{RESH}{AYIN}{TAV}",
+    u"{MEM}{TET}{MEM}{ALEF}{YOD} {MEM}{SHIN}{KAF}{BET} "
+    u"{VAV}{MEM}{VAV}{SHIN}{BET}",
+    u"{SHIN}{ALEF}{RESH} {ALEF}{BET}{VAV}{TAV} "
+    u"{HE}{TET}{VAV}{MEM}{ALEF}{VAV}{TAV}",
+    u"{TET}{VAV}{MEM}{ALEF}{TAV} {ALEF}{VAV}{KAF}{LAMED}{YOD}{FINAL_NUN}",
+    u"{KAF}{LAMED}{YOD}{FINAL_MEM}",
+    u"{MEM}{QOF}{VAV}{ALEF}{VAV}{TAV}",
+    u"{NUN}{ZAYIN}{QOF}{YOD} {MEM}{MEM}{VAV}{FINAL_NUN}",
+    u"{GIMEL}{NUN}{YOD}{BET}{HE}",
+    u"{GIMEL}{ZAYIN}{YOD}{LAMED}{HE} {VAV}{ALEF}{BET}{YOD}{DALET}{HE}",
+    u"{CHET}{VAV}{BET}{LAMED} {VAV}{MEM}{ZAYIN}{YOD}{QOF}",
+    u"{RESH}{VAV}{TZADE}{CHET} {VAV}{SHIN}{MEM}{YOD}{RESH}{TAV} "
+    u"{NUN}{PE}{SHIN}",
+    u"{MEM}{KAF}{YOD}{RESH}{HE}",
+    u"{ZAYIN}{KAF}{YOD}{YOD}{HE} {VAV}{MEM}{TAV}{NUN}{HE}",
+    u"{SHIN}{KAF}{NUN}{YOD}{FINAL_MEM}",
+    u"{SHIN}{LAMED}{VAV}{CHET}{YOD}{FINAL_NUN} "
+    u"{VAV}{SHIN}{VAV}{TAV}{PE}{YOD}{FINAL_NUN}",
+    u"{AYIN}{BET}{DALET}{YOD}{FINAL_MEM}",
+    u"{SHIN}{KAF}{YOD}{RESH}{VAV}{TAV}",
+    u"{SHIN}{ALEF}{LAMED}{HE} {VAV}{PE}{QOF}{DALET}{VAV}{FINAL_NUN}",
+    u"{MEM}{LAMED}{VAV}{HE} {VAV}{LAMED}{VAV}{HE}",
+    u"{TET}{VAV}{AYIN}{FINAL_NUN} {VAV}{NUN}{TET}{AYIN}{FINAL_NUN}",
+    u"{NUN}{CHET}{LAMED}{VAV}{TAV}",
+    u"{SAMECH}{NUN}{HE}{DALET}{RESH}{YOD}{FINAL_NUN}",
+    u"{AYIN}{DALET}{VAV}{TAV}",
+    u"{MEM}{MEM}{RESH}{YOD}{FINAL_MEM}",
+    u"{ALEF}{BET}{LAMED}",
+    u"{MEM}{LAMED}{KAF}{YOD}{FINAL_MEM}"])
+
+
+class RambamSection(StudyUnit):
+    """An enumeration class of the sections (hilchos) of the Mishneh Torah,
+    preceded by the parts of its introduction"""
+    HAKDAMAH = 1
+    MITZVOS_ASEH = 2
+    MITZVOS_LO_SAASEH = 3
+    TOCHEN_HACHIBUR = 4
+    YESODEI_HATORAH = 5
+    DEOS = 6
+    TALMUD_TORAH = 7
+    AVODA_ZARAH = 8
+    TESHUVAH = 9
+    KERIAS_SHEMA = 10
+    TEFILLAH = 11
+    TEFILLIN = 12
+    TZITZIS = 13
+    BERACHOS = 14
+    MILAH = 15
+    SHABBOS = 16
+    ERUVIN = 17
+    SHEVISAS_ASOR = 18
+    SHEVISAS_YOM_TOV = 19
+    CHAMETZ_UMATZAH = 20
+    SHOFAR_SUCCAH_VELULAV = 21
+    SHEKALIM = 22
+    KIDDUSH_HACHODESH = 23
+    TAANIYOS = 24
+    MEGILAH_VACHANUKAH = 25
+    ISHUS = 26
+    GERUSHIN = 27
+    YIBUM_VACHALITZAH = 28
+    NAARAH_BESULAH = 29
+    SOTAH = 30
+    ISSUREI_BIAH = 31
+    MAACHALOS_ASUROS = 32
+    SHECHITAH = 33
+    SHEVUOS = 34
+    NEDARIM = 35
+    NEZIRUS = 36
+    ARACHIN_VACHARAMIN = 37
+    KILAYIM = 38
+    MATNOS_ANIYIM = 39
+    TERUMOS = 40
+    MAASER = 41
+    MAASER_SHENI = 42
+    BIKKURIM = 43
+    SHEMITTAH_VEYOVEL = 44
+    BEIS_HABECHIRAH = 45
+    KLEI_HAMIKDASH = 46
+    BIAS_HAMIKDASH = 47
+    ISSUREI_MIZBEACH = 48
+    MAASEH_HAKORBANOS = 49
+    TEMIDIN_UMUSAFIN = 50
+    PESULEI_HAMUKDASHIN = 51
+    AVODAS_YOM_HAKIPPURIM = 52
+    MEILAH = 53
+    KORBAN_PESACH = 54
+    CHAGIGAH = 55
+    BECHOROS = 56
+    SHEGAGOS = 57
+    MECHUSREI_KAPPARAH = 58
+    TEMURAH = 59
+    TUMAS_MES = 60
+    PARAH_ADUMAH = 61
+    TUMAS_TZARAAS = 62
+    METAMEI_MISHKAV_UMOSHAV = 63
+    SHEAR_AVOS_HATUMAH = 64
+    TUMAS_OCHALIN = 65
+    KEILIM = 66
+    MIKVAOS = 67
+    NIZKEI_MAMON = 68
+    GENEIVAH = 69
+    GEZEILAH_VAAVEIDAH = 70
+    CHOVEL_UMAZIK = 71
+    ROTZEACH_USHEMIRAS_NEFESH = 72
+    MECHIRAH = 73
+    ZECHIYAH_UMATANAH = 74
+    SHECHENIM = 75
+    SHELUCHIN_VESHUTAFIN = 76
+    AVADIM = 77
+    SECHIRUS = 78
+    SHEELAH_UFIKADON = 79
+    MALVEH_VELOVEH = 80
+    TOEN_VENITAN = 81
+    NACHALOS = 82
+    SANHEDRIN = 83
+    EDUS = 84
+    MAMRIM = 85
+    AVEIL = 86
+    MELACHIM = 87
+
+    def __format__(self, fmt):
+        _, _, option = fmt.partition('#')
+        if option == "":
+            return self.name()
+        return HEBREW_RAMBAM_NAMES[self]
+
+
+class DateBeforeRambamYomi(DateBeforeStudyCycle):
+    """An exception class for dates before the first Rambam Yomi cycle."""
+
+
+class RambamCycle(StudyCycle):
+    """Subclass of StudyCycle for the Rambam Yomi calendar (three chapters a
+    day).
+
+    A cycle of Rambam Yomi is considered equivalent to a year and a section
+    to a month. The date of a day is its number among the days whose
+    chapters start in the section."""
+
+    # The first cycle started on 27th Nissan 5744.
+    START_FIRST_YEAR = AbsTime(299639, 0, 6, 0)
+    # The number of chapters in each section. The introduction, the
+    # positive and negative commandments and the table of contents count
+    # as 17 chapters.
+    PAGES = (None, 4, 5, 5, 3, 10, 7, 7, 12, 10, 4, 15, 10, 3, 11, 3, 30, 8,
+             3, 8, 8, 8, 4, 19, 5, 4, 25, 13, 8, 3, 4, 22, 17, 14, 12, 13, 10,
+             8, 10, 10, 15, 14, 11, 12, 13, 8, 10, 9, 7, 19, 10, 19, 5, 8, 10,
+             3, 8, 15, 5, 4, 25, 15, 16, 13, 20, 16, 28, 11, 14, 9, 18, 8, 13,
+             30, 12, 14, 10, 9, 13, 8, 27, 16, 11, 26, 22, 7, 14, 12)
+    PAGES_PER_DAY = 3
+    BEFORE_FIRST_CYCLE = DateBeforeRambamYomi
+
+    @classmethod
+    def month_class(cls):
+        return RambamSection
@@ -0,0 +1,207 @@
+"""This module contains rules for events that recur in the Hebrew calendar.
+
+Each rule calculates the days of a Hebrew year on which it occurs directly
+from the month offsets of the year and the weekday of Rosh Hashonah, without
+examining every day of the year. Rules are expanded lazily, one year at a
+time, so open-ended rules are cheap.
+
+Exports:
+    Occurrence
+    Rule
+    MonthDay
+    HolidayRule
+    RoshChodesh
+    NthWeekday
+    WeekdayBefore
+    WeekdayAfter
+"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+from abc import ABCMeta, abstractmethod
+from collections import namedtuple
+
+from future.builtins import super
+from future.utils import with_metaclass
+
+from .abs_time import RelTime
+from .civil_year import BritishYear
+from .date import Date
+from .hebrew_year import HebrewYear, SIX_HOURS
+from .holidays import Holiday, YearHolidays
+from .weekday import DAYS_IN_WEEK
+
+Occurrence = namedtuple('Occurrence', ['hebrew', 'civil'])
+Occurrence.__doc__ = """An occurrence of a recurring event.
+
+    hebrew: The Hebrew date (Date)
+    civil:  The civil date (Date) containing the daytime of the Hebrew date
+"""
+
+
+class Rule(with_metaclass(ABCMeta, object)):
+    """Abstract base class for recurrence rules."""
+
+    @abstractmethod
+    def days(self, year):
+        """Return a sorted list of the days on which the rule occurs.
+
+        Args:
+            year:   The Hebrew year (HebrewYear)
+
+        Returns:
+            A list of days of the year (1st Tishri is day 0). Rules relative
+            to another rule may return days before the start or after the end
+            of the year.
+        """
+        raise NotImplementedError
+
+    def expand(self, start, stop=None, year_class=BritishYear):
+        """A generator for the occurrences of the rule.
+
+        Args:
+            start:      The first Hebrew year (integer)
+            stop:       The Hebrew year after the last year (integer), or
+                        None for no limit
+            year_class: The subclass of Year for the civil dates
+
+        Yields:
+            An Occurrence object for each occurrence.
+        """
+        year = HebrewYear(start)
+        while stop is None or year.value < stop:
+            for day in self.days(year):
+                day_start = year.start + RelTime(0, day)
+                if 0 <= day < year.days_in_year():
+                    month, date = year.month_and_date(day)
+                    hebrew = Date(HebrewYear(year), month, date)
+                else:
+                    hebrew = Date(HebrewYear, day_start)
+                hebrew.day_start = day_start
+                yield Occurrence(hebrew,
+                                 Date(year_class, day_start + SIX_HOURS))
+            year += 1
+
+
+def _weekday(year, day):
+    """Return the weekday of a day of a Hebrew year."""
+    return (year.start.days + day) % DAYS_IN_WEEK
+
+
+class MonthDay(Rule):
+    """A fixed month and date every year, e.g. 10th Teveth.
+
+    The month and date are adjusted for each year as for
+    HebrewYear.adjust_date (so Adar Sheni is Adar in a regular year, and
+    30th Cheshvan is 1st Kislev if Cheshvan has 29 days)."""
+
+    def __init__(self, month, date):
+        self.month = month
+        self.date = date
+
+    def days(self, year):
+        return [year.day_of_year(*year.adjust_date(self.month, self.date))]
+
+
+class HolidayRule(Rule):
+    """Every day on which a Holiday falls."""
+
+    def __init__(self, holiday, israel=False):
+        self.holiday = holiday
+        self.israel = israel
+
+    def days(self, year):
+        mask = YearHolidays(year, self.israel).masks[self.holiday]
+        days = []
+        while mask:
+            lowest = mask & -mask
+            days.append(lowest.bit_length() - 1)
+            mask ^= lowest
+        return days
+
+
+class RoshChodesh(HolidayRule):
+    """Every day of Rosh Chodesh (one or two days each month, other than
+    Tishri)."""
+
+    def __init__(self):
+        super().__init__(Holiday.ROSH_CHODESH)
+
+
+class NthWeekday(Rule):
+    """The nth occurrence of a weekday in a month, e.g. the last Thursday of
+    Adar.
+
+    n is 1 for the first occurrence, 2 for the second, etc. or -1 for the
+    last occurrence, -2 for the one before, etc. Years in which the month
+    does not have an nth occurrence are skipped. Adar Sheni is Adar in a
+    regular year."""
+
+    def __init__(self, month, weekday, n=1):
+        if n == 0:
+            raise ValueError("n must not be 0")
+        self.month = month
+        self.weekday = weekday
+        self.n = n
+
+    def days(self, year):
+        month, _ = year.adjust_date(self.month, year.first_day())
+        first = year.day_of_year(month, year.first_day())
+        last = first + year.days_in_month(month) - 1
+        if self.n > 0:
+            day = (first + (self.weekday - _weekday(year, first)) %
+                   DAYS_IN_WEEK + (self.n - 1) * DAYS_IN_WEEK)
+        else:
+            day = (last - (_weekday(year, last) - self.weekday) %
+                   DAYS_IN_WEEK + (self.n + 1) * DAYS_IN_WEEK)
+        return [day] if first <= day <= last else []
+
+
+class WeekdayBefore(Rule):
+    """A weekday before each occurrence of another rule, e.g. the Shabbat
+    before 15th Av.
+
+    If inclusive is true, an occurrence of the other rule on the weekday
+    itself is included."""
+
+    def __init__(self, rule, weekday, inclusive=False):
+        self.rule = rule
+        self.weekday = weekday
+        self.inclusive = bool(inclusive)
+
+    def days(self, year):
+        return [day - ((_weekday(year, day) - self.weekday - 1 +
+                        self.inclusive) % DAYS_IN_WEEK + 1 - self.inclusive)
+                for day in self.rule.days(year)]
+
+
+class WeekdayAfter(Rule):
+    """A weekday after each occurrence of another rule, e.g. the Sunday
+    after 9th Av.
+
+    If inclusive is true, an occurrence of the other rule on the weekday
+    itself is included."""
+
+    def __init__(self, rule, weekday, inclusive=False):
+        self.rule = rule
+        self.weekday = weekday
+        self.inclusive = bool(inclusive)
+
+    def days(self, year):
+        return [day + ((self.weekday - _weekday(year, day) - 1 +
+                        self.inclusive) % DAYS_IN_WEEK + 1 - self.inclusive)
+                for day in self.rule.days(year)]
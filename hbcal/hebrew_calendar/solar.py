@@ -0,0 +1,211 @@
+"""This module calculates the time of sunset (or nightfall) at a location.
+
+The calculation uses the NOAA solar position equations (as in the NOAA
+solar calculator spreadsheets). It does not need a network connection.
+Times are accurate to about a minute between latitudes 72 degrees north and
+72 degrees south.
+
+The times for a whole Gregorian year are calculated at once and cached for
+each location. If numpy is installed, the calculation for the year is
+vectorized. Otherwise, each day is calculated using the math module.
+
+Exports:
+    Location
+    SUNSET_DEPRESSION
+    NIGHTFALL_DEPRESSION
+    year_sunsets
+    sunset
+    after_sunset
+    hebrew_date
+"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import division
+from collections import namedtuple
+from datetime import date as civil_date
+import math
+try:
+    from functools import lru_cache
+except ImportError:
+    from functools32 import lru_cache
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .abs_time import RelTime
+from .civil_year import GregorianYear
+from .date import Date
+from .hebrew_year import HebrewYear
+
+Location = namedtuple('Location', ['latitude', 'longitude', 'utcoffset'])
+Location.__doc__ = """A location on the earth.
+
+    latitude:   Degrees north of the equator (negative for south)
+    longitude:  Degrees east of Greenwich (negative for west)
+    utcoffset:  The offset of local time from UTC in hours
+"""
+
+# Depression of the sun's centre below the horizon (degrees) at sunset
+# (allowing for refraction and the radius of the sun)
+SUNSET_DEPRESSION = 0.833
+
+# Depression of the sun at nightfall (tzeit hakochavim), a common choice
+NIGHTFALL_DEPRESSION = 8.5
+
+# Adding this to a proleptic Gregorian ordinal (datetime.date.toordinal)
+# gives the Julian day at noon UTC
+JULIAN_DAY_OFFSET = 1721425
+J2000 = 2451545
+
+YEAR_CACHE_SIZE = 64
+
+
+def _sunset_minutes(julian_day, location, depression, lib):
+    """Calculate sunset in minutes after local midnight.
+
+    Args:
+        julian_day: Julian day at local noon (a float, or a numpy array of
+                    floats)
+        location:   The location (Location)
+        depression: The depression of the sun below the horizon (degrees)
+        lib:        The math module (for a float) or numpy (for an array)
+
+    Returns:
+        The time of sunset (same type as julian_day). There is no sunset
+        (nan) during polar day or night.
+    """
+    # pylint: disable=invalid-name
+    t = (julian_day - J2000) / 36525
+    mean_longitude = (280.46646 + t * (36000.76983 + t * 0.0003032)) % 360
+    anomaly = lib.radians(357.52911 + t * (35999.05029 - 0.0001537 * t))
+    eccentricity = 0.016708634 - t * (0.000042037 + 0.0000001267 * t)
+    centre = (lib.sin(anomaly) * (1.914602 - t * (0.004817 + 0.000014 * t)) +
+              lib.sin(2 * anomaly) * (0.019993 - 0.000101 * t) +
+              lib.sin(3 * anomaly) * 0.000289)
+    omega = lib.radians(125.04 - 1934.136 * t)
+    apparent_longitude = lib.radians(mean_longitude + centre - 0.00569 -
+                                     0.00478 * lib.sin(omega))
+    obliquity = lib.radians(
+        23 + (26 + (21.448 - t * (46.815 + t * (0.00059 - t * 0.001813))) /
+              60) / 60 + 0.00256 * lib.cos(omega))
+    arcsin = numpy.arcsin if lib is numpy else math.asin
+    declination = arcsin(lib.sin(obliquity) * lib.sin(apparent_longitude))
+    y = lib.tan(obliquity / 2) ** 2
+    mean_longitude = lib.radians(mean_longitude)
+    equation_of_time = 4 * lib.degrees(
+        y * lib.sin(2 * mean_longitude) -
+        2 * eccentricity * lib.sin(anomaly) +
+        4 * eccentricity * y * lib.sin(anomaly) * lib.cos(2 * mean_longitude) -
+        0.5 * y * y * lib.sin(4 * mean_longitude) -
+        1.25 * eccentricity * eccentricity * lib.sin(2 * anomaly))
+    latitude = math.radians(location.latitude)
+    cos_hour_angle = (math.cos(math.radians(90 + depression)) /
+                      (math.cos(latitude) * lib.cos(declination)) -
+                      math.tan(latitude) * lib.tan(declination))
+    noon = (720 - 4 * location.longitude - equation_of_time +
+            location.utcoffset * 60)
+    if lib is numpy:
+        polar = numpy.abs(cos_hour_angle) > 1
+        hour_angle = numpy.degrees(numpy.arccos(
+            numpy.clip(cos_hour_angle, -1, 1)))
+        return numpy.where(polar, numpy.nan, noon + 4 * hour_angle)
+    if abs(cos_hour_angle) > 1:
+        return float('nan')
+    return noon + 4 * math.degrees(math.acos(cos_hour_angle))
+
+
+@lru_cache(maxsize=YEAR_CACHE_SIZE)
+def year_sunsets(location, year, depression=SUNSET_DEPRESSION):
+    """Return the times of sunset for every day of a Gregorian year.
+
+    Args:
+        location:   The location (Location)
+        year:       The Gregorian year (integer)
+        depression: The depression of the sun below the horizon (degrees),
+                    e.g. SUNSET_DEPRESSION or NIGHTFALL_DEPRESSION
+
+    Returns:
+        A sequence of floats, indexed by the day of the year (0 for 1st
+        January). Each is the time of sunset in minutes after local
+        midnight, or nan if there is no sunset. Do not modify it - it is
+        cached.
+    """
+    first = civil_date(year, 1, 1).toordinal()
+    last = civil_date(year, 12, 31).toordinal()
+    # Julian day at local noon
+    offset = JULIAN_DAY_OFFSET - location.utcoffset / 24
+    if numpy is not None:
+        julian_days = numpy.arange(first, last + 1, dtype=float) + offset
+        sunsets = _sunset_minutes(julian_days, location, depression, numpy)
+        sunsets.setflags(write=False)
+        return sunsets
+    return tuple(_sunset_minutes(ordinal + offset, location, depression,
+                                 math)
+                 for ordinal in range(first, last + 1))
+
+
+def sunset(location, day, depression=SUNSET_DEPRESSION):
+    """Return the time of sunset on a civil date.
+
+    Args:
+        location:   The location (Location)
+        day:        The civil date (datetime.date)
+        depression: The depression of the sun below the horizon (degrees)
+
+    Returns:
+        The time of sunset in minutes after local midnight, or nan if there
+        is no sunset.
+    """
+    return float(year_sunsets(location, day.year, depression)
+                 [day.timetuple().tm_yday - 1])
+
+
+def after_sunset(location, when, depression=SUNSET_DEPRESSION):
+    """Return True if a local time is after sunset on its civil date.
+
+    Args:
+        location:   The location (Location)
+        when:       The local time (datetime.datetime)
+        depression: The depression of the sun below the horizon (degrees)
+
+    Returns:
+        True if when is at or after sunset, False if it is before sunset or
+        if there is no sunset on the date.
+    """
+    minutes = when.hour * 60 + when.minute + when.second / 60
+    return minutes >= sunset(location, when.date(), depression)
+
+
+def hebrew_date(location, when, depression=SUNSET_DEPRESSION):
+    """Return the Hebrew date at a local time.
+
+    The Hebrew date changes at sunset (or at nightfall, depending on
+    depression) at the location.
+
+    Args:
+        location:   The location (Location)
+        when:       The local time (datetime.datetime)
+        depression: The depression of the sun below the horizon (degrees)
+
+    Returns:
+        A Date with a HebrewYear.
+    """
+    day = Date(GregorianYear(when.year), when.month, when.day)
+    return Date(HebrewYear, day.day_start +
+                RelTime(0, after_sunset(location, when, depression)))
@@ -0,0 +1,448 @@
+"""This module contains a table-driven engine for study cycles.
+
+A study cycle (such as Daf Yomi) covers an ordered list of units (such as
+tractates), one page a day. A cycle is considered equivalent to a year, a
+unit to a month and a page to a date. A subclass of StudyCycle defines the
+units (its month_class), the number of pages in each unit, and any later
+editions in which some units have a different number of pages.
+
+Some cycles cover several pages (e.g. mishnayos or chapters) a day, which
+need not start at the start of a unit. The date of a day is then the number
+of the day among the days whose pages start in the unit, and portion
+returns the pages studied on it. Some cycles skip days (e.g. Yom Kippur) on
+which no page is studied.
+
+The page counts of each edition are compiled (once per class) into arrays of
+cumulative offsets. If no days are skipped, all cycles of an edition have
+the same length, so the start of a cycle, and the cycle, unit and page of a
+time, are found by arithmetic and bisection rather than by stepping through
+the cycles. Otherwise the starts of the cycles are found in order, once per
+class.
+
+Exports:
+    Edition
+    DateBeforeStudyCycle
+    StudyBreak
+    StudyUnit
+    StudyCycle
+"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+from bisect import bisect_left, bisect_right
+from collections import namedtuple, OrderedDict
+
+from future.builtins import range, super
+
+from .abs_time import DAY
+from .abstract_attribute import AbstractAttribute
+from .gematria import to_letters
+from .date import (Year, Month, Date, DateBeforeCreation, BadDate,
+                   DateNotInRange)
+from .format_percent_string import split_escape
+
+Edition = namedtuple('Edition', ['cycle', 'pages'])
+Edition.__doc__ = """A change to the number of pages of some units.
+
+    cycle:  The first cycle (integer) using the edition
+    pages:  A dictionary mapping each changed unit to its number of pages
+"""
+
+# The compiled tables of one edition of a study cycle. pages is the number
+# of pages, and unit_days the number of days, of each unit, and page_starts
+# the offset of each unit from the first page of the cycle.
+_CompiledEdition = namedtuple('_CompiledEdition',
+                              ['cycle', 'start', 'days', 'pages', 'offsets',
+                               'units', 'starts', 'unit_days', 'page_starts',
+                               'page_count'])
+
+# The start of a cycle of a study cycle that skips days, its number of days
+# (including skipped days) and the offsets (in days) of the skipped days
+_CycleSpan = namedtuple('_CycleSpan', ['start', 'days', 'skips'])
+
+# The compiled editions of each subclass of StudyCycle
+CYCLE_TABLES = {}
+
+# The starts and _CycleSpans of the cycles (so far) of each subclass of
+# StudyCycle that skips days
+CYCLE_SPANS = {}
+
+
+class DateBeforeStudyCycle(BadDate):
+    """An exception class for dates before the first cycle of a study
+    cycle."""
+
+
+class StudyBreak(BadDate):
+    """An exception class for days (e.g. Yom Kippur) on which no page of a
+    study cycle is studied."""
+
+
+class StudyUnit(Month):
+    """Base class for the units of study cycles.
+
+    A cycle starts with the first member and ends with the last. If several
+    pages are studied each day, the name of a unit on a day includes the
+    pages studied (see StudyCycle.format_portion)."""
+
+    @classmethod
+    def start_year_month(cls):
+        return next(iter(cls))
+
+    @classmethod
+    def end_year_month(cls):
+        return list(cls)[-1]
+
+    def format_month_name(self, fmt, cycle, date):
+        if cycle.PAGES_PER_DAY == 1:
+            return format(self, fmt)
+        return cycle.format_portion(self, date, fmt)
+
+
+class StudyCycle(Year):
+    """Base class for study cycles.
+
+    Subclasses must define month_class, START_FIRST_YEAR and PAGES, and
+    may define EDITIONS, FIRST_PAGE, PAGES_PER_DAY, BEFORE_FIRST_CYCLE and
+    skip_days (with SKIPS_DAYS)."""
+
+    FIRST_YEAR = 1
+    START_FIRST_YEAR = AbstractAttribute("The start of the first cycle")
+    # The number of pages in each unit (of the first edition), indexed by
+    # the value of the unit. This is not the number of the last page if
+    # units do not start with page 1.
+    PAGES = AbstractAttribute("The number of pages in each unit")
+    # Later editions (Edition), in order of cycle
+    EDITIONS = ()
+    # The number of the first page of each unit
+    FIRST_PAGE = 1
+    # The number of pages studied each day
+    PAGES_PER_DAY = 1
+    # True if skip_days is overridden
+    SKIPS_DAYS = False
+    # The exception raised for dates before the first cycle
+    BEFORE_FIRST_CYCLE = DateBeforeStudyCycle
+
+    @classmethod
+    def _editions(cls):
+        """Return the compiled editions of this class.
+
+        The result is a tuple comprising a list of the first cycles of the
+        editions, a list of their starts and a list of _CompiledEditions.
+        It is calculated once per class."""
+        tables = CYCLE_TABLES.get(cls)
+        if tables is None:
+            editions = []
+            pages = list(cls.PAGES)
+            start = cls.START_FIRST_YEAR
+            first = Edition(cls.FIRST_YEAR, {})
+            for edition in (first,) + tuple(cls.EDITIONS):
+                if editions:
+                    previous = editions[-1]
+                    start = previous.start + (edition.cycle - previous.cycle) \
+                        * previous.days * DAY
+                for unit, count in edition.pages.items():
+                    pages[unit] = count
+                offsets = OrderedDict()
+                unit_days = list(pages)
+                page_starts = []
+                page_count = 0
+                for unit in cls.month_class():
+                    # The first day whose pages start in the unit
+                    offsets[unit] = -(-page_count // cls.PAGES_PER_DAY)
+                    page_starts.append(page_count)
+                    page_count += pages[unit]
+                    unit_days[unit] = -(-page_count // cls.PAGES_PER_DAY) \
+                        - offsets[unit]
+                days = -(-page_count // cls.PAGES_PER_DAY)
+                editions.append(_CompiledEdition(
+                    edition.cycle, start, days, tuple(pages), offsets,
+                    list(offsets), list(offsets.values()), tuple(unit_days),
+                    page_starts, page_count))
+            tables = ([x.cycle for x in editions],
+                      [x.start for x in editions], editions)
+            CYCLE_TABLES[cls] = tables
+        return tables
+
+    @classmethod
+    def _edition_of_cycle(cls, value):
+        """Return the compiled edition used by a cycle."""
+        cycles, _, editions = cls._editions()
+        return editions[max(bisect_right(cycles, value) - 1, 0)]
+
+    @property
+    def _edition(self):
+        return self._edition_of_cycle(self._value)
+
+    @classmethod
+    def skip_days(cls, start, days):
+        """Return the days on which no page is studied in a range of days.
+
+        Subclasses that override this must set SKIPS_DAYS.
+
+        Args:
+            start:  The start (AbsTime) of the first day
+            days:   The number of days
+
+        Returns:
+            A list of the offsets (in days) from start of the days, in
+            order.
+        """
+        return []
+
+    @classmethod
+    def _spans(cls, value=None, atime=None):
+        """Return the starts and _CycleSpans of the cycles of a class that
+        skips days, up to cycle value or the cycle containing atime.
+
+        Each cycle starts the day after the last day of the previous cycle,
+        and its days are the days of its edition and the skipped days."""
+        starts, spans = CYCLE_SPANS.setdefault(cls, ([], []))
+        while (value is not None and len(spans) <= value - cls.FIRST_YEAR
+               or atime is not None and (not spans or atime >= starts[-1] +
+                                         spans[-1].days * DAY)):
+            start = starts[-1] + spans[-1].days * DAY if spans \
+                else cls.START_FIRST_YEAR
+            days = cls._edition_of_cycle(cls.FIRST_YEAR + len(spans)).days
+            skips = []
+            while True:
+                found = cls.skip_days(start, days + len(skips))
+                if len(found) == len(skips):
+                    break
+                skips = found
+            starts.append(start)
+            spans.append(_CycleSpan(start, days + len(skips), tuple(skips)))
+        return starts, spans
+
+    @classmethod
+    def _span(cls, value):
+        """Return the _CycleSpan of a cycle of a class that skips days.
+
+        Cycles before the first cycle skip no days."""
+        if value < cls.FIRST_YEAR:
+            days = cls._edition_of_cycle(value).days
+            return _CycleSpan(cls.START_FIRST_YEAR -
+                              (cls.FIRST_YEAR - value) * days * DAY, days, ())
+        return cls._spans(value=value)[1][value - cls.FIRST_YEAR]
+
+    def _skips(self):
+        """Return the offsets (in days) of the skipped days of the cycle."""
+        return self._span(self._value).skips if self.SKIPS_DAYS else ()
+
+    @Year.value.setter
+    def value(self, value):
+        if self.SKIPS_DAYS:
+            self._start = self._span(value).start
+        else:
+            edition = self._edition_of_cycle(value)
+            self._start = edition.start + \
+                (value - edition.cycle) * edition.days * DAY
+        self._value = value
+
+    @classmethod
+    def current_year(cls, atime):
+        if atime < cls.START_FIRST_YEAR:
+            raise cls.BEFORE_FIRST_CYCLE
+        if cls.SKIPS_DAYS:
+            starts, _ = cls._spans(atime=atime)
+            index = bisect_right(starts, atime) - 1
+            return cls(index + cls.FIRST_YEAR), atime - starts[index]
+        _, starts, editions = cls._editions()
+        edition = editions[bisect_right(starts, atime) - 1]
+        year, remainder = divmod(atime - edition.start, edition.days * DAY)
+        return cls(year + edition.cycle), remainder
+
+    def days_in_month(self, month):
+        return self._edition.unit_days[month]
+
+    def days_in_year(self):
+        if self.SKIPS_DAYS:
+            return self._span(self._value).days
+        return self._edition.days
+
+    def duration(self):
+        return self.days_in_year() * DAY
+
+    def months_in_year(self):
+        return len(self.month_class())
+
+    def month_offsets(self):
+        """Return the offset (in days) of each unit from the start of the
+        cycle.
+
+        Do not modify it - it is shared by all cycles of the same
+        edition."""
+        return self._edition.offsets
+
+    def day_of_year(self, month, date):
+        day = super().day_of_year(month, date)
+        for skip in self._skips():
+            if skip > day:
+                break
+            day += 1
+        return day
+
+    def month_and_date(self, day_of_year):
+        """Return the unit and date of a day of the cycle.
+
+        Raises:
+            StudyBreak if no page is studied on the day.
+        """
+        skips = self._skips()
+        skipped = bisect_left(skips, day_of_year)
+        if skipped < len(skips) and skips[skipped] == day_of_year:
+            raise StudyBreak()
+        day_of_year -= skipped
+        edition = self._edition
+        index = bisect_right(edition.starts, day_of_year) - 1
+        return (edition.units[index],
+                day_of_year - edition.starts[index] + self.first_day())
+
+    def portion(self, unit, date):
+        """Return the pages studied on a day.
+
+        Args:
+            unit:   The unit (in which the pages of the day start)
+            date:   The date
+
+        Returns:
+            A list with a tuple for each unit with pages studied on the
+            day, comprising the unit and the numbers of its first and last
+            pages studied.
+        """
+        edition = self._edition
+        first = (edition.offsets[unit] + date - self.first_day()) * \
+            self.PAGES_PER_DAY
+        last = min(first + self.PAGES_PER_DAY, edition.page_count) - 1
+        index = bisect_right(edition.page_starts, first) - 1
+        result = []
+        while first <= last:
+            unit = edition.units[index]
+            start = edition.page_starts[index]
+            end = min(last, start + edition.pages[unit] - 1)
+            result.append((unit, first - start + self.FIRST_PAGE,
+                           end - start + self.FIRST_PAGE))
+            first = end + 1
+            index += 1
+        return result
+
+    @classmethod
+    def first_day(cls):
+        return cls.FIRST_PAGE
+
+    def last_day(self, month):
+        return self.days_in_month(month) + self.first_day() - 1
+
+    def adjust_date(self, month, date):
+        try:
+            return super().adjust_date(month, date)
+        except DateBeforeCreation:
+            raise self.BEFORE_FIRST_CYCLE
+
+    @classmethod
+    def min_date(cls):
+        """Calculate the minimum date for this class.
+
+        We only need to do it once per class."""
+        if cls.MIN_DATE is None:
+            cls.MIN_DATE = Date(cls, cls.START_FIRST_YEAR)
+        return cls.MIN_DATE
+
+    @classmethod
+    def _pages(cls, unit):
+        """Return the unit and the first and last pages (None for the end of
+        the unit) of a unit, or of a part of a unit.
+
+        Subclasses may override this to support parts of units."""
+        return cls.month_class()(unit), cls.first_day(), None
+
+    @classmethod
+    def unit_span(cls, unit, cycle):
+        """Return the first and last days on which a unit is studied.
+
+        Args:
+            unit:   The unit (or part of a unit supported by _pages)
+            cycle:  The cycle (integer)
+
+        Returns:
+            A tuple comprising the Dates of the first and last pages of the
+            unit.
+        """
+        year = cls(cycle)
+        unit, first, last = cls._pages(unit)
+        return (Date(year, unit, first),
+                Date(cls(year), unit,
+                     year.last_day(unit) if last is None else last))
+
+    @classmethod
+    def occurrences(cls, unit, page, start, stop):
+        """Return the days on which a page is studied in a range of cycles.
+
+        Args:
+            unit:   The unit (or part of a unit supported by _pages)
+            page:   The number of the page
+            start:  The first cycle (integer)
+            stop:   The cycle after the last cycle (integer)
+
+        Returns:
+            A list of Dates, one for each cycle that has the page. Use the
+            day_start attribute to convert them to other calendars.
+
+        Raises:
+            DateNotInRange if the page is not in the part of the unit.
+        """
+        unit, first, last = cls._pages(unit)
+        if not first <= page <= (page if last is None else last):
+            raise DateNotInRange()
+        result = []
+        for value in range(max(start, cls.FIRST_YEAR), stop):
+            year = cls(value)
+            if page <= year.last_day(unit):
+                result.append(Date(year, unit, page))
+        return result
+
+    def format_day_of_month(self, page, fmt):
+        """ Return the number of the page, formatted as 3 digits """
+        return self.format_number(page, 3, fmt)
+
+    def format_pages(self, unit, first, last, fmt):
+        """ Return the numbers of the first and last pages of a unit studied
+        on a day (e.g. 3-5), formatted without padding """
+        if first == last:
+            return self.format_number(first, 1, fmt)
+        return u"{0}-{1}".format(self.format_number(first, 1, fmt),
+                                 self.format_number(last, 1, fmt))
+
+    def format_portion(self, unit, date, fmt):
+        """ Return the pages studied on a day (see portion), e.g.
+        Berachos 3-5, formatted by fmt (that of the name of the unit) """
+        return u", ".join(
+            u"{0} {1}".format(format(part, fmt),
+                              self.format_pages(part, first, last, fmt))
+            for part, first, last in self.portion(unit, date))
+
+    @classmethod
+    def format_number(cls, value, places, fmt):
+        if split_escape(fmt)[0] == '~':
+            return to_letters(value)
+        return super().format_number(value, places, fmt, True)
+
+    class GematriaFlag(object):
+        """ A dummy class used to add '~' to the allowed flags. """
+        escapes = {"~": None}
+
+    SUBFORMATTERS = ('GematriaFlag',)
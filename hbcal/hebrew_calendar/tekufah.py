@@ -0,0 +1,202 @@
+"""This module calculates the tekufot (seasons) according to Shmuel and Rav
+Adda, Birkat Hachama and the start of Tal Umatar in the Diaspora.
+
+The tekufot are evenly spaced, so any tekufah is calculated directly from the
+first tekufat Nissan, using integer arithmetic in chalakim. The length of a
+tekufah according to Rav Adda is not a whole number of chalakim, so times
+are rounded down to a whole chelek.
+
+Exports:
+    Tekufah
+    TekufahMethod
+    SHMUEL
+    RAV_ADDA
+    TekufahTime
+    tekufah
+    iter_tekufot
+    is_birkat_hachama_year
+    iter_birkat_hachama
+    tal_umatar
+"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import namedtuple
+from enum import IntEnum
+
+from future.builtins import range
+
+from .abs_time import AbsTime, RelTime
+from .civil_year import BritishYear
+from .date import Date, DateTime
+from .hebrew_year import HebrewYear, FIRST_MOLAD, LUNAR_CYCLE, SIX_HOURS
+
+TEKUFOT_IN_YEAR = 4
+
+# FIRST_MOLAD is molad Tishri of year 2. Molad Nissan of year 1 was 6 months
+# earlier.
+MOLAD_NISSAN_YEAR_1 = ((FIRST_MOLAD - AbsTime()).chalakim -
+                       6 * LUNAR_CYCLE.chalakim)
+
+
+class Tekufah(IntEnum):
+    """An enumeration class for the tekufot.
+
+    As for HebrewMonth, the tekufot are numbered from Nissan. Tekufat Tishri
+    and tekufat Teveth of a Hebrew year precede tekufat Nissan of the
+    year."""
+    NISSAN = 0
+    TAMMUZ = 1
+    TISHRI = 2
+    TEVETH = 3
+
+    def __str__(self):
+        return self._name_.title()
+
+    def quarters(self):
+        """Return the number of tekufot from tekufat Nissan of the same
+        Hebrew year to this tekufah."""
+        return self.value if self < Tekufah.TISHRI else \
+            self.value - TEKUFOT_IN_YEAR
+
+
+TekufahMethod = namedtuple('TekufahMethod', ['name', 'epoch', 'numerator',
+                                             'denominator'])
+TekufahMethod.__doc__ = """The parameters of a method of calculating tekufot.
+
+    name:           The name of the method
+    epoch:          Tekufat Nissan of year 1 in chalakim since AbsTime()
+    numerator:      The length of a tekufah in chalakim is numerator /
+    denominator:    denominator
+"""
+
+# Rambam Hilchot Kiddush Hachodesh 9:3 - a year of 365 days and 6 hours.
+# Tekufat Nissan of year 1 was 7 days 9 hours 642 chalakim before the molad.
+SHMUEL = TekufahMethod('Shmuel',
+                       MOLAD_NISSAN_YEAR_1 - RelTime(0, 7, 9, 642).chalakim,
+                       RelTime(0, 91, 7, 540).chalakim, 1)
+
+# Rambam Hilchot Kiddush Hachodesh 10:1-3 - 19 years are exactly 235 months.
+# Tekufat Nissan of year 1 was 9 hours 642 chalakim before the molad.
+RAV_ADDA = TekufahMethod('Rav Adda',
+                         MOLAD_NISSAN_YEAR_1 - RelTime(0, 0, 9, 642).chalakim,
+                         HebrewYear.MONTHS_IN_CYCLE * LUNAR_CYCLE.chalakim,
+                         HebrewYear.YEARS_IN_CYCLE * TEKUFOT_IN_YEAR)
+
+# Tekufat Nissan according to Shmuel returns to the start of Wednesday (the
+# time at which the sun was created) every 28 years, starting with year 1.
+BIRKAT_HACHAMA_CYCLE = 28
+
+# Tal Umatar is first said in the Diaspora at the start of the 60th day
+# counting the day of tekufat Tishri as the first (Taanit 10a).
+TAL_UMATAR_DAYS = 59
+
+TekufahTime = namedtuple('TekufahTime', ['year', 'tekufah', 'time', 'civil'])
+TekufahTime.__doc__ = """The time of a tekufah.
+
+    year:       The Hebrew year (an integer)
+    tekufah:    The tekufah (Tekufah)
+    time:       The time of the tekufah (AbsTime)
+    civil:      The time of the tekufah (civil DateTime)
+"""
+
+
+def _quarter(year, which):
+    """Return the number of tekufot from tekufat Nissan of year 1."""
+    return (year - 1) * TEKUFOT_IN_YEAR + Tekufah(which).quarters()
+
+
+def _chalakim(quarter, method):
+    """Return the time in chalakim of a tekufah, given its quarter."""
+    return (method.epoch +
+            quarter * method.numerator // method.denominator)
+
+
+def tekufah(year, which, method=SHMUEL):
+    """Return the time (AbsTime) of a tekufah.
+
+    Args:
+        year:   The Hebrew year (integer)
+        which:  The tekufah (Tekufah)
+        method: SHMUEL or RAV_ADDA
+    """
+    return AbsTime(chalakim=_chalakim(_quarter(year, which), method))
+
+
+def iter_tekufot(start, stop, method=SHMUEL, year_class=BritishYear):
+    """A generator for all tekufot in a range of Hebrew years.
+
+    Args:
+        start:      The first Hebrew year (integer)
+        stop:       The Hebrew year after the last year (integer)
+        method:     SHMUEL or RAV_ADDA
+        year_class: The subclass of Year for civil times
+
+    Yields:
+        A TekufahTime object for each tekufah, in order (Tishri, Teveth,
+        Nissan and Tammuz of each year).
+    """
+    order = sorted(Tekufah, key=Tekufah.quarters)
+    for value in range(start, stop):
+        for which in order:
+            time = AbsTime(chalakim=_chalakim(_quarter(value, which),
+                                              method))
+            yield TekufahTime(value, which, time,
+                              DateTime(year_class, time))
+
+
+def is_birkat_hachama_year(year):
+    """Return True if Birkat Hachama is said in a Hebrew year."""
+    return year % BIRKAT_HACHAMA_CYCLE == 1
+
+
+def iter_birkat_hachama(start, stop, year_class=BritishYear):
+    """A generator for the dates of Birkat Hachama in a range of Hebrew
+    years.
+
+    Birkat Hachama is said on the morning after tekufat Nissan according to
+    Shmuel (which is at 6pm on a Tuesday) in every 28th year.
+
+    Args:
+        start:      The first Hebrew year (integer)
+        stop:       The Hebrew year after the last year (integer)
+        year_class: The subclass of Year for the civil dates
+
+    Yields:
+        A tuple comprising the Hebrew year and the civil date (Date) of the
+        Wednesday on which Birkat Hachama is said.
+    """
+    first = start + (1 - start) % BIRKAT_HACHAMA_CYCLE
+    for value in range(first, stop, BIRKAT_HACHAMA_CYCLE):
+        yield value, Date(year_class, tekufah(value, Tekufah.NISSAN) +
+                          SIX_HOURS)
+
+
+def tal_umatar(year, year_class=BritishYear):
+    """Return the date on which Tal Umatar is first said in the Diaspora.
+
+    Args:
+        year:       The Hebrew year (integer)
+        year_class: The subclass of Year for the civil date
+
+    Returns:
+        The civil date (Date) of the evening (maariv) on which Tal Umatar is
+        first said.
+    """
+    tishri = tekufah(year, Tekufah.TISHRI)
+    day = Date(HebrewYear, tishri)
+    return Date(year_class, day.day_start + RelTime(0, TAL_UMATAR_DAYS))
@@ -0,0 +1,109 @@
+"""This file contains the names of the tractates of the Mishnah, and class
+TractateMonth.
+
+The tractates of the Talmud (Bavli and Yerushalmi) are tractates of the
+Mishnah, so all the study cycles of tractates share one table of Hebrew
+names, keyed by the names of the members of their enumerations.
+
+Exports:
+    HEBREW_NAMES
+    TractateMonth
+"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+from .hebrew_letters import resolve_names
+from .study_cycle import StudyUnit
+
+# The tractates of the Mishnah, in order, and their Hebrew names
+_TEMPLATES = (
+    ("BERACHOS", u"{BET}{RESH}{KAF}{VAV}{TAV}"),
+    ("PEAH", u"{PE}{ALEF}{HE}"),
+    ("DEMAI", u"{DALET}{MEM}{ALEF}{YOD}"),
+    ("KILAYIM", u"{KAF}{LAMED}{ALEF}{YOD}{FINAL_MEM}"),
+    ("SHEVIIS", u"{SHIN}{BET}{YOD}{AYIN}{YOD}{TAV}"),
+    ("TERUMOS", u"{TAV}{RESH}{VAV}{MEM}{VAV}{TAV}"),
+    ("MAASROS", u"{MEM}{AYIN}{SHIN}{RESH}{VAV}{TAV}"),
+    ("MAASER_SHENI", u"{MEM}{AYIN}{SHIN}{RESH} {SHIN}{NUN}{YOD}"),
+    ("CHALLAH", u"{CHET}{LAMED}{HE}"),
+    ("ORLAH", u"{AYIN}{RESH}{LAMED}{HE}"),
+    ("BIKKURIM", u"{BET}{YOD}{KAF}{VAV}{RESH}{YOD}{FINAL_MEM}"),
+    ("SHABBOS", u"{SHIN}{BET}{TAV}"),
+    ("ERUVIN", u"{AYIN}{YOD}{RESH}{VAV}{BET}{YOD}{FINAL_NUN}"),
+    ("PESACHIM", u"{PE}{SAMECH}{CHET}{YOD}{FINAL_MEM}"),
+    ("SHEKALIM", u"{SHIN}{QOF}{LAMED}{YOD}{FINAL_MEM}"),
+    ("YOMA", u"{YOD}{VAV}{MEM}{ALEF}"),
+    ("SUCCAH", u"{SAMECH}{VAV}{KAF}{HE}"),
+    ("BEITZAH", u"{BET}{YOD}{TZADE}{HE}"),
+    ("ROSH_HASHANAH", u"{RESH}{ALEF}{SHIN} {HE}{SHIN}{NUN}{HE}"),
+    ("TAANIS", u"{TAV}{AYIN}{NUN}{YOD}{TAV}"),
+    ("MEGILAH", u"{MEM}{GIMEL}{YOD}{LAMED}{HE}"),
+    ("MOED_KATAN", u"{MEM}{VAV}{AYIN}{DALET} {QOF}{TET}{FINAL_NUN}"),
+    ("CHAGIGAH", u"{CHET}{GIMEL}{YOD}{GIMEL}{HE}"),
+    ("YEVAMOS", u"{YOD}{BET}{MEM}{VAV}{TAV}"),
+    ("KESUVOS", u"{KAF}{TAV}{VAV}{BET}{VAV}{TAV}"),
+    ("NEDARIM", u"{NUN}{DALET}{RESH}{YOD}{FINAL_MEM}"),
+    ("NAZIR", u"{NUN}{ZAYIN}{YOD}{RESH}"),
+    ("SOTAH", u"{SAMECH}{VAV}{TET}{HE}"),
+    ("GITIN", u"{GIMEL}{YOD}{TET}{YOD}{FINAL_NUN}"),
+    ("KIDDUSHIN", u"{QOF}{YOD}{DALET}{VAV}{SHIN}{YOD}{FINAL_NUN}"),
+    ("BAVA_KAMA", u"{BET}{BET}{ALEF} {QOF}{MEM}{ALEF}"),
+    ("BAVA_METZIA", u"{BET}{BET}{ALEF} {MEM}{TZADE}{YOD}{AYIN}{ALEF}"),
+    ("BAVA_BASRA", u"{BET}{BET}{ALEF} {BET}{TAV}{RESH}{ALEF}"),
+    ("SANHEDRIN", u"{SAMECH}{NUN}{HE}{DALET}{RESH}{YOD}{FINAL_NUN}"),
+    ("MAKKOS", u"{MEM}{KAF}{VAV}{TAV}"),
+    ("SHEVUOS", u"{SHIN}{BET}{VAV}{AYIN}{VAV}{TAV}"),
+    ("EDUYOS", u"{AYIN}{DALET}{YOD}{VAV}{TAV}"),
+    ("AVODA_ZARAH", u"{AYIN}{BET}{VAV}{DALET}{HE} {ZAYIN}{RESH}{HE}"),
+    ("AVOS", u"{ALEF}{BET}{VAV}{TAV}"),
+    ("HORAYOS", u"{HE}{VAV}{RESH}{YOD}{VAV}{TAV}"),
+    ("ZEVACHIM", u"{ZAYIN}{BET}{CHET}{YOD}{FINAL_MEM}"),
+    ("MENACHOS", u"{MEM}{NUN}{CHET}{VAV}{TAV}"),
+    ("CHULIN", u"{CHET}{VAV}{LAMED}{YOD}{FINAL_NUN}"),
+    ("BECHOROS", u"{BET}{KAF}{VAV}{RESH}{VAV}{TAV}"),
+    ("ERCHIN", u"{AYIN}{RESH}{KAF}{YOD}{FINAL_NUN}"),
+    ("TEMURAH", u"{TAV}{MEM}{VAV}{RESH}{HE}"),
+    ("KERISUS", u"{KAF}{RESH}{YOD}{TAV}{VAV}{TAV}"),
+    ("MEILAH", u"{MEM}{AYIN}{YOD}{LAMED}{HE}"),
+    ("TAMID", u"{TAV}{MEM}{YOD}{DALET}"),
+    ("MIDDOS", u"{MEM}{DALET}{VAV}{TAV}"),
+    ("KINNIM", u"{QOF}{NUN}{YOD}{FINAL_MEM}"),
+    ("KEILIM", u"{KAF}{LAMED}{YOD}{FINAL_MEM}"),
+    ("OHALOS", u"{ALEF}{HE}{LAMED}{VAV}{TAV}"),
+    ("NEGAIM", u"{NUN}{GIMEL}{AYIN}{YOD}{FINAL_MEM}"),
+    ("PARAH", u"{PE}{RESH}{HE}"),
+    ("TAHAROS", u"{TET}{HE}{RESH}{VAV}{TAV}"),
+    ("MIKVAOS", u"{MEM}{QOF}{VAV}{ALEF}{VAV}{TAV}"),
+    ("NIDAH", u"{NUN}{DALET}{HE}"),
+    ("MACHSHIRIN", u"{MEM}{KAF}{SHIN}{YOD}{RESH}{YOD}{FINAL_NUN}"),
+    ("ZAVIM", u"{ZAYIN}{BET}{YOD}{FINAL_MEM}"),
+    ("TEVUL_YOM", u"{TET}{BET}{VAV}{LAMED} {YOD}{VAV}{FINAL_MEM}"),
+    ("YADAYIM", u"{YOD}{DALET}{YOD}{FINAL_MEM}"),
+    ("UKTZIN", u"{AYIN}{VAV}{QOF}{TZADE}{YOD}{FINAL_NUN}"))
+
+HEBREW_NAMES = dict(zip((name for name, _ in _TEMPLATES),
+                        resolve_names(x for _, x in _TEMPLATES)))
+
+
+class TractateMonth(StudyUnit):
+    """Base class for enumerations of tractates, whose Hebrew names are in
+    HEBREW_NAMES"""
+
+    def __format__(self, fmt):
+        _, _, option = fmt.partition('#')
+        if option == "":
+            return self.name()
+        return HEBREW_NAMES[self._name_]
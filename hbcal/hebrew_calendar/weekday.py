@@ -4,6 +4,7 @@
         DAYS_IN_WEEK
         YOM
         WEEKDAY_HEBREW_NAMES
+        SHORT_WEEKDAY_HEBREW_NAMES
 """
 
 
@@ -25,21 +26,31 @@
 
 from enum import IntEnum
 
-from .hebrew_letters import HEBREW_LETTERS
-from .gematria import to_letters
+from .hebrew_letters import HEBREW_LETTERS, resolve_names
 from .format_percent_string import format_percent_string
 
 DAYS_IN_WEEK = 7
 YOM = u"{YOD}{VAV}{FINAL_MEM}".format(**HEBREW_LETTERS)
 
-WEEKDAY_HEBREW_NAMES = [
-    YOM + u" {RESH}{ALEF}{SHIN}{VAV}{FINAL_NUN}".format(**HEBREW_LETTERS),
-    YOM + u" {SHIN}{NUN}{YOD}".format(**HEBREW_LETTERS),
-    YOM + u" {SHIN}{LAMED}{YOD}{SHIN}{YOD}".format(**HEBREW_LETTERS),
-    YOM + u" {RESH}{BET}{YOD}{AYIN}{YOD}".format(**HEBREW_LETTERS),
-    YOM + u" {CHET}{MEM}{YOD}{SHIN}{YOD}".format(**HEBREW_LETTERS),
-    YOM + u" {SHIN}{YOD}{SHIN}{YOD}".format(**HEBREW_LETTERS),
-    u"{SHIN}{BET}{TAV}".format(**HEBREW_LETTERS)]
+WEEKDAY_HEBREW_NAMES = resolve_names([
+    YOM + u" {RESH}{ALEF}{SHIN}{VAV}{FINAL_NUN}",
+    YOM + u" {SHIN}{NUN}{YOD}",
+    YOM + u" {SHIN}{LAMED}{YOD}{SHIN}{YOD}",
+    YOM + u" {RESH}{BET}{YOD}{AYIN}{YOD}",
+    YOM + u" {CHET}{MEM}{YOD}{SHIN}{YOD}",
+    YOM + u" {SHIN}{YOD}{SHIN}{YOD}",
+    u"{SHIN}{BET}{TAV}"])
+
+# Weekdays (except Shabbat) are abbreviated to Yom and the number of the
+# day in Hebrew letters.
+SHORT_WEEKDAY_HEBREW_NAMES = resolve_names([
+    YOM + u" {ALEF}{GERESH}",
+    YOM + u" {BET}{GERESH}",
+    YOM + u" {GIMEL}{GERESH}",
+    YOM + u" {DALET}{GERESH}",
+    YOM + u" {HE}{GERESH}",
+    YOM + u" {VAV}{GERESH}",
+    u"{SHIN}{BET}{TAV}"])
 
 
 ESCAPES = {'a': 'format_short_weekday',
@@ -69,16 +80,15 @@ class Weekday(IntEnum):
         _, _, option = fmt.partition('#')
         if option == 'H':
             return WEEKDAY_HEBREW_NAMES[self]
-        return self.__str__()
+        return WEEKDAY_NAMES[self]
 
     def format_short_weekday(self, fmt):
         """ Format a weekday as a short string (usually 3 characters) """
         _, _, option = fmt.partition('#')
         if option == "H":
-            if self.value == Weekday.SATURDAY:
-                name = WEEKDAY_HEBREW_NAMES[self]
-            else:
-                name = u"{YOM} {day}".format(YOM=YOM,
-                                             day=to_letters(self.value + 1))
-            return name
-        return self.__str__()[:3]
+            return SHORT_WEEKDAY_HEBREW_NAMES[self]
+        return SHORT_WEEKDAY_NAMES[self]
+
+
+WEEKDAY_NAMES = tuple(str(weekday) for weekday in Weekday)
+SHORT_WEEKDAY_NAMES = tuple(name[:3] for name in WEEKDAY_NAMES)
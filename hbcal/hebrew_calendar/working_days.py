@@ -0,0 +1,144 @@
+"""This module contains working day arithmetic.
+
+A working day is any day that is neither Shabbat nor Yom Tov. Chol Hamoed,
+fast days and Rosh Chodesh are working days.
+
+For each keviah (the weekday of Rosh Hashonah and the number of days in the
+year), and for Israel and the Diaspora, a table of the number of working days
+before each day of the Hebrew year is calculated once. Arithmetic over a
+long period therefore only needs one step per Hebrew year spanned, and a
+binary search of the table for the final year.
+
+Exports:
+    add_working_days
+    working_days_between
+"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+from bisect import bisect_left
+
+from future.builtins import range
+
+from .abs_time import RelTime
+from .date import Date
+from .hebrew_year import HebrewYear
+from .holidays import Holiday, YearHolidays
+from .weekday import DAYS_IN_WEEK, Weekday
+
+# Calculated tables, keyed by (weekday of Rosh Hashonah, days in year, israel)
+WORKING_DAY_COUNTS = {}
+
+
+def _working_day_counts(year, israel):
+    """Return the working day table for a Hebrew year.
+
+    Element n of the table is the number of working days in the year before
+    day n of the year (1st Tishri is day 0). The table has one more element
+    than the number of days in the year - the last element is the number of
+    working days in the year.
+    """
+    rh_day = year.start.days
+    key = (rh_day, year.days_in_year(), bool(israel))
+    counts = WORKING_DAY_COUNTS.get(key)
+    if counts is None:
+        yom_tov = YearHolidays(year, israel).masks[Holiday.YOM_TOV]
+        counts = [0]
+        for day in range(year.days_in_year()):
+            working = ((rh_day + day) % DAYS_IN_WEEK != Weekday.SATURDAY and
+                       not yom_tov >> day & 1)
+            counts.append(counts[-1] + working)
+        counts = WORKING_DAY_COUNTS[key] = tuple(counts)
+    return counts
+
+
+def _hebrew_year_and_day(date):
+    """Return the Hebrew year containing a date, and the day of that year.
+
+    The date may be for any calendar."""
+    year, remainder = HebrewYear.current_year(date.day_start)
+    return year, remainder.days_chalakim[0]
+
+
+def add_working_days(date, days, israel=False):
+    """Return the date a number of working days after a date.
+
+    If days is positive, the result is the days'th working day after date.
+    If days is negative, the result is the -days'th working day before date.
+    If days is 0, date is returned, even if it is not a working day.
+
+    Args:
+        date:   The start date (a Date object for any calendar)
+        days:   The number of working days to add (an integer)
+        israel: True for the Israeli festival calendar, False for the
+                Diaspora
+
+    Returns:
+        A new Date object, with a year of the same class as date.
+    """
+    if days == 0:
+        return Date(date.year.__class__, date.day_start)
+    year, day = _hebrew_year_and_day(date)
+    counts = _working_day_counts(year, israel)
+
+    # target is the required working day, counting from 1 for the first
+    # working day of the year.
+    if days > 0:
+        target = counts[day + 1] + days
+    else:
+        target = counts[day] + days + 1
+    offset = -day
+    while target > counts[-1]:
+        target -= counts[-1]
+        offset += year.days_in_year()
+        year += 1
+        counts = _working_day_counts(year, israel)
+    while target <= 0:
+        year -= 1
+        counts = _working_day_counts(year, israel)
+        offset -= year.days_in_year()
+        target += counts[-1]
+    offset += bisect_left(counts, target) - 1
+    return Date(date.year.__class__, date.day_start + RelTime(0, offset))
+
+
+def working_days_between(start, end, israel=False):
+    """Return the number of working days between two dates.
+
+    If end is after start, this is the number of working days after start,
+    up to and including end. If end is before start, it is minus the number
+    of working days after end, up to and including start. So
+    add_working_days(start, working_days_between(start, end)) is end if end
+    is a working day.
+
+    Args:
+        start:  The first date (a Date object for any calendar)
+        end:    The second date (a Date object for any calendar)
+        israel: True for the Israeli festival calendar, False for the
+                Diaspora
+    """
+    if end.day_start < start.day_start:
+        return -working_days_between(end, start, israel)
+    year, day = _hebrew_year_and_day(start)
+    end_year, end_day = _hebrew_year_and_day(end)
+    counts = _working_day_counts(year, israel)
+    result = -counts[day + 1]
+    while year.value < end_year.value:
+        result += counts[-1]
+        year += 1
+        counts = _working_day_counts(year, israel)
+    return result + counts[end_day + 1]
@@ -0,0 +1,85 @@
+"""This file contains classes YerushalmiTractate and YerushalmiCycle."""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+from future.builtins import range
+
+from .abs_time import AbsTime, DAY
+from .date import Date
+from .hebrew_year import HebrewYear, HebrewMonth
+from .study_cycle import DateBeforeStudyCycle, StudyCycle
+from .tractates import TractateMonth
+from .weekday import DAYS_IN_WEEK, Weekday
+
+# The tractates of Talmud Yerushalmi, in the order of the Vilna edition, and
+# the number of dapim in each
+VILNA_DAPIM = (
+    ("BERACHOS", 68), ("PEAH", 37), ("DEMAI", 34), ("KILAYIM", 44),
+    ("SHEVIIS", 31), ("TERUMOS", 59), ("MAASROS", 26), ("MAASER_SHENI", 33),
+    ("CHALLAH", 28), ("ORLAH", 20), ("BIKKURIM", 13), ("SHABBOS", 92),
+    ("ERUVIN", 65), ("PESACHIM", 71), ("BEITZAH", 22), ("ROSH_HASHANAH", 22),
+    ("YOMA", 42), ("SUCCAH", 26), ("TAANIS", 26), ("SHEKALIM", 33),
+    ("MEGILAH", 34), ("CHAGIGAH", 22), ("MOED_KATAN", 19), ("YEVAMOS", 85),
+    ("KESUVOS", 72), ("SOTAH", 47), ("NEDARIM", 40), ("NAZIR", 47),
+    ("GITIN", 54), ("KIDDUSHIN", 48), ("BAVA_KAMA", 44), ("BAVA_METZIA", 37),
+    ("BAVA_BASRA", 34), ("SHEVUOS", 44), ("MAKKOS", 9), ("SANHEDRIN", 57),
+    ("AVODA_ZARAH", 37), ("HORAYOS", 19), ("NIDAH", 13))
+
+# An enumeration class of tractates of Talmud Yerushalmi
+YerushalmiTractate = TractateMonth(
+    'YerushalmiTractate', [name for name, _ in VILNA_DAPIM], module=__name__)
+
+
+class DateBeforeYerushalmiYomi(DateBeforeStudyCycle):
+    """An exception class for dates before the first Yerushalmi Yomi
+    cycle."""
+
+
+class YerushalmiCycle(StudyCycle):
+    """Subclass of StudyCycle for the Yerushalmi Yomi calendar.
+
+    A cycle of Yerushalmi Yomi is considered equivalent to a year, a
+    tractate to a month and a daf to a date. No daf is studied on Yom
+    Kippur or Tisha B'Av, so cycles do not all have the same length."""
+
+    # The first cycle started on 15th Shevat 5740.
+    START_FIRST_YEAR = AbsTime(299417, 6, 6, 0)
+    PAGES = (None,) + tuple(dapim for _, dapim in VILNA_DAPIM)
+    SKIPS_DAYS = True
+    BEFORE_FIRST_CYCLE = DateBeforeYerushalmiYomi
+
+    @classmethod
+    def month_class(cls):
+        return YerushalmiTractate
+
+    @classmethod
+    def skip_days(cls, start, days):
+        """Return the days in a range that are Yom Kippur or Tisha B'Av
+        (which is postponed to Sunday if the 9th of Av is Shabbos)."""
+        first = Date(HebrewYear, start).year.value
+        last = Date(HebrewYear, start + (days - 1) * DAY).year.value
+        result = []
+        for value in range(first, last + 1):
+            year = HebrewYear(value)
+            tisha_bav = year.day_start(HebrewMonth.AV, 9)
+            if tisha_bav.days == Weekday.SATURDAY:
+                tisha_bav = year.day_start(HebrewMonth.AV, 10)
+            for day in (year.day_start(HebrewMonth.TISHRI, 10), tisha_bav):
+                offset = (day.weeks - start.weeks) * DAYS_IN_WEEK + \
+                    day.days - start.days
+                if 0 <= offset < days:
+                    result.append(offset)
+        return sorted(result)
@@ -24,8 +24,9 @@
 from __future__ import print_function
 
 import codecs
-import logging.config
 import sys
+import time
+import unicodedata
 from argparse import RawDescriptionHelpFormatter
 from datetime import datetime, timedelta
 try:
@@ -38,8 +39,7 @@ try:
     from functools import lru_cache
 except ImportError:
     from functools32 import lru_cache
-from bidi.algorithm import get_display
-from future.builtins import dict
+from future.builtins import dict, chr, range
 from future.utils import PY2
 from hbcal.configuration_utilities import (
     SingleConfigurationParameter,
@@ -51,24 +51,37 @@ from hbcal.configuration_utilities import (
     add_negatable_option,
     ArgumentParser)
 from hbcal.hebrew_calendar.date import Date, DateTime
-from hbcal.hebrew_calendar.daf_yomi import (DafYomiCycle, DateBeforeDafYomi,
-                                            SubTractate)
+from hbcal.hebrew_calendar.format_percent_string import format_all
+from hbcal.hebrew_calendar.daf_yomi import DafYomiCycle, SubTractate
+from hbcal.hebrew_calendar.yerushalmi_yomi import YerushalmiCycle
+from hbcal.hebrew_calendar.mishnah_yomit import MishnahYomitCycle
+from hbcal.hebrew_calendar.rambam_yomi import RambamCycle
+from hbcal.hebrew_calendar.study_cycle import (StudyCycle,
+                                               DateBeforeStudyCycle,
+                                               StudyBreak)
 from hbcal.hebrew_calendar.weekday import YOM
 from hbcal.hebrew_calendar.civil_year import (GregorianYear, JulianYear,
                                               BritishYear)
 from hbcal.hebrew_calendar.hebrew_year import HebrewYear
+from hbcal.hebrew_calendar.holidays import YearHolidays
 from hbcal.hebrew_calendar.hebrew_letters import HEBREW_LETTERS
 from hbcal.hebrew_calendar.abs_time import RelTime
 from hbcal.hebrew_calendar.gematria import to_letters
+from hbcal.hebrew_calendar.solar import Location, after_sunset
 from hbcal.ordinal import ordinal_suffix
+from hbcal.abbrev_set import AMBIGUOUS
 from hbcal.version import __version__
 
 OUTPUT_CLASSES = {"civil": BritishYear, "gregorian": GregorianYear,
                   "hebrew": HebrewYear, "julian": JulianYear,
-                  "daf": DafYomiCycle, "sedrah": HebrewYear,
-                  "omer": HebrewYear}
-CALENDAR_TYPES = frozenset(('civil', 'gregorian', 'hebrew', 'julian', 'daf'))
-DAFBIND_TYPES = [x for x in CALENDAR_TYPES if x != "daf"]
+                  "daf": DafYomiCycle, "yerushalmi": YerushalmiCycle,
+                  "mishnah": MishnahYomitCycle, "rambam": RambamCycle,
+                  "sedrah": HebrewYear, "omer": HebrewYear,
+                  "holiday": HebrewYear}
+CALENDAR_TYPES = frozenset(('civil', 'gregorian', 'hebrew', 'julian', 'daf',
+                            'yerushalmi', 'mishnah', 'rambam'))
+DAFBIND_TYPES = [x for x in CALENDAR_TYPES
+                 if not issubclass(OUTPUT_CLASSES[x], StudyCycle)]
 BASE_FORMAT = u'%{weekday_code} %{qualifier}d %B %{qualifier}Y'
 DATE_FORMAT = BASE_FORMAT + '{fmt}'
 MOLAD_FORMAT = BASE_FORMAT + u" %H:%M {conjunction}%-P {parts}{fmt}"
@@ -78,15 +91,22 @@ CHALAKIM = u"{CHET}{LAMED}{QOF}{YOD}{FINAL_MEM}".format(**HEBREW_LETTERS)
 ENGLISH_OMER_FORMAT = u"{count}{suffix} day of the omer"
 HEBREW_OMER_FORMAT = u"{YOM} {{count}} {BAOMER}".format(YOM=YOM, BAOMER=BAOMER)
 DAF_FORMAT = '%B %{qualifier}d{fmt}'
+# The name of a unit of a cycle with several pages a day includes the pages
+PORTION_FORMAT = '%{qualifier}B{fmt}'
 SEDRAH_FORMAT = u"{sedrah:{fmt}}"
+HOLIDAY_FORMAT = u"{holidays}"
 ENGLISH_TEMPLATES = {"civil": DATE_FORMAT, "gregorian": DATE_FORMAT,
                      "hebrew": DATE_FORMAT, "julian": DATE_FORMAT,
-                     "daf": DAF_FORMAT, "sedrah": SEDRAH_FORMAT,
-                     "omer": ENGLISH_OMER_FORMAT}
+                     "daf": DAF_FORMAT, "yerushalmi": DAF_FORMAT,
+                     "mishnah": PORTION_FORMAT, "rambam": PORTION_FORMAT,
+                     "sedrah": SEDRAH_FORMAT, "omer": ENGLISH_OMER_FORMAT,
+                     "holiday": HOLIDAY_FORMAT}
 HEBREW_TEMPLATES = {"civil": DATE_FORMAT, "gregorian": DATE_FORMAT,
                     "hebrew": DATE_FORMAT, "julian": DATE_FORMAT,
-                    "daf": DAF_FORMAT, "sedrah": SEDRAH_FORMAT,
-                    "omer": HEBREW_OMER_FORMAT}
+                    "daf": DAF_FORMAT, "yerushalmi": DAF_FORMAT,
+                    "mishnah": PORTION_FORMAT, "rambam": PORTION_FORMAT,
+                    "sedrah": SEDRAH_FORMAT, "omer": HEBREW_OMER_FORMAT,
+                    "holiday": HOLIDAY_FORMAT}
 FORMATS = ['normal', 'reverse', 'phonetics', 'html', 'gematria']
 
 
@@ -111,6 +131,7 @@ def get_config():
                                                           "civil"),))),
         ('sedrah', BinaryConfigurationParameter()),
         ('omer', BinaryConfigurationParameter()),
+        ('holiday', BinaryConfigurationParameter()),
         ('molad', BinaryConfigurationParameter()),
         ('israel', BinaryConfigurationParameter())])
 
@@ -121,6 +142,8 @@ def get_config():
         for key, value in parameters.items():
             value.parameter_found(key, section, config)
     if config.has_section('loggers'):
+        # logging is only imported if it is configured.
+        import logging.config
         logging.config.fileConfig(filename, disable_existing_loggers=True)
     return parameters
 
@@ -155,6 +178,40 @@ def format_month(month, fmt=None):
                                    else reformat(format(month, '#H'), fmt)))
 
 
+@lru_cache()
+def help_epilog(formats):
+    """Return the epilog of the help page, from the help template.
+
+    It is only built when help is output, and is cached for each set of
+    format options.
+
+    Parameters:
+        formats: A frozenset of output format options from the command line
+    """
+    fmt = '' if 'phonetics' in formats else '#H'
+    template_directory = path.join(path.dirname(path.realpath(__file__)),
+                                   'templates')
+    with codecs.open(path.join(template_directory, 'help'),
+                     encoding='utf-8') as help_file:
+        template = help_file.read()
+    return template.format(
+        civil_months=list_months(JulianYear),
+        hebrew_months=list_months(HebrewYear, formats),
+        tractates=list_months(DafYomiCycle, formats),
+        yerushalmi_tractates=list_months(YerushalmiCycle, formats),
+        mishnah_tractates=list_months(MishnahYomitCycle, formats),
+        rambam_sections=list_months(RambamCycle, formats),
+        fmt=fmt,
+        # In Python 3.4 we can use more **s to simplify this
+        Shekalim=DafYomiCycle.month_class().SHEKALIM,
+        Kinnim=format_month(SubTractate.KINNIM, formats),
+        Tamid=format_month(SubTractate.TAMID, formats),
+        Middos=format_month(SubTractate.MIDDOS, formats),
+        Meilah=format_month(DafYomiCycle.month_class().MEILAH, formats),
+        **{x.name(): format_month(x, formats)
+           for x in HebrewYear.month_class()})
+
+
 def parse_arguments(args, parameters):
     """Parse the command line arguments
 
@@ -187,25 +244,7 @@ def parse_arguments(args, parameters):
                        help="format for output of hebrew")
 
     fmt_args = fmt_parser.parse_known_args(args[1:])[0]
-    fmt = '' if 'phonetics' in fmt_args.format else '#H'
-    template_directory = path.join(path.dirname(path.realpath(__file__)),
-                                   'templates')
-    help_file = codecs.open(path.join(template_directory, 'help'),
-                            encoding='utf-8')
-    epilog = help_file.read().format(
-        civil_months=list_months(JulianYear),
-        hebrew_months=list_months(HebrewYear, fmt_args.format),
-        tractates=list_months(DafYomiCycle, fmt_args.format),
-        fmt=fmt,
-        # In Python 3.4 we can use more **s to simplify this
-        Shekalim=DafYomiCycle.month_class().SHEKALIM,
-        Kinnim=format_month(SubTractate.KINNIM, fmt_args.format),
-        Tamid=format_month(SubTractate.TAMID, fmt_args.format),
-        Middos=format_month(SubTractate.MIDDOS, fmt_args.format),
-        Meilah=format_month(DafYomiCycle.month_class().MEILAH,
-                            fmt_args.format),
-        **{x.name(): format_month(x, fmt_args.format)
-           for x in HebrewYear.month_class()})
+    formats = frozenset(fmt_args.format)
 
     # Parse command line arguments
     parser = ArgumentParser(prog=prog_name,
@@ -214,7 +253,7 @@ def parse_arguments(args, parameters):
                             description="""
 Convert a date to one or more other calendars.""",
                             usage="%(prog)s [options] [date [month [year]]]",
-                            epilog=epilog)
+                            epilog=lambda: help_epilog(formats))
 
     parser.add_argument('--version', action='version',
                         version="{name} {version}".
@@ -233,8 +272,8 @@ Convert a date to one or more other calendars.""",
     parser.add_argument("--dafbind", nargs=1, action=StoreRestrictiveSet,
                         choices=DAFBIND_TYPES, type=str.lower,
                         default=parameters['dafbind'].value,
-                        help="calendar to which daf yomi calendar should " +
-                        "be bound (see daf under Calendars)")
+                        help="calendar to which study cycles (e.g. daf " +
+                        "yomi) should be bound (see daf under Calendars)")
     add_negatable_option(parser, "-m", "--molad", parameters['molad'].value,
                          help="output date and time of molad for hebrew " +
                          "month containing input date")
@@ -243,9 +282,22 @@ Convert a date to one or more other calendars.""",
                          help="output current weekly sedrah")
     add_negatable_option(parser, "-O", "--omer", parameters['omer'].value,
                          help="output day of omer (if relevant)")
+    add_negatable_option(parser, "-H", "--holiday",
+                         parameters['holiday'].value,
+                         help="output festivals and special days " +
+                         "(if relevant)")
     add_negatable_option(parser, "-I", "--israel",
                          parameters['israel'].value,
-                         help="use Israel for sedrahs")
+                         help="use Israel for sedrahs and festivals")
+    parser.add_argument("--latitude", type=float,
+                        help="latitude (degrees north) for the start of " +
+                        "the current hebrew date (see Location)")
+    parser.add_argument("--longitude", type=float,
+                        help="longitude (degrees east) for the start of " +
+                        "the current hebrew date (see Location)")
+    parser.add_argument("--utcoffset", type=float,
+                        help="offset of local time from UTC (hours) " +
+                        "(see Location)")
     parser.add_argument("date", nargs="?", action="store", type=int,
                         help="day of the month (integer)")
     parser.add_argument("month", nargs="?", action="store",
@@ -255,6 +307,8 @@ Convert a date to one or more other calendars.""",
     args = parser.parse_args(args[1:])
     for arg in ["input", "dafbind"]:
         setattr(args, arg, next(iter(getattr(args, arg))))
+    if (args.latitude is None) != (args.longitude is None):
+        parser.error("--latitude and --longitude must be specified together")
 
     return args, parser
 
@@ -265,16 +319,38 @@ def get_date_time(atime, date_class):
     return DateTime(date_class, atime)
 
 
+def get_location(args):
+    """Return the location specified by the command line arguments.
+
+    If no UTC offset is specified, the current offset of the local time
+    zone is used."""
+    utcoffset = args.utcoffset
+    if utcoffset is None:
+        local = time.localtime()
+        try:
+            offset = local.tm_gmtoff
+        except AttributeError:
+            # Python 2 has no tm_gmtoff
+            offset = -(time.altzone if local.tm_isdst > 0 else time.timezone)
+        utcoffset = round(offset / 60.0) / 60
+    return Location(args.latitude, args.longitude, utcoffset)
+
+
 def input_time(args):
     """ Extracts an abs_time from input parameters """
 
     if args.year is None:
         # Use the current date (with supplied date and month if any)
         current_datetime = datetime.now()
-        # If Hebrew specified, add six hours
+        # If Hebrew specified, move to the next day after sunset (or 6pm if
+        # no location is specified)
         if (args.input == 'hebrew'
-                or (args.input == 'daf' and args.dafbind == "hebrew")):
-            current_datetime += timedelta(hours=6)
+                or (issubclass(OUTPUT_CLASSES[args.input], StudyCycle)
+                    and args.dafbind == "hebrew")):
+            if args.latitude is None:
+                current_datetime += timedelta(hours=6)
+            elif after_sunset(get_location(args), current_datetime):
+                current_datetime += timedelta(days=1)
         current_date = Date(GregorianYear(current_datetime.year),
                             current_datetime.month, current_datetime.day)
         if args.date is not None:
@@ -301,7 +377,7 @@ def input_time(args):
         atime = hebrew_date.date.year.molad(hebrew_date.date.month)
     else:
         if (input_date.year.__class__ == HebrewYear
-                or (input_date.year.__class__ == DafYomiCycle
+                or (isinstance(input_date.year, StudyCycle)
                     and args.dafbind == "hebrew")):
             atime += RelTime(0, hours=6)
     return atime
@@ -310,23 +386,58 @@ def input_time(args):
 def get_month_from_name(month_name, current_year):
     """Get the numerical value of a month from the supplied name"""
 
-    month = None
-    for allowed_month in current_year.months():
-        if allowed_month.__format__('#H').startswith(
-                month_name.decode(sys.stdin.encoding) if PY2 else month_name):
-            if month is None:
-                month = allowed_month.value
-            else:
-                raise ValueError("Ambiguous month")
+    # hbcal.parse is only imported if a month name is supplied.
+    from hbcal.parse import hebrew_month_trie
+    month = hebrew_month_trie(tuple(current_year.months())).find(
+        month_name.decode(sys.stdin.encoding) if PY2 else month_name)
+    if month is AMBIGUOUS:
+        raise ValueError("Ambiguous month")
     if month is None:
         raise ValueError("Invalid month")
-    return month
+    return month.value
+
+
+def _rtl_characters():
+    """ Return the characters that are displayed right to left in a line
+    with no left to right characters or numbers.
+
+    These are Hebrew letters and punctuation (bidirectional type R) and
+    ASCII characters with no direction of their own (e.g. spaces, commas
+    and parentheses)."""
+    return frozenset(
+        [chr(code) for code in range(0x590, 0x600)
+         if unicodedata.bidirectional(chr(code)) == 'R'] +
+        [chr(code) for code in range(0x20, 0x7F)
+         if unicodedata.bidirectional(chr(code)) in ('WS', 'ON', 'CS',
+                                                     'ES', 'ET')])
+
+
+RTL_CHARACTERS = _rtl_characters()
+MIRRORED_CHARACTERS = {ord(x): y for x, y in zip(u"()<>[]{}", u")(><][}{")}
+REFORMAT_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=REFORMAT_CACHE_SIZE)
+def reverse_line(line):
+    """ Reorder a line for display on a left to right terminal.
+
+    The line has a right to left base direction. If it only contains
+    right to left and neutral characters, every character is displayed
+    right to left, so the line is simply reversed (mirroring parentheses
+    and brackets). Otherwise, the full bidirectional algorithm is used.
+    Lines are cached, since the same lines (e.g. dates in the same
+    month) are often output repeatedly."""
+    if RTL_CHARACTERS.issuperset(line):
+        return line[::-1].translate(MIRRORED_CHARACTERS)
+    # bidi is only imported for the few lines that need it.
+    from bidi.algorithm import get_display
+    return get_display(line, base_dir='R')
 
 
 def reformat(line, formatting_options):
     """ Reformat a Hebrew line for bi-directional output or as html """
     if 'reverse' in formatting_options:
-        reformatted = get_display(line, base_dir='R')
+        reformatted = reverse_line(line)
     elif 'html' in formatting_options:
         reformatted = line.encode('ascii', 'xmlcharrefreplace').decode('ascii')
     else:
@@ -334,6 +445,124 @@ def reformat(line, formatting_options):
     return reformatted
 
 
+def is_hebrew_output(output_type):
+    """ Return True if output_type is output in Hebrew (unless the format
+    includes phonetics) """
+    output_class = OUTPUT_CLASSES[output_type]
+    return output_class == HebrewYear or issubclass(output_class, StudyCycle)
+
+
+def output_fields(value, output_type, israel=False, molad=False):
+    """ Return the information (other than the date itself) that is output
+    for a date.
+
+    Args:
+        value:          the date (DateTime)
+        output_type:    the type of output (a key of OUTPUT_CLASSES)
+        israel:         True for Israel, False for the Diaspora
+        molad:          True if the molad is output
+
+    Returns:
+        The sedrah (for 'sedrah'), the day of the omer or None (for 'omer'),
+        a list of holidays (for 'holiday') or None.
+    """
+    date = value.date
+    if molad:
+        return None
+    if output_type == 'sedrah':
+        return date.year.sedrah(date.month, date.date, israel)
+    if output_type == 'omer':
+        return date.year.omer_day(date.month, date.date)
+    if output_type == 'holiday':
+        return YearHolidays(date.year, israel).holidays(date.month,
+                                                        date.date)
+    return None
+
+
+def output_template(output_type, formatting_options, fields, molad=False):
+    """ Return the formatting string for a date.
+
+    Args:
+        output_type:        the type of output (a key of OUTPUT_CLASSES)
+        formatting_options: the format options (e.g. ['gematria'])
+        fields:             the result of output_fields for the date
+        molad:              True if the molad is output
+
+    Returns:
+        The formatting string, or None if there is nothing to output (e.g.
+        the date is not in the omer).
+    """
+    if (is_hebrew_output(output_type)
+            and 'phonetics' not in formatting_options):
+        template = HEBREW_TEMPLATES[output_type]
+        params = {
+            'fmt': '#H',
+            'conjunction': VAV,
+            'parts': CHALAKIM
+        }
+    else:
+        template = ENGLISH_TEMPLATES[output_type]
+        params = {
+            'fmt': '',
+            'conjunction': 'and ',
+            'parts': 'parts'
+        }
+    if ((output_type in ("hebrew", "omer")
+         or issubclass(OUTPUT_CLASSES[output_type], StudyCycle))
+            and 'gematria' in formatting_options):
+        params['qualifier'] = '~'
+        params['weekday_code'] = 'a'
+        params['conjunction'] = ''
+    else:
+        params['qualifier'] = '-'
+        params['weekday_code'] = 'A'
+    if molad:
+        template = MOLAD_FORMAT
+    elif output_type == 'sedrah':
+        params['sedrah'] = fields
+    elif output_type == 'omer':
+        if fields is None:
+            return None
+        params['suffix'] = ordinal_suffix(fields)
+        params['count'] = (to_letters(fields) if params['qualifier'] == '~'
+                           else fields)
+    elif output_type == 'holiday':
+        if not fields:
+            return None
+        params['holidays'] = u", ".join(
+            format(x, params['fmt']) for x in fields)
+    return template.format(**params)
+
+
+def render_all(value, output_type, formats, israel=False, molad=False):
+    """ Render a date with several sets of format options.
+
+    The sedrah, omer or holidays of the date are found once, and each field
+    of the date (e.g. the weekday or month name) is only formatted once for
+    all the renderings that use it (see format_all).
+
+    Args:
+        value:          the date (DateTime)
+        output_type:    the type of output (a key of OUTPUT_CLASSES)
+        formats:        a sequence of lists of format options, e.g.
+                        [['normal'], ['gematria'], ['html']]
+        israel:         True for Israel, False for the Diaspora
+        molad:          True if the molad is output
+
+    Returns:
+        A list with a line for each list of format options (None if there
+        is nothing to output).
+    """
+    fields = output_fields(value, output_type, israel, molad)
+    templates = [output_template(output_type, options, fields, molad)
+                 for options in formats]
+    lines = iter(format_all(value, [x for x in templates if x is not None]))
+    hebrew_output = is_hebrew_output(output_type)
+    return [None if template is None
+            else reformat(next(lines), options if hebrew_output else [])
+            for template, options in zip(templates, formats)]
+
+
 def get_output_line(argv):
     """Generator that returns lines of output as unicode strings.
 
@@ -349,57 +578,17 @@ def get_output_line(argv):
         parser.error("Invalid date")
 
     for output_type in chain(args.output,
-                             [x for x in ['sedrah', 'omer']
+                             [x for x in ['sedrah', 'omer', 'holiday']
                               if getattr(args, x)]):
-        output_class = OUTPUT_CLASSES[output_type]
-        if (output_class in (HebrewYear, DafYomiCycle)
-                and 'phonetics' not in args.format):
-            template = HEBREW_TEMPLATES[output_type]
-            params = {
-                'fmt': '#H',
-                'conjunction': VAV,
-                'parts': CHALAKIM
-            }
-        else:
-            template = ENGLISH_TEMPLATES[output_type]
-            params = {
-                'fmt': '',
-                'conjunction': 'and ',
-                'parts': 'parts'
-            }
-        if (output_type in ("hebrew", "daf", "omer")
-                and 'gematria' in args.format):
-            params['qualifier'] = '~'
-            params['weekday_code'] = 'a'
-            params['conjunction'] = ''
-        else:
-            params['qualifier'] = '-'
-            params['weekday_code'] = 'A'
         try:
             value = get_date_time(atime, OUTPUT_CLASSES[output_type])
-            if args.molad:
-                template = MOLAD_FORMAT
-            else:
-                if output_type == 'sedrah':
-                    params['sedrah'] = value.date.year.sedrah(value.date.month,
-                                                              value.date.date,
-                                                              args.israel)
-                elif output_type == 'omer':
-                    omer = value.date.year.omer_day(value.date.month,
-                                                    value.date.date)
-                    if omer is None:
-                        continue
-                    params['suffix'] = ordinal_suffix(omer)
-                    if params['qualifier'] == '~':
-                        omer = to_letters(omer).format(**HEBREW_LETTERS)
-                    params['count'] = omer
-            yield reformat(format(value, template.format(**params)),
-                           args.format if output_class in (HebrewYear,
-                                                           DafYomiCycle)
-                           else [])
-        except DateBeforeDafYomi:
+            line, = render_all(value, output_type, [args.format],
+                               args.israel, args.molad)
+        except (DateBeforeStudyCycle, StudyBreak):
             # Just skip this output format
-            pass
+            continue
+        if line is not None:
+            yield line
 
 
 def main(argv=None):
@@ -0,0 +1,322 @@
+"""This module parses free-form date strings, in English or Hebrew.
+
+The forms recognised are a date, a month name and a year (e.g.
+"15 Nissan 5785", "3 Sep 1752", or the same in Hebrew letters), and a
+tractate and a daf (e.g. "Berachos 12") for Daf Yomi. Month and tractate
+names may be abbreviated to any unambiguous prefix, and are looked up in
+prefix tries (PrefixTrie) built once, on first use. Numbers may be digits
+or Hebrew letters, and Hebrew month names may have the prefix Bet.
+
+Exports:
+    ParseError
+    DateParser
+    parse_date
+    parse_dates
+    month_trie
+    hebrew_month_trie
+    tractate_trie
+    sedrah_trie
+"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+from __future__ import absolute_import
+from datetime import date as civil_date
+import re
+try:
+    from functools import lru_cache
+except ImportError:
+    from functools32 import lru_cache
+
+from hbcal.abbrev_set import PrefixTrie, AMBIGUOUS
+from hbcal.hebrew_calendar.date import Date, BadDate
+from hbcal.hebrew_calendar.civil_year import (BritishYear, GregorianYear,
+                                              CivilMonth)
+from hbcal.hebrew_calendar.hebrew_year import (HebrewYear, HebrewMonth,
+                                               HEBREW_MONTH_NAMES, Sedrah,
+                                               SEDRAH_NAMES,
+                                               HEBREW_SEDRAH_NAMES)
+from hbcal.hebrew_calendar.daf_yomi import (DafYomiCycle, Tractate,
+                                            SubTractate, SUBTRACTATE_PAGES,
+                                            HEBREW_TRACTATE_NAMES,
+                                            HEBREW_SUBTRACTATE_NAMES)
+from hbcal.hebrew_calendar.gematria import (from_letters, GERESH_CHARACTERS,
+                                            GERSHAYIM_CHARACTERS)
+from hbcal.hebrew_calendar.hebrew_letters import HEBREW_LETTERS
+
+# A date, a month name (which may contain spaces) and a year
+DATE_PATTERN = re.compile(r"^\s*(\S+)\s+(.+?)\s+(\S+)\s*$", re.UNICODE)
+# A tractate name (which may contain spaces) and a daf
+DAF_PATTERN = re.compile(r"^\s*(.+?)\s+(\S+)\s*$", re.UNICODE)
+# A number in digits, with an optional English ordinal suffix
+DIGITS_PATTERN = re.compile(r"^(\d+)(?:st|nd|rd|th)?$",
+                            re.UNICODE | re.IGNORECASE)
+# Years (in digits) before the Hebrew year in which the civil era started
+# are taken to be civil years, if a month name is ambiguous
+CIVIL_YEAR_LIMIT = 3761
+
+# Other spellings of Hebrew months. Adar on its own is the only Adar of a
+# simple year, and Adar Rishon of a leap year.
+HEBREW_MONTH_SPELLINGS = {
+    u"Nisan": HebrewMonth.NISSAN,
+    u"Iyyar": HebrewMonth.IYAR,
+    u"Tamuz": HebrewMonth.TAMMUZ,
+    u"Elul": HebrewMonth.ELLUL,
+    u"Tishrei": HebrewMonth.TISHRI,
+    u"Heshvan": HebrewMonth.CHESHVAN,
+    u"Marcheshvan": HebrewMonth.CHESHVAN,
+    u"Kislev": HebrewMonth.KISLEV,
+    u"Tevet": HebrewMonth.TEVETH,
+    u"Shvat": HebrewMonth.SHEVAT,
+    u"Adar": HebrewMonth.ADAR_RISHON,
+    u"Adar I": HebrewMonth.ADAR_RISHON,
+    u"Adar II": HebrewMonth.ADAR_SHENI,
+    HEBREW_MONTH_NAMES[HebrewMonth.ADAR_RISHON].split(" ", 1)[0]:
+    HebrewMonth.ADAR_RISHON}
+
+# Hebrew names may start with Bet (in)
+HEBREW_PREFIX = HEBREW_LETTERS['BET']
+
+# Characters that are treated as the same in names
+_NAME_TRANSLATION = dict(
+    [(ord(x), HEBREW_LETTERS['GERESH']) for x in GERESH_CHARACTERS] +
+    [(ord(x), HEBREW_LETTERS['GERSHAYIM']) for x in GERSHAYIM_CHARACTERS] +
+    [(ord(x), u" ") for x in u"_-"])
+
+
+def normalise_name(name):
+    """ Return a name in the form used as a key of the tries: lower case,
+    with single spaces between words, and with apostrophes and quotation
+    marks replaced by geresh and gershayim. """
+    return u" ".join(name.translate(_NAME_TRANSLATION).lower().split())
+
+
+def _trie(names):
+    """ Return a PrefixTrie of names (and of Hebrew names with the prefix
+    Bet), from an iterable of tuples comprising a name and its value. A
+    name that starts other names (e.g. Vayyakhel) finds its own value. """
+    trie = PrefixTrie(exact_first=True)
+    for name, value in names:
+        name = normalise_name(name)
+        trie[name] = value
+        if name[0] in HEBREW_LETTERS.values():
+            trie[HEBREW_PREFIX + name] = value
+    return trie
+
+
+@lru_cache(maxsize=None)
+def month_trie(civil=False):
+    """ Return a PrefixTrie of the names of civil months (if civil) or of
+    the English and Hebrew names of Hebrew months. The values are
+    CivilMonths or HebrewMonths.
+
+    The names are in separate tries, as some abbreviations (e.g. Mar) are
+    of both a civil and a Hebrew month. """
+    if civil:
+        return _trie((month.name(), month) for month in CivilMonth)
+    return _trie(
+        [(month.name(), month) for month in HebrewMonth] +
+        [(HEBREW_MONTH_NAMES[month], month) for month in HebrewMonth] +
+        list(HEBREW_MONTH_SPELLINGS.items()))
+
+
+@lru_cache(maxsize=None)
+def hebrew_month_trie(months):
+    """ Return a PrefixTrie of the names (in Hebrew letters, as given) of a
+    tuple of HebrewMonths (e.g. the months of a year). The values are
+    HebrewMonths. """
+    return PrefixTrie((format(month, '#H'), month) for month in months)
+
+
+@lru_cache(maxsize=None)
+def tractate_trie():
+    """ Return a PrefixTrie of the English and Hebrew names of tractates
+    and of the parts of Meilah. The values are Tractates and
+    SubTractates. """
+    return _trie(
+        [(tractate.name(), tractate) for tractate in Tractate] +
+        [(HEBREW_TRACTATE_NAMES[tractate], tractate)
+         for tractate in Tractate] +
+        [(part.name, part) for part in SubTractate] +
+        [(HEBREW_SUBTRACTATE_NAMES[part.value], part)
+         for part in SubTractate])
+
+
+@lru_cache(maxsize=None)
+def sedrah_trie():
+    """ Return a PrefixTrie of the English and Hebrew names of sedrahs
+    (including combined sedrahs). The values are Sedrahs. """
+    return _trie(
+        [(SEDRAH_NAMES[sedrah], sedrah) for sedrah in Sedrah] +
+        [(HEBREW_SEDRAH_NAMES[sedrah], sedrah) for sedrah in Sedrah])
+
+
+def parse_number(token):
+    """ Return the value of a number in digits or Hebrew letters, or None if
+    token is not a number. """
+    match = DIGITS_PATTERN.match(token)
+    if match is not None:
+        return int(match.group(1))
+    try:
+        return from_letters(token)
+    except ValueError:
+        return None
+
+
+class ParseError(ValueError):
+    """An exception class for a string that is not a valid date.
+
+    Attributes:
+        text:   The string
+        reason: Why it is not a valid date
+        index:  The position of the string in the input of parse_dates (or
+                None)
+    """
+
+    def __init__(self, text, reason, index=None):
+        super(ParseError, self).__init__(u"{0}: {1}".format(reason, text))
+        self.text = text
+        self.reason = reason
+        self.index = index
+
+
+class DateParser(object):
+    """ A parser of date strings.
+
+    Dates with civil month names are in civil_class. Dapim are in
+    daf_cycle (by default, the cycle in progress when the first daf is
+    parsed)."""
+
+    def __init__(self, civil_class=BritishYear, daf_cycle=None):
+        self.civil_class = civil_class
+        self.daf_cycle = daf_cycle
+
+    def parse(self, text):
+        """ Return the Date of a date string.
+
+        Raises:
+            ParseError if text is not a valid date.
+        """
+        error = None
+        match = DATE_PATTERN.match(text)
+        if match is not None:
+            date, name, year_token = match.groups()
+            date, year = parse_number(date), self._year(year_token)
+            if date is not None and year is not None:
+                month = self._month(name, year_token, year)
+                if month is AMBIGUOUS:
+                    error = u"Ambiguous month"
+                elif month is not None:
+                    return self._date(text, year, month, date)
+        match = DAF_PATTERN.match(text)
+        if match is not None:
+            name, daf = match.groups()
+            daf = parse_number(daf)
+            if daf is not None:
+                tractate = tractate_trie().find(normalise_name(name))
+                if tractate is AMBIGUOUS:
+                    error = error or u"Ambiguous tractate"
+                elif tractate is not None:
+                    return self._daf(text, tractate, daf)
+        raise ParseError(text, error or u"Unrecognised date")
+
+    @staticmethod
+    def _year(token):
+        """ Return the value of a year, adding the thousands (5000) to a
+        year in Hebrew letters that has none. """
+        year = parse_number(token)
+        if year is not None and year < 1000 and \
+                DIGITS_PATTERN.match(token) is None:
+            year += 5000
+        return year
+
+    @staticmethod
+    def _month(name, year_token, year):
+        """ Return the month (a HebrewMonth or a CivilMonth) with a name,
+        AMBIGUOUS, or None if there is none.
+
+        A name of both a civil and a Hebrew month is of a civil month if
+        the year is in digits and before CIVIL_YEAR_LIMIT, and of a Hebrew
+        month otherwise. """
+        civil = year < CIVIL_YEAR_LIMIT and \
+            DIGITS_PATTERN.match(year_token) is not None
+        name = normalise_name(name)
+        month = month_trie(civil).find(name)
+        if month is None:
+            month = month_trie(not civil).find(name)
+        return month
+
+    def _date(self, text, year, month, date):
+        year_class = HebrewYear if isinstance(month, HebrewMonth) \
+            else self.civil_class
+        try:
+            return Date(year_class(year), month, date)
+        except BadDate as exc:
+            raise ParseError(text, u"Invalid date ({0})".format(
+                exc.__class__.__name__))
+
+    def _daf(self, text, tractate, daf):
+        if self.daf_cycle is None:
+            today = civil_date.today()
+            self.daf_cycle = Date(DafYomiCycle, Date(
+                GregorianYear(today.year), today.month,
+                today.day).day_start).year.value
+        if isinstance(tractate, SubTractate):
+            first, last = SUBTRACTATE_PAGES[tractate]
+            if not first <= daf <= last:
+                raise ParseError(text, u"Invalid daf")
+            tractate = Tractate.MEILAH
+        try:
+            return Date(DafYomiCycle(self.daf_cycle), tractate, daf)
+        except BadDate as exc:
+            raise ParseError(text, u"Invalid daf ({0})".format(
+                exc.__class__.__name__))
+
+    def parse_many(self, texts):
+        """ Parse date strings one at a time.
+
+        Args:
+            texts:  An iterable of date strings (e.g. the lines of a file)
+
+        Yields:
+            A Date for each valid string, and a ParseError (with its index)
+            for each invalid string.
+        """
+        for index, text in enumerate(texts):
+            try:
+                yield self.parse(text)
+            except ParseError as exc:
+                exc.index = index
+                yield exc
+
+
+def parse_date(text, civil_class=BritishYear, daf_cycle=None):
+    """ Return the Date of a date string (see DateParser).
+
+    Raises:
+        ParseError if text is not a valid date.
+    """
+    return DateParser(civil_class, daf_cycle).parse(text)
+
+
+def parse_dates(texts, civil_class=BritishYear, daf_cycle=None):
+    """ Parse date strings one at a time (see DateParser.parse_many).
+
+    Yields:
+        A Date for each valid string, and a ParseError for each invalid
+        string.
+    """
+    return DateParser(civil_class, daf_cycle).parse_many(texts)
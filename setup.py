@@ -98,6 +98,7 @@ if __name__ == "__main__":
               python_requires='>=2.7, !=3.0.*, !=3.1.*, !=3.2.*',
               entry_points={'console_scripts': ['hbcal = hbcal.main:main']},
               install_requires=install_requires(),
+              extras_require={'solar': ['numpy']},
               tests_require=['freezegun'],
               test_suite='tests')
     else:
@@ -0,0 +1,99 @@
+"""Tests for AbbrevSet and PrefixTrie"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from hbcal.abbrev_set import (AbbrevSet, PrefixTrie, AmbiguousKeyError,
+                              AMBIGUOUS)
+
+
+class TestPrefixTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = PrefixTrie([('march', 3), ('may', 5), ('mayday', 0),
+                                ('june', 6), ('jun', 6)])
+
+    def test_unique_prefix(self):
+        self.assertEqual(3, self.trie['mar'])
+
+    def test_ambiguous_prefix(self):
+        with self.assertRaises(AmbiguousKeyError):
+            self.trie['ma']
+        self.assertIs(AMBIGUOUS, self.trie.find('ma'))
+
+    def test_missing_prefix(self):
+        with self.assertRaises(KeyError):
+            self.trie['april']
+        self.assertIsNone(self.trie.find('april'))
+
+    def test_exact_key_ambiguous(self):
+        with self.assertRaises(AmbiguousKeyError):
+            self.trie['may']
+        self.assertEqual(0, self.trie['mayd'])
+
+    def test_exact_first(self):
+        trie = PrefixTrie([('may', 5), ('mayday', 0)], exact_first=True)
+        self.assertEqual(5, trie['may'])
+        self.assertEqual(0, trie['mayd'])
+        self.assertIs(AMBIGUOUS, trie.find('ma'))
+
+    def test_same_value_not_ambiguous(self):
+        self.assertEqual(6, self.trie['j'])
+
+    def test_contains(self):
+        self.assertIn('mar', self.trie)
+        self.assertNotIn('ma', self.trie)
+        self.assertNotIn('x', self.trie)
+
+    def test_len(self):
+        self.assertEqual(5, len(self.trie))
+
+    def test_change_value(self):
+        with self.assertRaises(ValueError):
+            self.trie['may'] = 6
+
+
+class TestAbbrevSet(unittest.TestCase):
+
+    def setUp(self):
+        self.set1 = AbbrevSet(['civil', 'gregorian', 'hebrew', 'julian'])
+
+    def test_lookup(self):
+        self.assertEqual('gregorian', self.set1['g'])
+        self.assertIn('heb', self.set1)
+
+    def test_missing(self):
+        with self.assertRaises(KeyError):
+            self.set1['daf']
+        self.assertNotIn('daf', self.set1)
+
+    def test_exact_key_ambiguous(self):
+        self.set1.add('hebrew date')
+        with self.assertRaises(AmbiguousKeyError):
+            self.set1['hebrew']
+        self.assertNotIn('hebrew', self.set1)
+
+    def test_changed(self):
+        self.set1.add('greek')
+        with self.assertRaises(AmbiguousKeyError):
+            self.set1['g']
+        self.set1.discard('gregorian')
+        self.assertEqual('greek', self.set1['g'])
+
+
+if __name__ == "__main__":
+    unittest.main()
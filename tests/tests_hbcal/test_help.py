@@ -23,7 +23,8 @@ from future.utils import PY2
 import sys
 import unittest
 import logging
-from .utilities import hbcal
+from hbcal.main import help_epilog
+from .utilities import hbcal, TestCase
 # Python 2 also supports io.StringIO, but it would not simulate the bug
 # (see http://bugs.python.org/issue9779, fixed in configuration_utilities).
 if PY2:
@@ -50,5 +51,18 @@ class TestHelp(unittest.TestCase):
                 sys.stdout = stdout_save
 
 
+class TestHelpEpilog(TestCase):
+    def test_not_built_without_help(self):
+        help_epilog.cache_clear()
+        hbcal("hbcal -ig 3 8 2019")
+        self.assertEqual(0, help_epilog.cache_info().currsize)
+
+    def test_cached_per_format(self):
+        help_epilog.cache_clear()
+        epilog = help_epilog(frozenset(['reverse']))
+        self.assertIs(epilog, help_epilog(frozenset(['reverse'])))
+        self.assertIsNot(epilog, help_epilog(frozenset(['phonetics'])))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,165 @@
+""" Tests for '--[no]holiday' and 'holiday'.
+
+This module contains tests for the '--holiday' and '--noholiday' command line
+options and for the 'holiday' configuration file option.
+"""
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import logging
+import sys
+
+from hbcal.configuration_utilities import (
+        ConfigurationParameterAmbiguousError,
+        ConfigurationParameterValueError)
+from .utilities import ConfigurationData, TestCase, hbcal
+
+# Test discovery uses setUpModule, but pylint does not know that.
+# pylint: disable=unused-import
+from .utilities import set_up_module as setUpModule  # noqa
+# pylint: enable=unused-import
+
+logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+
+
+class TestNoConfigFile(TestCase):
+    """Test command line "--[no]holiday" option with no configuration file."""
+
+    def test_default(self):
+        """Test default value of --[no]holiday option."""
+        output = hbcal("hbcal -ih -o -fphonetics 15 1 5785")
+        self.assertEqual(0, len(output))
+
+    def test_holiday_option(self):
+        """Test --holiday option."""
+        output = hbcal("hbcal -ih -o --holiday -fphonetics 15 1 5785")
+        self.assertEqual(1, len(output))
+        self.assertEqual('Yom Tov', output[0])
+
+    def test_noholiday_option(self):
+        """Test --noholiday option."""
+        output = hbcal("hbcal -ih -o --noholiday -fphonetics 15 1 5785")
+        self.assertEqual(0, len(output))
+
+    def test_not_holiday(self):
+        """Test --holiday option on an ordinary weekday."""
+        output = hbcal("hbcal -ih -o --holiday -fphonetics 8 1 5785")
+        self.assertEqual(0, len(output))
+
+    def test_several_holidays(self):
+        """Test --holiday option for Shabbat Rosh Chodesh Adar."""
+        output = hbcal("hbcal -ih -o --holiday -fphonetics 1 12 5785")
+        self.assertEqual(1, len(output))
+        self.assertEqual('Rosh Chodesh, Shabbat Shekalim', output[0])
+
+    def test_israel(self):
+        """Test --holiday option with --israel."""
+        output = hbcal("hbcal -ih -o --holiday --israel -fphonetics 16 1 5785")
+        self.assertEqual(1, len(output))
+        self.assertEqual('Chol Hamoed', output[0])
+
+    def test_hebrew(self):
+        """Test --holiday option with Hebrew output."""
+        output = hbcal("hbcal -ih -o --holiday 10 7 5785")
+        self.assertEqual(1, len(output))
+        self.assertEqual(u'\u05d9\u05d5\u05dd \u05d8\u05d5\u05d1, '
+                         u'\u05ea\u05e2\u05e0\u05d9\u05ea', output[0])
+
+    def test_holiday_short_option(self):
+        """Test -H option."""
+        output = hbcal("hbcal -ih -o -H -fphonetics 15 1 5785")
+        self.assertEqual(1, len(output))
+        self.assertEqual('Yom Tov', output[0])
+
+
+class TestEmptyConfigFile(TestNoConfigFile):
+    """Test "--[no]holiday" option with empty configuration file."""
+
+    config_data = ConfigurationData.EMPTY
+
+
+class TestEmptySectionConfigFile(TestNoConfigFile):
+    """Test configuration file with empty hbcal section."""
+
+    config_data = ""
+
+
+class TestHolidayTrueInConfigFile(TestNoConfigFile):
+    """Test "holiday = true" in configuration file."""
+
+    config_data = "holiday = true"
+
+    def test_default(self):
+        output = hbcal("hbcal -ih -o -fphonetics 15 1 5785")
+        self.assertEqual(1, len(output))
+        self.assertEqual('Yom Tov', output[0])
+
+
+class TestHolidayYesInConfigFile(TestHolidayTrueInConfigFile):
+    """Test "holiday = yes" in configuration file."""
+
+    config_data = "holiday = yes"
+
+
+class TestHolidayFalseInConfigFile(TestNoConfigFile):
+    """Test "holiday = false" in configuration file."""
+
+    config_data = "holiday = false"
+
+
+class TestHolidayNoInConfigFile(TestHolidayFalseInConfigFile):
+    """Test "holiday = no" in configuration file."""
+
+    config_data = "holiday = no"
+
+
+class TestMixedCase(TestHolidayTrueInConfigFile):
+    """Test "holiday = trUe" (mixed case) in configuration file."""
+
+    config_data = "holiday = trUe"
+
+
+class TestAbbreviated(TestHolidayYesInConfigFile):
+    """Test "holiday = y" in configuration file."""
+
+    config_data = "holiday = y"
+
+
+class TestAbbreviatedTooMuch(TestCase):
+    """Test "holiday =" (too abbreviated) in configuration file."""
+
+    config_data = "holiday ="
+
+    def test_default(self):
+        """Test default value of --[no]holiday option."""
+        with self.assertRaises(ConfigurationParameterAmbiguousError):
+            hbcal("hbcal -ih -o -fphonetics 15 1 5785")
+
+
+class InvalidValue(TestCase):
+    """Test "holiday = tree" (invalid) in the configuration file."""
+
+    config_data = "holiday = tree"
+
+    def test_default(self):
+        """Test default value of --[no]holiday option."""
+        with self.assertRaises(ConfigurationParameterValueError):
+            hbcal("hbcal -ih -o -fphonetics 15 1 5785")
+
+
+if __name__ == "__main__":
+    unittest.main()
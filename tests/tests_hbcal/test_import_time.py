@@ -0,0 +1,112 @@
+"""Tests for the time taken to import hbcal for conversions.
+
+Each import is measured in a new interpreter. The command line interface
+and its dependencies must not be imported, and the import must be within
+the budget.
+"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import hbcal
+
+# The maximum time (seconds) for importing the calendar modules. It is
+# generous, to allow for slow machines; the best of several runs is used.
+IMPORT_TIME_BUDGET = 0.3
+RUNS = 3
+LAZY_MODULES = ('hbcal.main', 'argparse', 'bidi', 'configparser',
+                'logging')
+
+SCRIPT = """
+import json, sys, time
+start = time.time()
+import hbcal
+import hbcal.hebrew_calendar.hebrew_year
+import hbcal.hebrew_calendar.daf_yomi
+elapsed = time.time() - start
+print(json.dumps([elapsed, sorted(sys.modules)]))
+"""
+
+# The types of hbcal.get_output_line and then hbcal.main, after the
+# hbcal.main module is imported
+MAIN_SCRIPT = """
+import json, types
+import hbcal.main
+print(json.dumps([isinstance(hbcal.get_output_line, types.FunctionType),
+                  isinstance(hbcal.main, types.FunctionType)]))
+"""
+
+
+def run(script):
+    """ Run a script, which outputs JSON, in a new interpreter.
+
+    Returns:
+        The value output by the script.
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.path.dirname(os.path.dirname(
+        os.path.abspath(hbcal.__file__)))
+    output = subprocess.check_output([sys.executable, '-c', script],
+                                     env=env)
+    return json.loads(output.decode('utf-8'))
+
+
+def measure():
+    """ Import the calendar modules in a new interpreter.
+
+    Returns:
+        A tuple comprising the time taken (seconds) and a list of the
+        modules imported.
+    """
+    return tuple(run(SCRIPT))
+
+
+@unittest.skipIf(sys.version_info < (3, 7),
+                 "hbcal is imported lazily from Python 3.7")
+class TestImportTime(unittest.TestCase):
+
+    def test_lazy_modules(self):
+        _, modules = measure()
+        for name in LAZY_MODULES:
+            self.assertNotIn(name, modules)
+
+    def test_budget(self):
+        elapsed = min(measure()[0] for _ in range(RUNS))
+        self.assertLess(elapsed, IMPORT_TIME_BUDGET)
+
+
+class TestLazyMain(unittest.TestCase):
+
+    def test_main_is_function(self):
+        self.assertTrue(callable(hbcal.main))
+        self.assertTrue(callable(hbcal.get_output_line))
+
+    def test_main_after_module_import(self):
+        self.assertEqual([True, True], run(MAIN_SCRIPT))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            hbcal.no_such_attribute
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+""" Tests for '--latitude', '--longitude' and '--utcoffset'.
+
+This module contains tests for the options that determine when the current
+hebrew date starts.
+"""
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import sys
+import time
+import warnings
+from argparse import Namespace
+from freezegun import freeze_time
+import unittest
+from hbcal.main import get_location
+from .utilities import TestCase, hbcal
+
+# Test discovery uses setUpModule, but pylint does not know that.
+# pylint: disable=unused-import
+from .utilities import set_up_module as setUpModule  # noqa
+# pylint: enable=unused-import
+
+logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+JERUSALEM = "--latitude 31.778 --longitude 35.235 --utcoffset 2"
+
+
+@freeze_time("2010-01-01 16:50:00")
+class TestAfterSunset(TestCase):
+    """Tests run after sunset in Jerusalem, but before 6pm."""
+
+    def test_no_location(self):
+        output = hbcal("hbcal -ih -fphonetics")
+        self.assertEqual({'Friday 1 January 2010', 'Friday 15 Teveth 5770'},
+                         set(output))
+
+    def test_location(self):
+        output = hbcal("hbcal -ih -fphonetics " + JERUSALEM)
+        self.assertEqual({'Saturday 2 January 2010',
+                          'Saturday 16 Teveth 5770'}, set(output))
+
+    def test_daf_hebrew(self):
+        output = hbcal("hbcal -id --dafbind hebrew -fphonetics " + JERUSALEM)
+        self.assertEqual({'Saturday 2 January 2010',
+                          'Saturday 16 Teveth 5770'}, set(output))
+
+    def test_civil_input(self):
+        output = hbcal("hbcal -ic -fphonetics " + JERUSALEM)
+        self.assertEqual({'Friday 1 January 2010', 'Friday 15 Teveth 5770'},
+                         set(output))
+
+
+@freeze_time("2010-01-01 16:40:00")
+class TestBeforeSunset(TestCase):
+    """Tests run before sunset in Jerusalem."""
+
+    def test_location(self):
+        output = hbcal("hbcal -ih -fphonetics " + JERUSALEM)
+        self.assertEqual({'Friday 1 January 2010', 'Friday 15 Teveth 5770'},
+                         set(output))
+
+
+@freeze_time("2010-06-21 19:00:00")
+class TestSummer(TestCase):
+    """Tests run after 6pm but before sunset in London."""
+
+    def test_no_location(self):
+        output = hbcal("hbcal -ih -fphonetics")
+        self.assertEqual({'Tuesday 22 June 2010', 'Tuesday 10 Tammuz 5770'},
+                         set(output))
+
+    def test_location(self):
+        output = hbcal("hbcal -ih -fphonetics --latitude 51.5 "
+                       "--longitude -0.13 --utcoffset 1")
+        self.assertEqual({'Monday 21 June 2010', 'Monday 9 Tammuz 5770'},
+                         set(output))
+
+
+class TestLocalOffset(unittest.TestCase):
+    """Test the UTC offset used if --utcoffset is not specified."""
+
+    def test_local_offset(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            location = get_location(Namespace(
+                latitude=51.5, longitude=-0.13, utcoffset=None))
+        local = time.localtime()
+        offset = -(time.altzone if local.tm_isdst > 0 else time.timezone)
+        self.assertEqual(offset / 3600, location.utcoffset)
+
+
+class TestInvalid(TestCase):
+
+    def test_latitude_only(self):
+        with self.assertRaises(SystemExit):
+            hbcal("hbcal -ih --latitude 31.778")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -90,6 +90,22 @@ class TestNoConfigFile(TestCase):
         output = hbcal("hbcal -ic -o daf -fphonetics 17 8 2015")
         self.assertEqual(['Nedarim 85'], output)
 
+    def test_study_cycle_options_2015(self):
+        """Test --output with Yerushalmi Yomi, Mishnah Yomit and Rambam
+        Yomi calendars"""
+        output = hbcal("hbcal -ic -o yerushalmi mishnah rambam -fphonetics "
+                       "17 8 2015")
+        self.assertEqual(['Shabbos 85', 'Parah 7:11-12',
+                          'Nizkei Mamon 12-14'], output)
+
+    def test_yerushalmi_option_yom_kippur(self):
+        """Test --output with Yerushalmi Yomi on Yom Kippur.
+
+        No daf is output because none is studied on Yom Kippur.
+        """
+        output = hbcal("hbcal -ic -o civil yerushalmi -fphonetics 25 9 2023")
+        self.assertEqual(['Monday 25 September 2023'], output)
+
     def test_civil_hebrew_option_2015(self):
         """Test --output specifying civil and Hebrew after 1752."""
         output = hbcal("hbcal -ic -o civil hebrew -fphonetics 17 8 2015")
@@ -0,0 +1,133 @@
+"""Tests for parsing date strings"""
+
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+
+from hbcal.main import get_month_from_name
+from hbcal.parse import (parse_date, parse_dates, ParseError, sedrah_trie,
+                         normalise_name)
+from hbcal.hebrew_calendar.civil_year import (BritishYear, GregorianYear,
+                                              CivilMonth)
+from hbcal.hebrew_calendar.hebrew_year import (HebrewYear, HebrewMonth,
+                                               Sedrah)
+from hbcal.hebrew_calendar.daf_yomi import DafYomiCycle, Tractate
+
+
+class TestParseDate(unittest.TestCase):
+
+    def check(self, year_class, year, month, date, text, **kwargs):
+        result = parse_date(text, **kwargs)
+        self.assertIs(year_class, result.year.__class__)
+        self.assertEqual((year, month, date),
+                         (result.year.value, result.month, result.date))
+
+    def test_hebrew_month(self):
+        self.check(HebrewYear, 5785, HebrewMonth.NISSAN, 15,
+                   u"15 Nissan 5785")
+
+    def test_hebrew_letters(self):
+        self.check(HebrewYear, 5785, HebrewMonth.NISSAN, 15,
+                   u"\u05D8\u05F4\u05D5 \u05D1\u05E0\u05D9\u05E1\u05DF "
+                   u"\u05D4\u05F3\u05EA\u05E9\u05E4\u05F4\u05D4")
+
+    def test_year_without_thousands(self):
+        self.check(HebrewYear, 5784, HebrewMonth.ADAR_SHENI, 15,
+                   u"\u05D8\"\u05D5 \u05D0\u05D3\u05E8 \u05D1' "
+                   u"\u05EA\u05E9\u05E4\u05F4\u05D3")
+
+    def test_adar(self):
+        self.check(HebrewYear, 5784, HebrewMonth.ADAR_RISHON, 1,
+                   u"1 Adar 5784")
+        self.check(HebrewYear, 5784, HebrewMonth.ADAR_SHENI, 1,
+                   u"1 Adar II 5784")
+
+    def test_civil_abbreviation(self):
+        self.check(BritishYear, 1752, CivilMonth.SEPTEMBER, 2,
+                   u"2 Sep 1752")
+
+    def test_civil_class(self):
+        self.check(GregorianYear, 1752, CivilMonth.SEPTEMBER, 3,
+                   u"3rd September 1752", civil_class=GregorianYear)
+
+    def test_civil_or_hebrew_month(self):
+        self.check(BritishYear, 2024, CivilMonth.MARCH, 3, u"3 Mar 2024")
+        self.check(HebrewYear, 5785, HebrewMonth.CHESHVAN, 3,
+                   u"3 Mar 5785")
+
+    def test_missing_civil_date(self):
+        with self.assertRaises(ParseError):
+            parse_date(u"3 Sep 1752")
+
+    def test_ambiguous_month(self):
+        with self.assertRaises(ParseError) as context:
+            parse_date(u"1 Ju 2020")
+        self.assertEqual(u"Ambiguous month", context.exception.reason)
+
+    def test_daf(self):
+        self.check(DafYomiCycle, 14, Tractate.BERACHOS, 12,
+                   u"Berachos 12", daf_cycle=14)
+        self.check(DafYomiCycle, 13, Tractate.BAVA_KAMA, 5,
+                   u"bava k \u05D4", daf_cycle=13)
+
+    def test_part_of_meilah(self):
+        self.check(DafYomiCycle, 14, Tractate.MEILAH, 23, u"Kinnim 23",
+                   daf_cycle=14)
+        with self.assertRaises(ParseError):
+            parse_date(u"Kinnim 30", daf_cycle=14)
+
+    def test_ambiguous_tractate(self):
+        with self.assertRaises(ParseError) as context:
+            parse_date(u"Me 5", daf_cycle=14)
+        self.assertEqual(u"Ambiguous tractate", context.exception.reason)
+
+    def test_unrecognised(self):
+        with self.assertRaises(ParseError):
+            parse_date(u"15 Nissan")
+
+
+class TestParseDates(unittest.TestCase):
+
+    def test_stream(self):
+        results = list(parse_dates(iter([u"1 Av 5780\n", u"bad\n",
+                                         u"Shabbos 3\n"]), daf_cycle=14))
+        self.assertEqual(HebrewMonth.AV, results[0].month)
+        self.assertIsInstance(results[1], ParseError)
+        self.assertEqual((1, u"bad\n"), (results[1].index, results[1].text))
+        self.assertEqual(Tractate.SHABBOS, results[2].month)
+
+
+class TestNames(unittest.TestCase):
+
+    def test_sedrah(self):
+        self.assertIs(Sedrah.VAYYAKHEL,
+                      sedrah_trie()[normalise_name(u"Vayyakhel")])
+        self.assertIs(Sedrah.VAYYAKHEL_PEKUDEY,
+                      sedrah_trie()[normalise_name(u"vayyakhel-p")])
+
+    def test_month_of_simple_year(self):
+        self.assertEqual(HebrewMonth.ADAR_RISHON, get_month_from_name(
+            u"\u05D0\u05D3\u05E8", HebrewYear(5785)))
+
+    def test_month_of_leap_year(self):
+        with self.assertRaises(ValueError):
+            get_month_from_name(u"\u05D0\u05D3\u05E8", HebrewYear(5784))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+""" Tests for rendering a date with several sets of format options. """
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from hbcal.hebrew_calendar.civil_year import GregorianYear, CivilMonth
+from hbcal.hebrew_calendar.date import Date
+from hbcal.hebrew_calendar.hebrew_year import HebrewYear
+from hbcal.main import (CALENDAR_TYPES, OUTPUT_CLASSES, get_date_time,
+                        render_all)
+from .utilities import hbcal
+# Test discovery uses setUpModule, but pylint does not know that.
+# pylint: disable=unused-import
+from .utilities import set_up_module as setUpModule  # noqa
+
+# pylint: enable=unused-import
+
+FORMATS = [['normal'], ['gematria'], ['html'], ['reverse', 'gematria'],
+           ['phonetics']]
+
+
+class TestRenderAll(unittest.TestCase):
+    """Compare render_all with the output of hbcal for each format."""
+
+    def check(self, output_type, day, month, year):
+        atime = Date(GregorianYear(year), month, day).day_start
+        value = get_date_time(atime, OUTPUT_CLASSES[output_type])
+        expected = []
+        for options in FORMATS:
+            lines = hbcal("hbcal {0} {1} {2} -ig -o {3} -f {4}".format(
+                day, int(month), year,
+                output_type if output_type in CALENDAR_TYPES
+                else "hebrew --" + output_type,
+                " ".join(options)))
+            expected.append(lines[-1] if len(lines) > 1 or
+                            output_type in CALENDAR_TYPES else None)
+        self.assertEqual(expected,
+                         render_all(value, output_type, FORMATS))
+
+    def test_hebrew(self):
+        self.check('hebrew', 3, CivilMonth.AUGUST, 2019)
+
+    def test_daf(self):
+        self.check('daf', 3, CivilMonth.AUGUST, 2019)
+
+    def test_omer(self):
+        self.check('omer', 1, CivilMonth.MAY, 2024)
+
+    def test_no_omer(self):
+        self.check('omer', 3, CivilMonth.AUGUST, 2019)
+
+    def test_sedrah(self):
+        self.check('sedrah', 3, CivilMonth.AUGUST, 2019)
+
+    def test_hebrew_year(self):
+        value = get_date_time(
+            Date(HebrewYear(5779), 5, 2).day_start, HebrewYear)
+        normal, html = render_all(value, 'hebrew', [['normal'], ['html']])
+        self.assertEqual(normal.encode('ascii', 'xmlcharrefreplace')
+                         .decode('ascii'), html)
+
+
+if __name__ == "__main__":
+    unittest.main()
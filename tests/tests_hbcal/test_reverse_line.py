@@ -0,0 +1,73 @@
+""" Tests for reordering Hebrew lines for '--format reverse'.
+
+This module checks that reverse_line gives the same result as the
+bidirectional algorithm, both for lines that are only right to left (which
+are simply reversed) and for lines with numbers.
+"""
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from itertools import product
+
+from bidi.algorithm import get_display
+
+from hbcal.main import reverse_line
+from .utilities import TestCase, hbcal
+# Test discovery uses setUpModule, but pylint does not know that.
+# pylint: disable=unused-import
+from .utilities import set_up_module as setUpModule  # noqa
+
+# pylint: enable=unused-import
+
+
+class TestReverseLine(unittest.TestCase):
+    """Compare reverse_line with the bidirectional algorithm."""
+
+    def check(self, line):
+        self.assertEqual(get_display(line, base_dir='R'),
+                         reverse_line(line))
+
+    def test_right_to_left(self):
+        self.check(u"\u05E9\u05D1\u05EA \u05D1\u05F3 \u05D0\u05D1")
+
+    def test_parentheses(self):
+        self.check(u"\u05DE\u05E2\u05D9\u05DC\u05D4 (\u05E7\u05E0\u05D9"
+                   u"\u05DD/\u05EA\u05DE\u05D9\u05D3)")
+
+    def test_numbers(self):
+        self.check(u"\u05E9\u05D1\u05EA 2 \u05D0\u05D1 5779")
+
+    def test_latin(self):
+        self.check(u"\u05D0\u05D1 (Av) 5779")
+
+    def test_neutral_combinations(self):
+        for chars in product(u"\u05D0 ,(]-", repeat=4):
+            self.check(u"".join(chars))
+
+
+class TestReverseOption(TestCase):
+    """Test '--format reverse' for lines without numbers."""
+
+    def test_gematria(self):
+        output = hbcal("hbcal -ig --format reverse gematria -oh 3 8 2019")
+        self.assertEqual(u"\u05D8\u05F4\u05E2\u05E9\u05EA\u05F3\u05D4 "
+                         u"\u05D1\u05D0 \u05F3\u05D1 \u05EA\u05D1\u05E9",
+                         output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,13 +23,19 @@ Exports:
 # along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
 
 from past.builtins import basestring
+import atexit
 import os.path
+import shutil
+import tempfile
 import unittest
 from enum import Enum
 
 from hbcal import get_output_line
 
-DIRECTORY_NAME = os.path.join(os.getcwd(), 'home')
+# The configuration file is written in a temporary directory (removed on
+# exit), so that running the tests does not change the source tree.
+DIRECTORY_NAME = tempfile.mkdtemp(prefix='hbcal')
+atexit.register(shutil.rmtree, DIRECTORY_NAME, True)
 FILENAME = os.path.join(DIRECTORY_NAME, '.hbcal.config')
 
 
@@ -0,0 +1,96 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import logging
+import sys
+
+from hbcal.hebrew_calendar.almanac import CivilAlmanac, civil_almanac
+from hbcal.hebrew_calendar.civil_year import (CivilMonth, BritishYear,
+                                              GregorianYear)
+from hbcal.hebrew_calendar.daf_yomi import (DafYomiCycle, DateBeforeDafYomi,
+                                            Tractate)
+from hbcal.hebrew_calendar.date import Date, BadDate
+from hbcal.hebrew_calendar.hebrew_year import HebrewYear, HebrewMonth, Sedrah
+from hbcal.hebrew_calendar.weekday import Weekday
+
+logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+
+
+class TestAlmanac(unittest.TestCase):
+
+    def check(self, year, year_class, israel=False):
+        """Compare every day of an almanac with direct conversions."""
+        almanac = CivilAlmanac(year, year_class, israel)
+        day = Date(year_class(year), CivilMonth.JANUARY, 1)
+        count = 0
+        while day.year.value == year:
+            self.assertEqual(count, almanac.index(day.month, day.date))
+            hebrew = Date(HebrewYear, day.day_start)
+            self.assertEqual(hebrew, almanac.hebrew_date(day.month, day.date))
+            self.assertEqual(day.day_start.days,
+                             almanac.weekday(day.month, day.date))
+            self.assertEqual(hebrew.year.sedrah(hebrew.month, hebrew.date,
+                                                israel),
+                             almanac.sedrah(day.month, day.date))
+            try:
+                daf = Date(DafYomiCycle, day.day_start)
+            except DateBeforeDafYomi:
+                daf = None
+            self.assertEqual(daf, almanac.daf(day.month, day.date))
+            day = Date(year_class(day.year.value), day.month, day.date) + 1
+            count += 1
+        self.assertEqual(count, len(almanac))
+
+    def test_gregorian(self):
+        self.check(2024, GregorianYear)
+
+    def test_israel(self):
+        self.check(2024, GregorianYear, True)
+
+    def test_changeover(self):
+        self.check(1752, BritishYear)
+
+    def test_first_daf_yomi(self):
+        self.check(1923, BritishYear)
+
+    def test_late_daf_yomi_cycle(self):
+        # Cycle 128 (which does not fit in a signed byte) starts in 2870.
+        self.check(2870, GregorianYear)
+
+    def test_lookup(self):
+        almanac = CivilAlmanac(2024)
+        self.assertEqual(Date(HebrewYear(5784), HebrewMonth.TEVETH, 20),
+                         almanac.hebrew_date(CivilMonth.JANUARY, 1))
+        self.assertEqual(Weekday.MONDAY,
+                         almanac.weekday(CivilMonth.JANUARY, 1))
+        self.assertEqual(Sedrah.SHEMOTH,
+                         almanac.sedrah(CivilMonth.JANUARY, 1))
+        self.assertEqual(Date(DafYomiCycle(14), Tractate.BAVA_KAMA, 60),
+                         almanac.daf(CivilMonth.JANUARY, 1))
+
+    def test_bad_date(self):
+        with self.assertRaises(BadDate):
+            CivilAlmanac(1752).index(CivilMonth.SEPTEMBER, 10)
+
+    def test_cache(self):
+        self.assertIs(civil_almanac(2023), civil_almanac(2023))
+        self.assertIsNot(civil_almanac(2023),
+                         civil_almanac(2023, GregorianYear))
+
+
+if __name__ == '__main__':
+    unittest.main()
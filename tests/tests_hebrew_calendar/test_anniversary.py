@@ -0,0 +1,149 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import logging
+import sys
+
+from hbcal.hebrew_calendar.anniversary import (anniversaries,
+                                               iter_anniversaries,
+                                               AnniversaryRule, AdarRule,
+                                               ShortMonthRule, YAHRZEIT,
+                                               BIRTHDAY)
+from hbcal.hebrew_calendar.civil_year import GregorianYear
+from hbcal.hebrew_calendar.date import Date
+from hbcal.hebrew_calendar.hebrew_year import HebrewYear, HebrewMonth
+
+logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+
+
+def observed(date, year, rule):
+    """Return the observed Hebrew month and date of one anniversary."""
+    anniversary = anniversaries([date], year, rule)[0]
+    return anniversary.hebrew.month, anniversary.hebrew.date
+
+
+class TestAdar(unittest.TestCase):
+
+    def setUp(self):
+        # 5783 is a regular year, 5784 and 5787 are leap years.
+        self.adar = Date(HebrewYear(5783), HebrewMonth.ADAR_RISHON, 10)
+
+    def test_yahrzeit_in_leap_year(self):
+        self.assertEqual((HebrewMonth.ADAR_RISHON, 10),
+                         observed(self.adar, 5784, YAHRZEIT))
+
+    def test_birthday_in_leap_year(self):
+        self.assertEqual((HebrewMonth.ADAR_SHENI, 10),
+                         observed(self.adar, 5784, BIRTHDAY))
+
+    def test_regular_year(self):
+        self.assertEqual((HebrewMonth.ADAR_RISHON, 10),
+                         observed(self.adar, 5785, BIRTHDAY))
+
+    def test_adar_sheni(self):
+        date = Date(HebrewYear(5784), HebrewMonth.ADAR_SHENI, 14)
+        self.assertEqual((HebrewMonth.ADAR_RISHON, 14),
+                         observed(date, 5785, YAHRZEIT))
+        self.assertEqual((HebrewMonth.ADAR_SHENI, 14),
+                         observed(date, 5787, YAHRZEIT))
+
+    def test_30_adar_rishon(self):
+        date = Date(HebrewYear(5784), HebrewMonth.ADAR_RISHON, 30)
+        self.assertEqual((HebrewMonth.SHEVAT, 30),
+                         observed(date, 5785, YAHRZEIT))
+        self.assertEqual((HebrewMonth.NISSAN, 1),
+                         observed(date, 5785, BIRTHDAY))
+        self.assertEqual((HebrewMonth.ADAR_RISHON, 30),
+                         observed(date, 5787, YAHRZEIT))
+
+
+class TestShortMonth(unittest.TestCase):
+
+    def setUp(self):
+        # Cheshvan has 30 days in 5783, 5785, 5787 and 5788, but not in 5784,
+        # 5786 or 5789.
+        self.date = Date(HebrewYear(5783), HebrewMonth.CHESHVAN, 30)
+
+    def test_first_year_short(self):
+        # The first yahrzeit (5784) was on 29th Cheshvan
+        self.assertEqual((HebrewMonth.CHESHVAN, 29),
+                         observed(self.date, 5784, YAHRZEIT))
+        self.assertEqual((HebrewMonth.CHESHVAN, 30),
+                         observed(self.date, 5785, YAHRZEIT))
+        self.assertEqual((HebrewMonth.CHESHVAN, 29),
+                         observed(self.date, 5786, YAHRZEIT))
+
+    def test_first_year_long(self):
+        # The first yahrzeit (5788) was on 30th Cheshvan
+        date = Date(HebrewYear(5787), HebrewMonth.CHESHVAN, 30)
+        self.assertEqual((HebrewMonth.CHESHVAN, 30),
+                         observed(date, 5788, YAHRZEIT))
+        self.assertEqual((HebrewMonth.KISLEV, 1),
+                         observed(date, 5789, YAHRZEIT))
+
+    def test_roll_forward(self):
+        self.assertEqual((HebrewMonth.KISLEV, 1),
+                         observed(self.date, 5786, BIRTHDAY))
+
+    def test_last_day(self):
+        rule = AnniversaryRule(AdarRule.ADAR_RISHON, ShortMonthRule.LAST_DAY)
+        self.assertEqual((HebrewMonth.CHESHVAN, 29),
+                         observed(self.date, 5786, rule))
+
+
+class TestAnniversaries(unittest.TestCase):
+
+    def test_not_after_original_year(self):
+        date = Date(HebrewYear(5784), HebrewMonth.NISSAN, 1)
+        self.assertEqual([None], anniversaries([date], 5784))
+        self.assertEqual([None], anniversaries([date], 5783))
+
+    def test_civil_date(self):
+        date = Date(HebrewYear(5780), HebrewMonth.TEVETH, 4)
+        anniversary = anniversaries([date], 5785,
+                                    year_class=GregorianYear)[0]
+        self.assertEqual(Date(GregorianYear(2025), 1, 4), anniversary.civil)
+
+    def test_civil_original_date(self):
+        # 1 January 2020 was 4th Teveth 5780
+        date = Date(GregorianYear(2020), 1, 1)
+        anniversary = anniversaries([date], 5785)[0]
+        self.assertEqual((HebrewMonth.TEVETH, 4),
+                         (anniversary.hebrew.month, anniversary.hebrew.date))
+
+    def test_grouping(self):
+        dates = [Date(HebrewYear(year), HebrewMonth.IYAR, 5)
+                 for year in range(5700, 5780)]
+        result = anniversaries(dates, 5785)
+        self.assertEqual(len(dates), len(result))
+        for anniversary in result:
+            self.assertIs(result[0], anniversary)
+
+    def test_iter_anniversaries(self):
+        dates = [Date(HebrewYear(5783), HebrewMonth.CHESHVAN, 30),
+                 Date(HebrewYear(5785), HebrewMonth.SIVAN, 6)]
+        years = list(iter_anniversaries(dates, 5784, 5787))
+        self.assertEqual([5784, 5785, 5786], [year for year, _ in years])
+        for year, result in years:
+            self.assertEqual(anniversaries(dates, year), result)
+
+    def test_iter_empty_range(self):
+        self.assertEqual([], list(iter_anniversaries([], 5785, 5785)))
+
+
+if __name__ == '__main__':
+    unittest.main()
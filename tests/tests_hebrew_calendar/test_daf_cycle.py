@@ -20,8 +20,8 @@ import sys
 
 from hbcal.hebrew_calendar import date
 from hbcal.hebrew_calendar.daf_yomi import (DafYomiCycle, Tractate,
-                                            DateBeforeDafYomi)
-from hbcal.hebrew_calendar.abs_time import AbsTime
+                                            SubTractate, DateBeforeDafYomi)
+from hbcal.hebrew_calendar.abs_time import AbsTime, DAY
 
 logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 
@@ -39,6 +39,19 @@ class TestYearStart(unittest.TestCase):
     def test_ninth_cycle(self):
         self.assertEqual(AbsTime(299564, 4, 6, 0), DafYomiCycle(9).start)
 
+    def test_consecutive_cycles(self):
+        for value in range(1, 30):
+            cycle = DafYomiCycle(value)
+            self.assertEqual(cycle.start + cycle.duration(),
+                             DafYomiCycle(value + 1).start)
+
+    def test_change_value(self):
+        cycle = DafYomiCycle(20)
+        cycle.value = 3
+        self.assertEqual(DafYomiCycle(3).start, cycle.start)
+        cycle += 10
+        self.assertEqual(DafYomiCycle(13).start, cycle.start)
+
 
 class TestValidate(unittest.TestCase):
 
@@ -589,5 +602,72 @@ class TestDayStart(unittest.TestCase):
                                    Tractate.BERACHOS, 2).day_start)
 
 
+class TestDafLookup(unittest.TestCase):
+    def test_every_daf(self):
+        # Cycles 7 and 8 have different lengths.
+        for value in (7, 8):
+            daf = date.Date(DafYomiCycle(value), Tractate.BERACHOS, 2)
+            time = daf.day_start
+            for _ in range(DafYomiCycle(value).days_in_year()):
+                self.assertEqual(daf, date.Date(DafYomiCycle, time))
+                daf = date.Date(DafYomiCycle(daf.year.value), daf.month,
+                                daf.date) + 1
+                time += DAY
+
+
+class TestOccurrences(unittest.TestCase):
+    def test_bava_metzia(self):
+        occurrences = DafYomiCycle.occurrences(Tractate.BAVA_METZIA, 59, 14,
+                                               17)
+        self.assertEqual([14, 15, 16], [x.year.value for x in occurrences])
+        for occurrence in occurrences:
+            self.assertEqual(occurrence,
+                             date.Date(DafYomiCycle, occurrence.day_start))
+            self.assertEqual((Tractate.BAVA_METZIA, 59),
+                             (occurrence.month, occurrence.date))
+
+    def test_shekalim_edition(self):
+        occurrences = DafYomiCycle.occurrences(Tractate.SHEKALIM, 20, 1, 10)
+        self.assertEqual([8, 9], [x.year.value for x in occurrences])
+
+    def test_before_first_cycle(self):
+        self.assertEqual(1, len(DafYomiCycle.occurrences(Tractate.NIDAH, 73,
+                                                         -5, 2)))
+
+    def test_sub_tractate(self):
+        occurrences = DafYomiCycle.occurrences(SubTractate.MIDDOS, 35, 13, 15)
+        self.assertEqual([date.Date(DafYomiCycle(13), Tractate.MEILAH, 35),
+                          date.Date(DafYomiCycle(14), Tractate.MEILAH, 35)],
+                         occurrences)
+
+    def test_not_in_sub_tractate(self):
+        with self.assertRaises(date.DateNotInRange):
+            DafYomiCycle.occurrences(SubTractate.TAMID, 34, 13, 15)
+
+
+class TestTractateSpan(unittest.TestCase):
+    def test_tractate(self):
+        self.assertEqual((date.Date(DafYomiCycle(14), Tractate.NIDAH, 2),
+                          date.Date(DafYomiCycle(14), Tractate.NIDAH, 73)),
+                         DafYomiCycle.tractate_span(Tractate.NIDAH, 14))
+
+    def test_shekalim(self):
+        first, last = DafYomiCycle.tractate_span(Tractate.SHEKALIM, 7)
+        self.assertEqual(13, last.date)
+        first, last = DafYomiCycle.tractate_span(Tractate.SHEKALIM, 8)
+        self.assertEqual(22, last.date)
+        self.assertEqual(20, (last.day_start - first.day_start).days)
+
+    def test_sub_tractates(self):
+        for part, first_daf, last_daf in ((SubTractate.KINNIM, 22, 25),
+                                          (SubTractate.TAMID, 25, 33),
+                                          (SubTractate.MIDDOS, 34, 37)):
+            first, last = DafYomiCycle.tractate_span(part, 14)
+            self.assertEqual((Tractate.MEILAH, first_daf),
+                             (first.month, first.date))
+            self.assertEqual((Tractate.MEILAH, last_daf),
+                             (last.month, last.date))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -18,6 +18,7 @@ import unittest
 import logging
 import sys
 from hbcal.hebrew_calendar.date import Date
+from hbcal.hebrew_calendar.gematria import to_letters
 
 from hbcal.hebrew_calendar.hebrew_year import HebrewYear, HebrewMonth
 from hbcal.hebrew_calendar.daf_yomi import DafYomiCycle, Tractate
@@ -271,6 +272,12 @@ class TestFormatDate(unittest.TestCase):
                                      CivilMonth.SEPTEMBER, 9), '%%A'),
                          '%A')
 
+    def test_short_weekdays_hebrew(self):
+        for day in range(8, 14):
+            self.assertEqual(u"\u05D9\u05D5\u05DD " + to_letters(day - 7),
+                             format(Date(GregorianYear(2019),
+                                         CivilMonth.SEPTEMBER, day), '%a#H'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,159 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from hbcal.hebrew_calendar.format_percent_string import (
+    compile_percent_string, format_percent_string, format_many, format_all,
+    split_escape, COMPILED_FORMATS, COMPILED_FORMATS_SIZE, UnknownFlagError,
+    FormatPercentString)
+from hbcal.hebrew_calendar.date import Date, DateTime
+from hbcal.hebrew_calendar.gematria import to_letters
+from hbcal.hebrew_calendar.hebrew_year import HebrewYear, HebrewMonth
+from hbcal.hebrew_calendar.civil_year import GregorianYear, CivilMonth
+from hbcal.hebrew_calendar.daf_yomi import DafYomiCycle
+from hbcal.hebrew_calendar.abs_time import DAY, RelTime
+
+
+class Formatted(object):
+    """A class with a single escape for testing."""
+    ESCAPES = {'x': 'format_x', '-': None}
+
+    def format_x(self, fmt):
+        return '<' + fmt + '>'
+
+
+class TestCompile(unittest.TestCase):
+    def test_segments(self):
+        self.assertEqual(
+            ((None, 'a '), (Formatted.format_x, '%-x#H'), (None, ' b%')),
+            compile_percent_string(Formatted, Formatted.ESCAPES,
+                                   'a %-x b%#H'))
+
+    def test_format(self):
+        self.assertEqual('<%x> 100% <%-x>',
+                         format_percent_string(Formatted(), Formatted.ESCAPES,
+                                               '%x 100%% %-x'))
+
+    def test_unknown_escape(self):
+        self.assertEqual('q', format_percent_string(
+            Formatted(), Formatted.ESCAPES, '%-q'))
+
+    def test_cached(self):
+        format_percent_string(Formatted(), Formatted.ESCAPES, '%x%x')
+        self.assertIn((Formatted, '%x%x'), COMPILED_FORMATS)
+
+    def test_cache_limited(self):
+        for count in range(COMPILED_FORMATS_SIZE + 1):
+            format_percent_string(Formatted(), Formatted.ESCAPES,
+                                  'x{0}%x'.format(count))
+        self.assertEqual(COMPILED_FORMATS_SIZE, len(COMPILED_FORMATS))
+        self.assertNotIn((Formatted, 'x0%x'), COMPILED_FORMATS)
+        self.assertEqual('x0<%x>', format_percent_string(
+            Formatted(), Formatted.ESCAPES, 'x0%x'))
+
+
+class TestSplitEscape(unittest.TestCase):
+    def test_no_flag(self):
+        self.assertEqual(('', ''), split_escape('%d'))
+
+    def test_flag_and_option(self):
+        self.assertEqual(('~', 'H'), split_escape('%~d#H'))
+
+    def test_last_flag(self):
+        self.assertEqual(('-', ''), split_escape('%0-d'))
+
+
+class TestFormatKey(unittest.TestCase):
+    def test_depends_on_year_class(self):
+        hebrew = Date(HebrewYear(5784), HebrewMonth.NISSAN, 15)
+        civil = Date(GregorianYear(2024), CivilMonth.APRIL, 23)
+        self.assertNotEqual(hebrew.format_key, civil.format_key)
+        self.assertIn('~', hebrew.escapes)
+        self.assertNotIn('~', civil.escapes)
+
+    def test_gematria_and_digits(self):
+        hebrew = Date(HebrewYear(5784), HebrewMonth.NISSAN, 15)
+        civil = Date(GregorianYear(2024), CivilMonth.APRIL, 23)
+        self.assertEqual(u'23 2024', format(civil, '%d %Y'))
+        self.assertEqual(u'15', format(hebrew, '%d'))
+        self.assertEqual(to_letters(15), format(hebrew, '%~d#H'))
+
+    def test_unknown_flag(self):
+        with self.assertRaises(UnknownFlagError):
+            FormatPercentString.format_number(1, 2, '%!d', True)
+
+
+class TestFormatMany(unittest.TestCase):
+    def setUp(self):
+        start = Date(GregorianYear(2023), CivilMonth.JANUARY, 1).day_start
+        self.dates = []
+        for day in range(0, 800, 7):
+            atime = start + day * DAY
+            self.dates += [Date(HebrewYear, atime), Date(GregorianYear, atime),
+                           Date(DafYomiCycle, atime)]
+
+    def check(self, fmt):
+        self.assertEqual([format(x, fmt) for x in self.dates],
+                         format_many(self.dates, fmt))
+
+    def test_hebrew_template(self):
+        self.check(u'%A %~d %B %~Y#H')
+
+    def test_english_template(self):
+        self.check(u'%a %-d %B %Y')
+
+    def test_literal_only(self):
+        self.check(u'100%%')
+
+    def test_empty(self):
+        self.assertEqual([], format_many([], u'%d'))
+
+
+class CountingDateTime(DateTime):
+    """A DateTime that records the escapes of the date that it formats."""
+
+    def __init__(self, cls, atime):
+        super(CountingDateTime, self).__init__(cls, atime)
+        self.calls = []
+
+    def format_date(self, fmt):
+        self.calls.append(fmt)
+        return super(CountingDateTime, self).format_date(fmt)
+
+
+class TestFormatAll(unittest.TestCase):
+    def setUp(self):
+        start = Date(GregorianYear(2024), CivilMonth.MARCH, 1).day_start
+        self.value = DateTime(HebrewYear, start + RelTime(0, 0, 7, 300))
+
+    def test_same_as_format(self):
+        fmts = [u'%A %-d %B %-Y %H:%M#H', u'%a %~d %B %~Y#H', u'%B %%',
+                u'%A %-d %B %-Y %H:%M#H']
+        self.assertEqual([format(self.value, x) for x in fmts],
+                         format_all(self.value, fmts))
+
+    def test_fields_formatted_once(self):
+        value = CountingDateTime(HebrewYear, self.value.date.day_start)
+        format_all(value, [u'%d %B#H', u'%~d %B#H'])
+        self.assertEqual([u'%d#H', u'%B#H', u'%~d#H'], value.calls)
+
+    def test_no_formats(self):
+        self.assertEqual([], format_all(self.value, []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,7 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
 
-from hbcal.hebrew_calendar.gematria import to_letters
+from hbcal.hebrew_calendar.gematria import to_letters, from_letters
 import unittest
 
 
@@ -239,5 +239,65 @@ class TestToLetters(unittest.TestCase):
             to_letters(0.5)
 
 
+class TestFromLetters(unittest.TestCase):
+    """Tests for converting Hebrew letters to numbers"""
+
+    def test_round_trip(self):
+        for value in range(1, 20000):
+            self.assertEqual(value, from_letters(to_letters(value)))
+
+    def test_round_trip_large(self):
+        for value in range(20000, 1000000, 997):
+            self.assertEqual(value, from_letters(to_letters(value)))
+
+    def test_single_letter(self):
+        self.assertEqual(1, from_letters(u"\u05D0\u05F3"))
+
+    def test_year(self):
+        self.assertEqual(5785, from_letters(u"\u05D4\u05F3\u05EA\u05E9"
+                                            u"\u05E4\u05F4\u05D4"))
+
+    def test_year_without_punctuation(self):
+        self.assertEqual(5785,
+                         from_letters(u"\u05D4\u05EA\u05E9\u05E4\u05D4"))
+
+    def test_year_with_quotation_marks(self):
+        self.assertEqual(5785, from_letters(u"\u05D4'\u05EA\u05E9"
+                                            u"\u05E4\"\u05D4"))
+
+    def test_final_letters(self):
+        self.assertEqual(740, from_letters(u"\u05EA\u05E9\u05F4\u05DD"))
+
+    def test_invalid_character(self):
+        with self.assertRaises(ValueError):
+            from_letters(u"\u05D0x")
+
+    def test_no_letters(self):
+        with self.assertRaises(ValueError):
+            from_letters(u"\u05F3")
+
+    def test_repeated_units(self):
+        with self.assertRaises(ValueError):
+            from_letters(u"\u05D0\u05D0\u05D0")
+
+    def test_two_tens(self):
+        with self.assertRaises(ValueError):
+            from_letters(u"\u05DB\u05D9")
+
+    def test_two_hundreds(self):
+        with self.assertRaises(ValueError):
+            from_letters(u"\u05E9\u05E7")
+
+    def test_unit_after_fifteen(self):
+        with self.assertRaises(ValueError):
+            from_letters(u"\u05D8\u05D5\u05D0")
+
+    def test_unabbreviated(self):
+        letters = to_letters(2345, False)
+        self.assertEqual(u"\u05EA" * 5 + u"\u05E9\u05DE\u05F4\u05D4",
+                         letters)
+        self.assertEqual(2345, from_letters(letters))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -17,10 +17,11 @@
 import unittest
 import logging
 import sys
+from datetime import date as civil_date, timedelta
 
 from hbcal.hebrew_calendar import date
 from hbcal.hebrew_calendar.civil_year import CivilMonth, GregorianYear
-from hbcal.hebrew_calendar.abs_time import AbsTime
+from hbcal.hebrew_calendar.abs_time import AbsTime, RelTime
 
 logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 
@@ -304,5 +305,41 @@ class TestDayStart(unittest.TestCase):
                          AbsTime(300456, 6, 6, 0))
 
 
+class TestDayNumbers(unittest.TestCase):
+    """Compare conversions between dates and times with the datetime
+    module (which uses the same proleptic Gregorian calendar)."""
+
+    FIRST = civil_date(1, 1, 1)
+
+    def setUp(self):
+        self.first_start = date.Date(GregorianYear(1), CivilMonth.JANUARY,
+                                     1).day_start
+
+    def test_year_starts(self):
+        for year in (-3758, -1, 0, 1, 99, 100, 101, 400, 1600, 1900, 2000,
+                     2100, 9999):
+            self.assertEqual(
+                GregorianYear(year).start,
+                GregorianYear(year - 1).start +
+                GregorianYear(year - 1).duration())
+
+    def test_dates(self):
+        for days in range(0, 3652059, 997):
+            expected = self.FIRST + timedelta(days)
+            actual = date.Date(GregorianYear,
+                               self.first_start + RelTime(0, days, 12))
+            self.assertEqual((expected.year, expected.month, expected.day),
+                             (actual.year.value, actual.month, actual.date))
+
+    def test_last_days(self):
+        for year in (1600, 1700, 1999, 2000, 2003, 2004):
+            expected = civil_date(year, 12, 31)
+            days = (expected - self.FIRST).days
+            self.assertEqual(date.Date(GregorianYear(year),
+                                       CivilMonth.DECEMBER, 31),
+                             date.Date(GregorianYear,
+                                       self.first_start + RelTime(0, days)))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,124 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import logging
+import sys
+
+from hbcal.hebrew_calendar.abs_time import RelTime
+from hbcal.hebrew_calendar.civil_year import GregorianYear
+from hbcal.hebrew_calendar.date import Date
+from hbcal.hebrew_calendar.hebrew_year import HebrewYear, HebrewMonth
+from hbcal.hebrew_calendar.holidays import (Holiday, YearHolidays,
+                                            HOLIDAY_MASKS)
+
+logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+
+
+def civil_dates(year, holiday, israel=False):
+    """Return the Gregorian dates of a holiday in a Hebrew year."""
+    holidays = YearHolidays(HebrewYear(year), israel)
+    return [format(Date(GregorianYear,
+                        holidays.year.start + RelTime(0, day, 6)),
+                   '%-d %B %Y')
+            for day in range(holidays.year.days_in_year())
+            if holidays.is_holiday(holiday, day)]
+
+
+class TestHoliday(unittest.TestCase):
+
+    def test_str(self):
+        self.assertEqual('Shabbat Hachodesh', str(Holiday.SHABBAT_HACHODESH))
+
+    def test_format(self):
+        self.assertEqual('Chol Hamoed', format(Holiday.CHOL_HAMOED))
+        self.assertEqual(u'ראש חודש',
+                         format(Holiday.ROSH_CHODESH, '#H'))
+
+
+class TestYearHolidays(unittest.TestCase):
+
+    def test_fasts_5784(self):
+        self.assertEqual(['18 September 2023', '25 September 2023',
+                          '22 December 2023', '21 March 2024',
+                          '23 July 2024', '13 August 2024'],
+                         civil_dates(5784, Holiday.FAST_DAY))
+
+    def test_postponed_fasts(self):
+        # Tzom Gedaliah, 17 Tammuz and 9 Av all fall on Shabbat in 5785
+        self.assertEqual(['6 October 2024', '12 October 2024',
+                          '10 January 2025', '13 March 2025',
+                          '13 July 2025', '3 August 2025'],
+                         civil_dates(5785, Holiday.FAST_DAY))
+
+    def test_taanit_esther_brought_forward(self):
+        # 13 Adar 5781 was Shabbat
+        self.assertIn('25 February 2021',
+                      civil_dates(5781, Holiday.FAST_DAY))
+
+    def test_special_shabbatot(self):
+        self.assertEqual(['9 March 2024'],
+                         civil_dates(5784, Holiday.SHABBAT_SHEKALIM))
+        self.assertEqual(['23 March 2024'],
+                         civil_dates(5784, Holiday.SHABBAT_ZACHOR))
+        self.assertEqual(['30 March 2024'],
+                         civil_dates(5784, Holiday.SHABBAT_PARAH))
+        self.assertEqual(['6 April 2024'],
+                         civil_dates(5784, Holiday.SHABBAT_HACHODESH))
+
+    def test_yom_tov(self):
+        self.assertEqual(13, len(civil_dates(5784, Holiday.YOM_TOV)))
+        self.assertEqual(8, len(civil_dates(5784, Holiday.YOM_TOV, True)))
+
+    def test_chol_hamoed(self):
+        self.assertEqual(9, len(civil_dates(5784, Holiday.CHOL_HAMOED)))
+        self.assertEqual(11,
+                         len(civil_dates(5784, Holiday.CHOL_HAMOED, True)))
+
+    def test_rosh_chodesh(self):
+        holidays = YearHolidays(HebrewYear(5784))
+        self.assertFalse(holidays.is_holiday(Holiday.ROSH_CHODESH, 0))
+        for month in holidays.year.months():
+            if month != HebrewMonth.TISHRI:
+                self.assertIn(Holiday.ROSH_CHODESH,
+                              holidays.holidays(month, 1))
+        # 30 Cheshvan exists in 5784
+        self.assertIn(Holiday.ROSH_CHODESH,
+                      holidays.holidays(HebrewMonth.CHESHVAN, 30))
+        self.assertEqual([], holidays.holidays(HebrewMonth.CHESHVAN, 29))
+
+    def test_several_holidays(self):
+        holidays = YearHolidays(HebrewYear(5785))
+        self.assertEqual([Holiday.ROSH_CHODESH, Holiday.SHABBAT_SHEKALIM],
+                         holidays.holidays(HebrewMonth.ADAR_RISHON, 1))
+
+    def test_masks_shared(self):
+        # 5788 and 5791 have the same keviah
+        first = YearHolidays(HebrewYear(5788))
+        second = YearHolidays(HebrewYear(5791))
+        self.assertIs(first.masks, second.masks)
+        self.assertIn((first.year.start.days, first.year.days_in_year(),
+                       False), HOLIDAY_MASKS)
+
+    def test_in_range(self):
+        holidays = YearHolidays(HebrewYear(5784))
+        self.assertEqual([True, True, False],
+                         holidays.in_range(Holiday.YOM_TOV, 0, 3))
+        self.assertEqual(0b11, holidays.range_mask(Holiday.YOM_TOV, 0, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,8 +19,9 @@ import logging
 import sys
 
 from hbcal.hebrew_calendar import date
-from hbcal.hebrew_calendar.civil_year import CivilMonth, JulianYear
-from hbcal.hebrew_calendar.abs_time import AbsTime
+from hbcal.hebrew_calendar.civil_year import (CivilMonth, JulianYear,
+                                              GregorianYear)
+from hbcal.hebrew_calendar.abs_time import AbsTime, RelTime
 
 logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 
@@ -303,5 +304,27 @@ class TestDayStart(unittest.TestCase):
                          AbsTime(300458, 5, 6, 0))
 
 
+class TestDayNumbers(unittest.TestCase):
+    def test_year_starts(self):
+        for year in range(-3758, 2200, 97):
+            self.assertEqual(
+                JulianYear(year).start,
+                JulianYear(year - 1).start + JulianYear(year - 1).duration())
+
+    def test_end_of_years(self):
+        for year in range(-3750, 2200, 3):
+            end = JulianYear(year + 1).start - RelTime(0, 0, 1)
+            self.assertEqual(date.Date(JulianYear(year),
+                                       CivilMonth.DECEMBER, 31),
+                             date.Date(JulianYear, end))
+
+    def test_gregorian_reform(self):
+        self.assertEqual(date.Date(JulianYear(1582), CivilMonth.OCTOBER, 5),
+                         date.Date(JulianYear,
+                                   date.Date(GregorianYear(1582),
+                                             CivilMonth.OCTOBER,
+                                             15).day_start))
+
+
 if __name__ == '__main__':
     unittest.main()
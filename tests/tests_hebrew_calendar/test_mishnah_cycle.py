@@ -0,0 +1,63 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from hbcal.hebrew_calendar.date import Date
+from hbcal.hebrew_calendar.civil_year import GregorianYear
+from hbcal.hebrew_calendar.mishnah_yomit import (MishnahYomitCycle,
+                                                 MishnahTractate, MISHNAYOS,
+                                                 chapter_and_mishnah)
+
+
+class TestMishnahYomit(unittest.TestCase):
+    def test_first_cycle(self):
+        day = Date(MishnahYomitCycle, Date(GregorianYear(1947), 5,
+                                           20).day_start)
+        self.assertEqual((1, MishnahTractate.BERACHOS, 1),
+                         (day.year.value, day.month, day.date))
+        self.assertEqual("Berachos 1:1-2", format(day, "%-B"))
+
+    def test_days_in_year(self):
+        self.assertEqual(4192, sum(MishnahYomitCycle.PAGES[1:]))
+        self.assertEqual(2096, MishnahYomitCycle(1).days_in_year())
+
+    def test_chapters(self):
+        self.assertEqual(63, len(MISHNAYOS) - 1)
+        berachos = MishnahTractate.BERACHOS
+        self.assertEqual((9, 5), chapter_and_mishnah(
+            berachos, sum(MISHNAYOS[berachos])))
+
+    def test_across_chapters(self):
+        day = Date(MishnahYomitCycle(1), MishnahTractate.BERACHOS, 3)
+        self.assertEqual("Berachos 1:5-2:1", format(day, "%-B"))
+
+    def test_across_tractates(self):
+        day = Date(MishnahYomitCycle(1), MishnahTractate.BERACHOS, 29)
+        self.assertEqual("Berachos 9:5, Peah 1:1", format(day, "%-B"))
+        day += 1
+        self.assertEqual((MishnahTractate.PEAH, "Peah 1:2-3"),
+                         (day.month, format(day, "%-B")))
+
+    def test_hebrew(self):
+        day = Date(MishnahYomitCycle(1), MishnahTractate.BERACHOS, 3)
+        self.assertEqual(u"\u05d1\u05e8\u05db\u05d5\u05ea "
+                         u"\u05d0\u05f3:\u05d4\u05f3-\u05d1\u05f3:"
+                         u"\u05d0\u05f3", format(day, "%~B#H"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import logging
+import sys
+
+from hbcal.hebrew_calendar.abs_time import AbsTime, RelTime
+from hbcal.hebrew_calendar.civil_year import GregorianYear
+from hbcal.hebrew_calendar.hebrew_year import HebrewYear, HebrewMonth
+from hbcal.hebrew_calendar.molad import (iter_molads,
+                                         KIDDUSH_LEVANA_LATEST)
+
+logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+
+
+class TestIterMolads(unittest.TestCase):
+
+    def test_empty_range(self):
+        self.assertEqual([], list(iter_molads(5775, 5775)))
+
+    def test_month_count(self):
+        # 5776 is a leap year
+        self.assertEqual(25, len(list(iter_molads(5775, 5777))))
+
+    def test_month_order(self):
+        months = [x.month for x in iter_molads(5775, 5776)]
+        self.assertEqual(HebrewMonth.TISHRI, months[0])
+        self.assertEqual(HebrewMonth.ELLUL, months[-1])
+        self.assertNotIn(HebrewMonth.ADAR_SHENI, months)
+
+    def test_matches_molad(self):
+        for molad in iter_molads(5770, 5790):
+            self.assertEqual(HebrewYear(molad.year).molad(molad.month),
+                             molad.hebrew.date.day_start +
+                             molad.hebrew.time)
+
+    def test_civil_time(self):
+        molad = list(iter_molads(5775, 5776))[7]
+        self.assertEqual(HebrewMonth.IYAR, molad.month)
+        self.assertEqual('Sunday 19 April 2015 01:27 and 4 parts',
+                         format(molad.civil,
+                                '%A %-d %B %Y %H:%M and %-P parts'))
+
+    def test_year_class(self):
+        molad = next(iter_molads(5775, 5776, year_class=GregorianYear))
+        self.assertIsInstance(molad.civil.date.year, GregorianYear)
+
+    def test_kiddush_levana(self):
+        molad = next(iter_molads(5775, 5776))
+        self.assertEqual('Saturday 27 September 2014 08:18',
+                         format(molad.earliest, '%A %-d %B %Y %H:%M'))
+        self.assertEqual('Thursday 9 October 2014 02:40',
+                         format(molad.latest, '%A %-d %B %Y %H:%M'))
+
+    def test_earliest_seven_days(self):
+        molad = next(iter_molads(5775, 5776, earliest=RelTime(0, 7)))
+        self.assertEqual('Wednesday 1 October 2014',
+                         format(molad.earliest.date, '%A %-d %B %Y'))
+
+    def test_columns(self):
+        rows = list(iter_molads(5775, 5777, columns=True))
+        molads = list(iter_molads(5775, 5777))
+        self.assertEqual(len(molads), len(rows))
+        for row, molad in zip(rows, molads):
+            year, month, chalakim, earliest, latest = row
+            self.assertEqual((molad.year, molad.month), (year, month))
+            self.assertEqual(HebrewYear(year).molad(month),
+                             AbsTime(chalakim=chalakim))
+            self.assertEqual(RelTime(0, 3).chalakim, earliest - chalakim)
+            self.assertEqual(KIDDUSH_LEVANA_LATEST.chalakim,
+                             latest - chalakim)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import logging
+import sys
+
+from hbcal.hebrew_calendar.abs_time import RelTime
+from hbcal.hebrew_calendar.civil_year import BritishYear, GregorianYear
+from hbcal.hebrew_calendar.daf_yomi import DafYomiCycle, Tractate
+from hbcal.hebrew_calendar.date import Date
+from hbcal.hebrew_calendar.hebrew_year import HebrewYear, HebrewMonth
+from hbcal.hebrew_calendar.month_index import (next_month_start,
+                                               previous_month_start,
+                                               month_bounds,
+                                               iter_month_starts)
+
+logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+
+
+class TestNextMonthStart(unittest.TestCase):
+
+    def test_hebrew(self):
+        date = Date(HebrewYear(5784), HebrewMonth.ADAR_RISHON, 15)
+        self.assertEqual(Date(HebrewYear(5784), HebrewMonth.ADAR_SHENI, 1),
+                         next_month_start(date))
+
+    def test_end_of_year(self):
+        date = Date(HebrewYear(5784), HebrewMonth.ELLUL, 1)
+        self.assertEqual(Date(HebrewYear(5785), HebrewMonth.TISHRI, 1),
+                         next_month_start(date))
+
+    def test_original_unchanged(self):
+        date = Date(HebrewYear(5784), HebrewMonth.ELLUL, 29)
+        next_month_start(date)
+        self.assertEqual(Date(HebrewYear(5784), HebrewMonth.ELLUL, 29), date)
+
+    def test_daf_yomi(self):
+        date = Date(DafYomiCycle(14), Tractate.BERACHOS, 30)
+        self.assertEqual(Date(DafYomiCycle(14), Tractate.SHABBOS, 2),
+                         next_month_start(date))
+
+
+class TestPreviousMonthStart(unittest.TestCase):
+
+    def test_mid_month(self):
+        date = Date(GregorianYear(2024), 3, 15)
+        self.assertEqual(Date(GregorianYear(2024), 3, 1),
+                         previous_month_start(date))
+
+    def test_first_day(self):
+        date = Date(GregorianYear(2024), 1, 1)
+        self.assertEqual(Date(GregorianYear(2023), 12, 1),
+                         previous_month_start(date))
+
+
+class TestMonthBounds(unittest.TestCase):
+
+    def test_bounds(self):
+        date = Date(HebrewYear(5784), HebrewMonth.CHESHVAN, 10)
+        first, following = month_bounds(date)
+        self.assertEqual(Date(HebrewYear(5784), HebrewMonth.CHESHVAN, 1),
+                         first)
+        self.assertEqual(Date(HebrewYear(5784), HebrewMonth.KISLEV, 1),
+                         following)
+        # Cheshvan 5784 has 29 days
+        self.assertEqual(RelTime(0, 29).chalakim,
+                         (following.day_start - first.day_start).chalakim)
+
+    def test_changeover(self):
+        # September 1752 only had 19 days in Britain
+        first, following = month_bounds(Date(BritishYear(1752), 9, 20))
+        self.assertEqual(RelTime(0, 19).chalakim,
+                         (following.day_start - first.day_start).chalakim)
+
+
+class TestIterMonthStarts(unittest.TestCase):
+
+    def test_matches_stepping(self):
+        for year_class, start, stop in ((HebrewYear, 5783, 5786),
+                                        (BritishYear, 1751, 1754),
+                                        (DafYomiCycle, 13, 15)):
+            starts = list(iter_month_starts(year_class, start, stop))
+            for first, second in zip(starts, starts[1:]):
+                self.assertEqual(second, next_month_start(first))
+                self.assertEqual(first, previous_month_start(second))
+                middle = Date(year_class, first.day_start + RelTime(0, 3))
+                self.assertEqual((first, second), month_bounds(middle))
+                self.assertEqual(first, Date(year_class, first.day_start))
+
+    def test_count(self):
+        # 5784 is a leap year
+        self.assertEqual(25, len(list(iter_month_starts(HebrewYear, 5784,
+                                                        5786))))
+
+    def test_empty(self):
+        self.assertEqual([], list(iter_month_starts(HebrewYear, 5784, 5784)))
+
+
+if __name__ == '__main__':
+    unittest.main()
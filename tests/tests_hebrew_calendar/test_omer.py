@@ -19,7 +19,9 @@ import logging
 import sys
 from hbcal.hebrew_calendar.date import DateNotInRange
 
-from hbcal.hebrew_calendar.hebrew_year import HebrewYear, HebrewMonth
+from hbcal.hebrew_calendar.civil_year import GregorianYear
+from hbcal.hebrew_calendar.hebrew_year import (HebrewYear, HebrewMonth,
+                                               iter_omer)
 logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 
 
@@ -67,5 +69,60 @@ class TestOmer(unittest.TestCase):
             HebrewYear(2000).omer_day(HebrewMonth.SIVAN, 0)
 
 
+class TestOmerCalendar(unittest.TestCase):
+
+    def test_length(self):
+        self.assertEqual(49, len(HebrewYear(5775).omer_calendar()))
+
+    def test_first_day(self):
+        omer_day = HebrewYear(5775).omer_calendar()[0]
+        self.assertEqual(1, omer_day.count)
+        self.assertEqual('16 Nissan 5775', format(omer_day.hebrew,
+                                                  '%-d %B %Y'))
+        self.assertEqual('Sunday 5 April 2015', format(omer_day.civil,
+                                                       '%A %-d %B %Y'))
+
+    def test_last_day(self):
+        omer_day = HebrewYear(5775).omer_calendar()[-1]
+        self.assertEqual(49, omer_day.count)
+        self.assertEqual('5 Sivan 5775', format(omer_day.hebrew,
+                                                '%-d %B %Y'))
+        self.assertEqual('Saturday 23 May 2015', format(omer_day.civil,
+                                                        '%A %-d %B %Y'))
+
+    def test_matches_omer_day(self):
+        year = HebrewYear(5776)
+        for omer_day in year.omer_calendar():
+            self.assertEqual(omer_day.count,
+                             year.omer_day(omer_day.hebrew.month,
+                                           omer_day.hebrew.date))
+
+    def test_year_class(self):
+        omer_day = HebrewYear(5775).omer_calendar(GregorianYear)[0]
+        self.assertIsInstance(omer_day.civil.year, GregorianYear)
+
+
+class TestIterOmer(unittest.TestCase):
+
+    def test_empty_range(self):
+        self.assertEqual([], list(iter_omer(5775, 5775)))
+
+    def test_matches_omer_calendar(self):
+        omer_days = list(iter_omer(5770, 5790))
+        self.assertEqual(20 * 49, len(omer_days))
+        for index, year in enumerate(range(5770, 5790)):
+            expected = HebrewYear(year).omer_calendar()
+            actual = omer_days[index * 49:(index + 1) * 49]
+            self.assertEqual([(x.civil, x.hebrew, x.count)
+                              for x in expected],
+                             [(x.civil, x.hebrew, x.count) for x in actual])
+
+    def test_day_start(self):
+        for omer_day in iter_omer(5780, 5782):
+            for date in (omer_day.hebrew, omer_day.civil):
+                self.assertEqual(date.year.day_start(date.month, date.date),
+                                 date.day_start)
+
+
 if __name__ == '__main__':
     unittest.main()
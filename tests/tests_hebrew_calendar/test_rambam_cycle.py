@@ -0,0 +1,55 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from hbcal.hebrew_calendar.date import Date
+from hbcal.hebrew_calendar.civil_year import GregorianYear
+from hbcal.hebrew_calendar.hebrew_year import HebrewYear, HebrewMonth
+from hbcal.hebrew_calendar.rambam_yomi import RambamCycle, RambamSection
+from hbcal.hebrew_calendar.abs_time import DAY
+
+
+class TestRambamYomi(unittest.TestCase):
+    def test_first_cycle(self):
+        day = Date(RambamCycle, Date(GregorianYear(1984), 4, 29).day_start)
+        self.assertEqual((1, RambamSection.HAKDAMAH, 1),
+                         (day.year.value, day.month, day.date))
+        self.assertEqual("Hakdamah 1-3", format(day, "%-B"))
+
+    def test_forty_third_cycle(self):
+        start = RambamCycle(43).start
+        self.assertEqual(Date(GregorianYear(2023), 4, 23).day_start, start)
+        self.assertEqual(Date(HebrewYear(5783), HebrewMonth.IYAR, 2),
+                         Date(HebrewYear, start))
+
+    def test_days_in_year(self):
+        self.assertEqual(1017, sum(RambamCycle.PAGES[1:]))
+        self.assertEqual(339, RambamCycle(1).days_in_year())
+
+    def test_across_sections(self):
+        day = Date(RambamCycle(1), RambamSection.HAKDAMAH, 2)
+        self.assertEqual("Hakdamah 4, Mitzvos Aseh 1-2", format(day, "%-B"))
+
+    def test_last_day(self):
+        cycle = RambamCycle(1)
+        day = Date(cycle, RambamSection.MELACHIM, -1)
+        self.assertEqual("Melachim 10-12", format(day, "%-B"))
+        self.assertEqual(cycle.start + cycle.duration(), day.day_start + DAY)
+
+
+if __name__ == "__main__":
+    unittest.main()
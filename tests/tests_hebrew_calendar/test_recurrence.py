@@ -0,0 +1,150 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import logging
+import sys
+from itertools import islice
+
+from hbcal.hebrew_calendar.civil_year import GregorianYear
+from hbcal.hebrew_calendar.date import Date
+from hbcal.hebrew_calendar.hebrew_year import HebrewYear, HebrewMonth
+from hbcal.hebrew_calendar.holidays import Holiday
+from hbcal.hebrew_calendar.recurrence import (MonthDay, HolidayRule,
+                                              RoshChodesh, NthWeekday,
+                                              WeekdayBefore, WeekdayAfter)
+from hbcal.hebrew_calendar.weekday import Weekday
+
+logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+
+
+def civil_dates(rule, start, stop):
+    """Return the civil dates of the occurrences of a rule as strings."""
+    return [format(occurrence.civil, '%a %-d %B %Y')
+            for occurrence in rule.expand(start, stop)]
+
+
+class TestMonthDay(unittest.TestCase):
+
+    def test_teveth(self):
+        self.assertEqual(['Fri 22 December 2023', 'Fri 10 January 2025'],
+                         civil_dates(MonthDay(HebrewMonth.TEVETH, 10),
+                                     5784, 5786))
+
+    def test_hebrew_date(self):
+        occurrence = next(MonthDay(HebrewMonth.ADAR_SHENI, 14).expand(5785))
+        self.assertEqual(Date(HebrewYear(5785), HebrewMonth.ADAR_RISHON, 14),
+                         occurrence.hebrew)
+        self.assertEqual(occurrence.hebrew.year.day_start(
+            HebrewMonth.ADAR_RISHON, 14), occurrence.hebrew.day_start)
+
+    def test_year_class(self):
+        occurrence = next(MonthDay(HebrewMonth.NISSAN, 15).expand(
+            5784, year_class=GregorianYear))
+        self.assertEqual(Date(GregorianYear(2024), 4, 23), occurrence.civil)
+
+    def test_open_ended(self):
+        rule = MonthDay(HebrewMonth.NISSAN, 15)
+        occurrences = list(islice(rule.expand(5784), 1000))
+        self.assertEqual(1000, len(occurrences))
+        self.assertEqual(Date(HebrewYear(6783), HebrewMonth.NISSAN, 15),
+                         occurrences[-1].hebrew)
+
+
+class TestHolidayRule(unittest.TestCase):
+
+    def test_rosh_chodesh(self):
+        # 5784 is a leap year: 12 months have Rosh Chodesh, 6 of them for
+        # two days.
+        occurrences = list(RoshChodesh().expand(5784, 5785))
+        self.assertEqual(18, len(occurrences))
+        self.assertEqual(Date(HebrewYear(5784), HebrewMonth.ELLUL, 1),
+                         occurrences[-1].hebrew)
+
+    def test_yom_tov_israel(self):
+        self.assertEqual(8, len(list(HolidayRule(Holiday.YOM_TOV, True)
+                                     .expand(5784, 5785))))
+
+
+class TestNthWeekday(unittest.TestCase):
+
+    def test_last_thursday_of_adar(self):
+        self.assertEqual(['Thu 4 April 2024', 'Thu 27 March 2025'],
+                         civil_dates(NthWeekday(HebrewMonth.ADAR_SHENI,
+                                                Weekday.THURSDAY, -1),
+                                     5784, 5786))
+
+    def test_first_monday(self):
+        self.assertEqual(['Mon 11 March 2024'],
+                         civil_dates(NthWeekday(HebrewMonth.ADAR_SHENI,
+                                                Weekday.MONDAY), 5784, 5785))
+
+    def test_fifth_shabbat_skipped(self):
+        self.assertEqual(['Sat 14 April 2029'],
+                         civil_dates(NthWeekday(HebrewMonth.NISSAN,
+                                                Weekday.SATURDAY, 5),
+                                     5784, 5790))
+
+    def test_zero(self):
+        with self.assertRaises(ValueError):
+            NthWeekday(HebrewMonth.NISSAN, Weekday.SATURDAY, 0)
+
+
+class TestRelativeWeekday(unittest.TestCase):
+
+    def test_shabbat_before(self):
+        rule = WeekdayBefore(MonthDay(HebrewMonth.AV, 15), Weekday.SATURDAY)
+        self.assertEqual(['Sat 17 August 2024', 'Sat 2 August 2025'],
+                         civil_dates(rule, 5784, 5786))
+
+    def test_shabbat_before_rosh_hashonah(self):
+        # Rosh Hashonah 5784 was on Shabbat, so the result is in 5783
+        rule = WeekdayBefore(MonthDay(HebrewMonth.TISHRI, 1),
+                             Weekday.SATURDAY)
+        occurrence = next(rule.expand(5784))
+        self.assertEqual('Sat 9 September 2023',
+                         format(occurrence.civil, '%a %-d %B %Y'))
+        self.assertEqual(Date(HebrewYear(5783), HebrewMonth.ELLUL, 23),
+                         occurrence.hebrew)
+
+    def test_inclusive(self):
+        rule = WeekdayBefore(MonthDay(HebrewMonth.TISHRI, 1),
+                             Weekday.SATURDAY, inclusive=True)
+        self.assertEqual(['Sat 16 September 2023'],
+                         civil_dates(rule, 5784, 5785))
+
+    def test_sunday_after(self):
+        rule = WeekdayAfter(MonthDay(HebrewMonth.AV, 9), Weekday.SUNDAY)
+        self.assertEqual(['Sun 18 August 2024', 'Sun 10 August 2025'],
+                         civil_dates(rule, 5784, 5786))
+        rule = WeekdayAfter(MonthDay(HebrewMonth.AV, 9), Weekday.SUNDAY,
+                            inclusive=True)
+        self.assertEqual(['Sun 18 August 2024', 'Sun 3 August 2025'],
+                         civil_dates(rule, 5784, 5786))
+
+
+class TestMonthAndDate(unittest.TestCase):
+
+    def test_inverse_of_day_of_year(self):
+        for value in (5784, 5785, 5786):
+            year = HebrewYear(value)
+            for day in range(year.days_in_year()):
+                self.assertEqual(day,
+                                 year.day_of_year(*year.month_and_date(day)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import logging
+import sys
+
+from hbcal.hebrew_calendar import date
+from hbcal.hebrew_calendar.civil_year import (CivilMonth, JulianYear,
+                                              GregorianYear, BritishYear,
+                                              ReformCalendar)
+from hbcal.hebrew_calendar.abs_time import DAY
+
+logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+
+SPAIN = ReformCalendar(1582, CivilMonth.OCTOBER, 4)
+DENMARK = ReformCalendar(1700, CivilMonth.FEBRUARY, 18)
+RUSSIA = ReformCalendar(1918, CivilMonth.JANUARY, 31)
+HOLLAND = ReformCalendar(1582, CivilMonth.DECEMBER, 14)
+YEAR_END = ReformCalendar(1582, CivilMonth.DECEMBER, 21)
+
+
+class TestFactory(unittest.TestCase):
+    def test_cached(self):
+        self.assertIs(SPAIN, ReformCalendar(1582, CivilMonth.OCTOBER, 4))
+
+    def test_british(self):
+        self.assertIs(BritishYear,
+                      ReformCalendar(1752, CivilMonth.SEPTEMBER, 2,
+                                     "BritishYear"))
+
+    def test_name(self):
+        self.assertEqual("ReformYear1582(1583)", repr(SPAIN(1583)))
+
+    def test_first_gregorian_date(self):
+        self.assertEqual(date.Date(GregorianYear(1918),
+                                   CivilMonth.FEBRUARY, 14),
+                         RUSSIA.FIRST_GREGORIAN_DATE)
+
+    def test_days_skipped(self):
+        self.assertEqual(10, SPAIN.DAYS_SKIPPED)
+        self.assertEqual(10, DENMARK.DAYS_SKIPPED)
+        self.assertEqual(13, RUSSIA.DAYS_SKIPPED)
+        self.assertEqual(11, BritishYear.DAYS_SKIPPED)
+
+
+class TestChange(unittest.TestCase):
+    def test_next_day(self):
+        for cls, expected in ((SPAIN, (1582, CivilMonth.OCTOBER, 15)),
+                              (DENMARK, (1700, CivilMonth.MARCH, 1)),
+                              (RUSSIA, (1918, CivilMonth.FEBRUARY, 14)),
+                              (HOLLAND, (1582, CivilMonth.DECEMBER, 25)),
+                              (YEAR_END, (1583, CivilMonth.JANUARY, 1))):
+            last = cls.LAST_JULIAN_DATE
+            next_day = date.Date(cls(last.year.value), last.month,
+                                 last.date) + 1
+            self.assertEqual(date.Date(cls(expected[0]), *expected[1:]),
+                             next_day)
+
+    def test_gap(self):
+        for cls, month, day in ((SPAIN, CivilMonth.OCTOBER, 5),
+                                (SPAIN, CivilMonth.OCTOBER, 14),
+                                (DENMARK, CivilMonth.FEBRUARY, 19),
+                                (RUSSIA, CivilMonth.FEBRUARY, 13)):
+            with self.assertRaises(date.BadDate):
+                date.Date(cls(cls.LAST_JULIAN_DATE.year.value), month, day)
+
+    def test_gap_over_year_end(self):
+        with self.assertRaises(date.BadDate):
+            date.Date(YEAR_END(1582), CivilMonth.DECEMBER, 22)
+
+    def test_february(self):
+        # 1700 was a leap year in the Julian calendar, but February 1700
+        # ended in the Gregorian calendar.
+        with self.assertRaises(date.BadDate):
+            date.Date(DENMARK(1700), CivilMonth.FEBRUARY, 29)
+        self.assertEqual(28, DENMARK(1700).days_in_month(CivilMonth.FEBRUARY))
+
+    def test_negative_date(self):
+        self.assertEqual(date.Date(SPAIN(1582), CivilMonth.OCTOBER, 4),
+                         date.Date(SPAIN(1582), CivilMonth.OCTOBER, -18))
+
+    def test_years(self):
+        self.assertEqual(JulianYear(1582).start, YEAR_END(1582).start)
+        self.assertEqual(GregorianYear(1583).start, YEAR_END(1583).start)
+        self.assertEqual(JulianYear(1699).start, DENMARK(1699).start)
+        self.assertEqual(GregorianYear(1701).start, DENMARK(1701).start)
+
+    def test_from_reform_year(self):
+        self.assertEqual(JulianYear(1700), JulianYear(BritishYear(1700)))
+        self.assertEqual(JulianYear(1752), JulianYear(BritishYear(1752)))
+        self.assertEqual(GregorianYear(1752),
+                         GregorianYear(BritishYear(1752)))
+        self.assertEqual(GregorianYear(1800),
+                         GregorianYear(BritishYear(1800)))
+
+    def test_from_reform_year_out_of_range(self):
+        with self.assertRaises(TypeError):
+            JulianYear(BritishYear(1800))
+        with self.assertRaises(TypeError):
+            GregorianYear(BritishYear(1700))
+
+
+class TestConversions(unittest.TestCase):
+    """Step through the days around each change, checking conversions
+    to and from times."""
+
+    def check(self, cls):
+        year = cls.LAST_JULIAN_DATE.year.value
+        day = date.Date(cls(year - 1), CivilMonth.JANUARY, 1)
+        time = day.day_start
+        while day.year.value <= year + 1:
+            self.assertEqual(time, day.day_start)
+            self.assertEqual(day, date.Date(cls, time))
+            day = date.Date(cls(day.year.value), day.month, day.date) + 1
+            time += DAY
+
+    def test_spain(self):
+        self.check(SPAIN)
+
+    def test_denmark(self):
+        self.check(DENMARK)
+
+    def test_russia(self):
+        self.check(RUSSIA)
+
+    def test_year_end(self):
+        self.check(YEAR_END)
+
+    def test_add_days(self):
+        start = date.Date(RUSSIA(1917), CivilMonth.DECEMBER, 31)
+        self.assertEqual(date.Date(RUSSIA(1918), CivilMonth.FEBRUARY, 14),
+                         start + 32)
+        end = date.Date(RUSSIA(1918), CivilMonth.FEBRUARY, 14)
+        self.assertEqual(date.Date(RUSSIA(1917), CivilMonth.DECEMBER, 31),
+                         end - 32)
+
+
+if __name__ == '__main__':
+    unittest.main()
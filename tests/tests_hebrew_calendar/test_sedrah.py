@@ -2785,3 +2785,14 @@ class TestPesachTuesdayRegularDiaspora(unittest.TestCase):
         self.assertEqual(self.test_year.sedrah(HebrewMonth.ELLUL, 29,
                                                self.israel),
                          Sedrah.HAAZINU)
+
+
+class TestSedrahNames(unittest.TestCase):
+    def test_single(self):
+        self.assertEqual("Lech Lecha", format(Sedrah.LECH_LECHA, ""))
+
+    def test_combined(self):
+        self.assertEqual("Mattos-Massey", format(Sedrah.MATTOS_MASSEY, ""))
+
+    def test_hebrew(self):
+        self.assertEqual(u"\u05E0\u05D7", format(Sedrah.NOACH, "#H"))
@@ -0,0 +1,90 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import logging
+import math
+import sys
+from datetime import date, datetime
+
+from hbcal.hebrew_calendar.date import Date
+from hbcal.hebrew_calendar.hebrew_year import HebrewYear, HebrewMonth
+from hbcal.hebrew_calendar.solar import (Location, NIGHTFALL_DEPRESSION,
+                                         year_sunsets, sunset, after_sunset,
+                                         hebrew_date)
+
+logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+
+JERUSALEM = Location(31.778, 35.235, 2)
+LONDON = Location(51.5074, -0.1278, 1)
+NEW_YORK = Location(40.7128, -74.006, -4)
+TROMSO = Location(69.65, 18.96, 1)
+
+
+class TestSunset(unittest.TestCase):
+
+    def assertTime(self, expected, minutes):
+        """Check a time in minutes against 'hh:mm' to within a minute."""
+        hours, mins = expected.split(':')
+        self.assertAlmostEqual(int(hours) * 60 + int(mins), minutes,
+                               delta=1)
+
+    def test_jerusalem(self):
+        self.assertTime('16:46', sunset(JERUSALEM, date(2024, 1, 1)))
+
+    def test_london(self):
+        self.assertTime('21:21', sunset(LONDON, date(2024, 6, 21)))
+
+    def test_new_york(self):
+        self.assertTime('20:31', sunset(NEW_YORK, date(2024, 7, 4)))
+
+    def test_nightfall(self):
+        self.assertGreater(sunset(JERUSALEM, date(2024, 1, 1),
+                                  NIGHTFALL_DEPRESSION),
+                           sunset(JERUSALEM, date(2024, 1, 1)) + 30)
+
+    def test_polar(self):
+        self.assertTrue(math.isnan(sunset(TROMSO, date(2024, 12, 21))))
+        self.assertTrue(math.isnan(sunset(TROMSO, date(2024, 6, 21))))
+        self.assertFalse(after_sunset(TROMSO, datetime(2024, 6, 21, 23)))
+
+    def test_year(self):
+        self.assertEqual(366, len(year_sunsets(JERUSALEM, 2024)))
+        self.assertEqual(365, len(year_sunsets(JERUSALEM, 2023)))
+
+    def test_cache(self):
+        first = year_sunsets(Location(10, 20, 1), 2024)
+        self.assertIs(first, year_sunsets(Location(10, 20, 1), 2024))
+
+
+class TestHebrewDate(unittest.TestCase):
+
+    def test_before_sunset(self):
+        self.assertEqual(Date(HebrewYear(5784), HebrewMonth.TEVETH, 20),
+                         hebrew_date(JERUSALEM, datetime(2024, 1, 1, 16, 40)))
+
+    def test_after_sunset(self):
+        self.assertEqual(Date(HebrewYear(5784), HebrewMonth.TEVETH, 21),
+                         hebrew_date(JERUSALEM, datetime(2024, 1, 1, 16, 50)))
+
+    def test_summer(self):
+        # Before 6pm would be the next day, but it is before sunset
+        self.assertEqual(Date(HebrewYear(5784), HebrewMonth.SIVAN, 15),
+                         hebrew_date(LONDON, datetime(2024, 6, 21, 20, 0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
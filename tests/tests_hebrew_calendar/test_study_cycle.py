@@ -0,0 +1,196 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from hbcal.hebrew_calendar.abs_time import AbsTime, DAY
+from hbcal.hebrew_calendar.date import Date, Month, DateNotInRange
+from hbcal.hebrew_calendar.gematria import to_letters
+from hbcal.hebrew_calendar.daf_yomi import (DafYomiCycle, Tractate,
+                                            DateBeforeDafYomi)
+from hbcal.hebrew_calendar.study_cycle import (StudyCycle, Edition,
+                                               DateBeforeStudyCycle,
+                                               StudyBreak)
+
+
+class Chapter(Month):
+    """The units of a small study cycle used for testing."""
+    FIRST = 1
+    SECOND = 2
+    THIRD = 3
+
+    @staticmethod
+    def start_year_month():
+        return Chapter.FIRST
+
+    @staticmethod
+    def end_year_month():
+        return Chapter.THIRD
+
+
+class ChapterCycle(StudyCycle):
+    """A small study cycle, with two later editions."""
+    START_FIRST_YEAR = AbsTime(300000, 0, 6, 0)
+    PAGES = (None, 2, 4, 3)
+    EDITIONS = (Edition(3, {Chapter.SECOND: 6}),
+                Edition(5, {Chapter.FIRST: 3}))
+
+    @classmethod
+    def month_class(cls):
+        return Chapter
+
+
+class PortionCycle(StudyCycle):
+    """A small study cycle, with three pages a day."""
+    START_FIRST_YEAR = AbsTime(300000, 0, 6, 0)
+    PAGES = (None, 2, 4, 3)
+    PAGES_PER_DAY = 3
+
+    @classmethod
+    def month_class(cls):
+        return Chapter
+
+
+class SkipCycle(ChapterCycle):
+    """A small study cycle, which skips every fourth day."""
+    SKIPS_DAYS = True
+
+    @classmethod
+    def skip_days(cls, start, days):
+        first = (start - cls.START_FIRST_YEAR).days
+        return [x for x in range(days) if (first + x) % 4 == 3]
+
+
+class TestEditions(unittest.TestCase):
+    def test_days_in_year(self):
+        self.assertEqual([9, 9, 11, 11, 12, 12],
+                         [ChapterCycle(x).days_in_year() for x in
+                          range(1, 7)])
+
+    def test_days_in_month(self):
+        self.assertEqual(6, ChapterCycle(3).days_in_month(Chapter.SECOND))
+        self.assertEqual(2, ChapterCycle(4).days_in_month(Chapter.FIRST))
+        self.assertEqual(3, ChapterCycle(5).days_in_month(Chapter.FIRST))
+        self.assertEqual(6, ChapterCycle(5).days_in_month(Chapter.SECOND))
+
+    def test_starts(self):
+        start = ChapterCycle.START_FIRST_YEAR
+        for value in range(1, 10):
+            cycle = ChapterCycle(value)
+            self.assertEqual(start, cycle.start)
+            start += cycle.duration()
+
+    def test_month_offsets(self):
+        self.assertEqual([0, 3, 9],
+                         list(ChapterCycle(5).month_offsets().values()))
+
+
+class TestLookup(unittest.TestCase):
+    def test_every_page(self):
+        atime = ChapterCycle.START_FIRST_YEAR
+        for value in range(1, 8):
+            year = ChapterCycle(value)
+            for unit in Chapter:
+                for page in range(1, year.last_day(unit) + 1):
+                    day = Date(ChapterCycle, atime)
+                    self.assertEqual((value, unit, page),
+                                     (day.year.value, day.month, day.date))
+                    self.assertEqual(atime, Date(year, unit, page).day_start)
+                    atime += DAY
+
+    def test_before_first_cycle(self):
+        with self.assertRaises(DateBeforeStudyCycle):
+            Date(ChapterCycle, ChapterCycle.START_FIRST_YEAR - DAY)
+
+    def test_occurrences(self):
+        self.assertEqual([3, 4, 5],
+                         [x.year.value for x in
+                          ChapterCycle.occurrences(Chapter.SECOND, 5, 1, 6)])
+
+    def test_occurrences_out_of_range(self):
+        with self.assertRaises(DateNotInRange):
+            ChapterCycle.occurrences(Chapter.SECOND, 0, 1, 6)
+
+    def test_unit_span(self):
+        first, last = ChapterCycle.unit_span(Chapter.SECOND, 3)
+        self.assertEqual((Chapter.SECOND, 1), (first.month, first.date))
+        self.assertEqual((Chapter.SECOND, 6), (last.month, last.date))
+
+
+class TestDafYomi(unittest.TestCase):
+    def test_is_study_cycle(self):
+        self.assertTrue(issubclass(DafYomiCycle, StudyCycle))
+        self.assertTrue(issubclass(DateBeforeDafYomi, DateBeforeStudyCycle))
+
+    def test_shekalim_edition(self):
+        self.assertEqual(12, DafYomiCycle(7).days_in_month(Tractate.SHEKALIM))
+        self.assertEqual(21, DafYomiCycle(8).days_in_month(Tractate.SHEKALIM))
+
+    def test_gematria_format(self):
+        day = Date(DafYomiCycle(14), Tractate.BERACHOS, 15)
+        self.assertEqual(format(15, '03d'), format(day, '%d'))
+        self.assertEqual(to_letters(15), format(day, '%~d'))
+
+
+class TestPortions(unittest.TestCase):
+    def test_days(self):
+        cycle = PortionCycle(1)
+        self.assertEqual(3, cycle.days_in_year())
+        self.assertEqual([1, 1, 1],
+                         [cycle.days_in_month(x) for x in Chapter])
+
+    def test_portion(self):
+        cycle = PortionCycle(1)
+        self.assertEqual([(Chapter.FIRST, 1, 2), (Chapter.SECOND, 1, 1)],
+                         cycle.portion(Chapter.FIRST, 1))
+        self.assertEqual([(Chapter.SECOND, 2, 4)],
+                         cycle.portion(Chapter.SECOND, 1))
+
+    def test_format_portion(self):
+        cycle = PortionCycle(1)
+        self.assertEqual("First 1-2, Second 1",
+                         cycle.format_portion(Chapter.FIRST, 1, "%B"))
+        self.assertEqual(u"Third {0}-{1}".format(to_letters(1),
+                                                 to_letters(3)),
+                         cycle.format_portion(Chapter.THIRD, 1, "%~B"))
+
+
+class TestSkips(unittest.TestCase):
+    def test_every_page(self):
+        atime = SkipCycle.START_FIRST_YEAR
+        for value in range(1, 8):
+            year = SkipCycle(value)
+            self.assertEqual(atime, year.start)
+            for unit in Chapter:
+                for page in range(1, year.last_day(unit) + 1):
+                    if (atime - SkipCycle.START_FIRST_YEAR).days % 4 == 3:
+                        with self.assertRaises(StudyBreak):
+                            Date(SkipCycle, atime)
+                        atime += DAY
+                    day = Date(SkipCycle, atime)
+                    self.assertEqual((value, unit, page),
+                                     (day.year.value, day.month, day.date))
+                    self.assertEqual(atime, Date(year, unit, page).day_start)
+                    atime += DAY
+            self.assertEqual(atime, year.start + year.duration())
+
+    def test_days_in_year(self):
+        self.assertEqual([11, 12, 15, 15],
+                         [SkipCycle(x).days_in_year() for x in range(1, 5)])
+
+
+if __name__ == "__main__":
+    unittest.main()
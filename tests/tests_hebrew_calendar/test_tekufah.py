@@ -0,0 +1,123 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import logging
+import sys
+
+from hbcal.hebrew_calendar.abs_time import RelTime
+from hbcal.hebrew_calendar.civil_year import GregorianYear
+from hbcal.hebrew_calendar.date import Date
+from hbcal.hebrew_calendar.hebrew_year import LUNAR_CYCLE
+from hbcal.hebrew_calendar.tekufah import (Tekufah, SHMUEL, RAV_ADDA,
+                                           tekufah, iter_tekufot,
+                                           is_birkat_hachama_year,
+                                           iter_birkat_hachama, tal_umatar)
+from hbcal.hebrew_calendar.weekday import Weekday
+
+logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+
+DATE_TIME = '%A %-d %B %Y %H:%M'
+
+
+class TestShmuel(unittest.TestCase):
+
+    def test_birkat_hachama_5769(self):
+        time = tekufah(5769, Tekufah.NISSAN)
+        self.assertEqual((Weekday.WEDNESDAY, 0, 0),
+                         (time.days, time.hours, time.chalakim))
+
+    def test_year_length(self):
+        self.assertEqual(RelTime(0, 365, 6).chalakim,
+                         (tekufah(5785, Tekufah.TISHRI) -
+                          tekufah(5784, Tekufah.TISHRI)).chalakim)
+
+    def test_tekufot_5784(self):
+        self.assertEqual(['Saturday 7 October 2023 21:00',
+                          'Sunday 7 January 2024 04:30',
+                          'Sunday 7 April 2024 12:00',
+                          'Sunday 7 July 2024 19:30'],
+                         [format(x.civil, DATE_TIME)
+                          for x in iter_tekufot(5784, 5785)])
+
+
+class TestRavAdda(unittest.TestCase):
+
+    def test_nineteen_years(self):
+        # 19 years according to Rav Adda are exactly 235 lunar months
+        self.assertEqual((235 * LUNAR_CYCLE).chalakim,
+                         (tekufah(5784, Tekufah.NISSAN, RAV_ADDA) -
+                          tekufah(5765, Tekufah.NISSAN, RAV_ADDA)).chalakim)
+
+    def test_first_tekufah(self):
+        self.assertEqual(RelTime(0, 7).chalakim,
+                         RAV_ADDA.epoch - SHMUEL.epoch)
+
+    def test_tekufat_nissan_5784(self):
+        self.assertEqual('Wednesday 27 March 2024 02:56',
+                         format(next(x for x in iter_tekufot(5784, 5785,
+                                                             RAV_ADDA)
+                                     if x.tekufah == Tekufah.NISSAN).civil,
+                                DATE_TIME))
+
+
+class TestIterTekufot(unittest.TestCase):
+
+    def test_order(self):
+        tekufot = list(iter_tekufot(5780, 5790, year_class=GregorianYear))
+        self.assertEqual(40, len(tekufot))
+        self.assertEqual([Tekufah.TISHRI, Tekufah.TEVETH, Tekufah.NISSAN,
+                          Tekufah.TAMMUZ],
+                         [x.tekufah for x in tekufot[:4]])
+        for first, second in zip(tekufot, tekufot[1:]):
+            self.assertEqual(RelTime(0, 91, 7, 540).chalakim,
+                             (second.time - first.time).chalakim)
+
+    def test_matches_tekufah(self):
+        for item in iter_tekufot(5000, 5010, RAV_ADDA):
+            self.assertEqual(tekufah(item.year, item.tekufah, RAV_ADDA),
+                             item.time)
+
+
+class TestBirkatHachama(unittest.TestCase):
+
+    def test_years(self):
+        self.assertTrue(is_birkat_hachama_year(5769))
+        self.assertFalse(is_birkat_hachama_year(5784))
+        self.assertEqual([5741, 5769, 5797],
+                         [x for x, _ in iter_birkat_hachama(5741, 5798)])
+
+    def test_dates(self):
+        self.assertEqual(['Wednesday 8 April 1981', 'Wednesday 8 April 2009',
+                          'Wednesday 8 April 2037'],
+                         [format(date, '%A %-d %B %Y')
+                          for _, date in iter_birkat_hachama(5730, 5800)])
+
+
+class TestTalUmatar(unittest.TestCase):
+
+    def test_before_leap_year(self):
+        # Tal Umatar starts a day later before a civil leap year
+        self.assertEqual(Date(GregorianYear(2023), 12, 5),
+                         tal_umatar(5784, GregorianYear))
+
+    def test_after_leap_year(self):
+        self.assertEqual(Date(GregorianYear(2024), 12, 4),
+                         tal_umatar(5785, GregorianYear))
+
+
+if __name__ == '__main__':
+    unittest.main()
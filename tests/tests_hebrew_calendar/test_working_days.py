@@ -0,0 +1,123 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import logging
+import sys
+
+from hbcal.hebrew_calendar.abs_time import RelTime
+from hbcal.hebrew_calendar.civil_year import GregorianYear
+from hbcal.hebrew_calendar.date import Date
+from hbcal.hebrew_calendar.hebrew_year import HebrewYear, HebrewMonth
+from hbcal.hebrew_calendar.holidays import Holiday, YearHolidays
+from hbcal.hebrew_calendar.weekday import Weekday
+from hbcal.hebrew_calendar.working_days import (add_working_days,
+                                                working_days_between)
+
+logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+
+
+def is_working_day(date, israel):
+    """Return True if a date is a working day, testing one day at a time."""
+    year, remainder = HebrewYear.current_year(date.day_start)
+    day = remainder.days_chalakim[0]
+    return ((year.start.days + day) % 7 != Weekday.SATURDAY and
+            not YearHolidays(year, israel).is_holiday(Holiday.YOM_TOV, day))
+
+
+def step_working_days(date, days, israel):
+    """Add working days to a date, one day at a time."""
+    step = 1 if days > 0 else -1
+    atime = date.day_start
+    count = 0
+    while count != abs(days):
+        atime += RelTime(0, step)
+        if is_working_day(Date(GregorianYear, atime), israel):
+            count += 1
+    return Date(GregorianYear, atime)
+
+
+class TestAddWorkingDays(unittest.TestCase):
+
+    def test_rosh_hashonah(self):
+        # Rosh Hashonah 5784 was on Shabbat 16 and Sunday 17 September 2023,
+        # and Yom Kippur on Monday 25 September.
+        date = add_working_days(Date(GregorianYear(2023), 9, 14), 10)
+        self.assertEqual(Date(GregorianYear(2023), 9, 28), date)
+
+    def test_zero(self):
+        date = Date(GregorianYear(2023), 9, 16)
+        self.assertEqual(date, add_working_days(date, 0))
+
+    def test_backwards(self):
+        date = add_working_days(Date(GregorianYear(2023), 9, 18), -1)
+        self.assertEqual(Date(GregorianYear(2023), 9, 15), date)
+
+    def test_israel(self):
+        # The second day of Shavuot is only Yom Tov in the diaspora
+        date = Date(HebrewYear(5784), HebrewMonth.SIVAN, 6)
+        self.assertEqual(Date(HebrewYear(5784), HebrewMonth.SIVAN, 7),
+                         add_working_days(date, 1, True))
+        self.assertEqual(Date(HebrewYear(5784), HebrewMonth.SIVAN, 8),
+                         add_working_days(date, 1, False))
+
+    def test_year_class(self):
+        date = add_working_days(Date(HebrewYear(5784), 7, 1), 1)
+        self.assertIsInstance(date.year, HebrewYear)
+        date = add_working_days(Date(GregorianYear(2023), 9, 16), 1)
+        self.assertIsInstance(date.year, GregorianYear)
+
+    def test_against_stepping(self):
+        start = Date(GregorianYear(2023), 1, 1).day_start
+        for days_after, days, israel in ((0, 400, False), (17, -400, True),
+                                         (250, 777, True), (600, -5, False),
+                                         (365, 1, False), (900, -900, True)):
+            date = Date(GregorianYear, start + RelTime(0, days_after))
+            self.assertEqual(step_working_days(date, days, israel),
+                             add_working_days(date, days, israel))
+
+    def test_many_years(self):
+        start = Date(GregorianYear(1900), 1, 1)
+        end = add_working_days(start, 100000)
+        self.assertEqual(100000, working_days_between(start, end))
+        self.assertEqual(start, add_working_days(end, -100000))
+
+
+class TestWorkingDaysBetween(unittest.TestCase):
+
+    def test_same_date(self):
+        date = Date(GregorianYear(2023), 9, 14)
+        self.assertEqual(0, working_days_between(date, date))
+
+    def test_rosh_hashonah(self):
+        self.assertEqual(10, working_days_between(
+            Date(GregorianYear(2023), 9, 14),
+            Date(GregorianYear(2023), 9, 28)))
+
+    def test_reversed(self):
+        self.assertEqual(-10, working_days_between(
+            Date(GregorianYear(2023), 9, 28),
+            Date(GregorianYear(2023), 9, 14)))
+
+    def test_mixed_calendars(self):
+        # 6 Sivan 5784 was Wednesday 12 June 2024
+        self.assertEqual(1, working_days_between(
+            Date(HebrewYear(5784), HebrewMonth.SIVAN, 6),
+            Date(GregorianYear(2024), 6, 13), True))
+
+
+if __name__ == '__main__':
+    unittest.main()
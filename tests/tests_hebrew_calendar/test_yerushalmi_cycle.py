@@ -0,0 +1,83 @@
+# Copyright 2026 Mark Stern
+#
+# This file is part of Hbcal.
+#
+# Hbcal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2,
+# as published by the Free Software Foundation.
+#
+# Hbcal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Hbcal.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from hbcal.hebrew_calendar.date import Date
+from hbcal.hebrew_calendar.civil_year import GregorianYear
+from hbcal.hebrew_calendar.study_cycle import StudyBreak
+from hbcal.hebrew_calendar.yerushalmi_yomi import (YerushalmiCycle,
+                                                   YerushalmiTractate,
+                                                   DateBeforeYerushalmiYomi)
+from hbcal.hebrew_calendar.abs_time import DAY
+
+
+class TestYearStart(unittest.TestCase):
+    def test_first_cycle(self):
+        self.assertEqual(Date(GregorianYear(1980), 2, 2).day_start,
+                         YerushalmiCycle(1).start)
+
+    def test_eleventh_cycle(self):
+        self.assertEqual(Date(GregorianYear(2022), 11, 14).day_start,
+                         YerushalmiCycle(11).start)
+
+    def test_consecutive_cycles(self):
+        for value in range(1, 15):
+            cycle = YerushalmiCycle(value)
+            self.assertEqual(cycle.start + cycle.duration(),
+                             YerushalmiCycle(value + 1).start)
+
+    def test_before_first_cycle(self):
+        with self.assertRaises(DateBeforeYerushalmiYomi):
+            Date(YerushalmiCycle, YerushalmiCycle(1).start - DAY)
+
+
+class TestSkips(unittest.TestCase):
+    def test_days_in_year(self):
+        self.assertEqual(1554, sum(YerushalmiCycle.PAGES[1:]))
+        cycle = YerushalmiCycle(11)
+        self.assertEqual(1554 + len(cycle._skips()), cycle.days_in_year())
+
+    def test_yom_kippur(self):
+        # Yom Kippur 5784
+        atime = Date(GregorianYear(2023), 9, 25).day_start
+        before = Date(YerushalmiCycle, atime - DAY)
+        with self.assertRaises(StudyBreak):
+            Date(YerushalmiCycle, atime)
+        after = Date(YerushalmiCycle, atime + DAY)
+        self.assertEqual((YerushalmiTractate.MAASER_SHENI, 15, 16),
+                         (after.month, before.date, after.date))
+
+    def test_postponed_tisha_bav(self):
+        # The 9th of Av 5785 was Shabbos, so the fast was on Sunday.
+        Date(YerushalmiCycle, Date(GregorianYear(2025), 8, 2).day_start)
+        with self.assertRaises(StudyBreak):
+            Date(YerushalmiCycle, Date(GregorianYear(2025), 8, 3).day_start)
+
+
+class TestFormat(unittest.TestCase):
+    def test_english(self):
+        day = Date(YerushalmiCycle(9), YerushalmiTractate.MAASER_SHENI, 3)
+        self.assertEqual("Maaser Sheni 3", format(day, "%B %-d"))
+
+    def test_hebrew(self):
+        day = Date(YerushalmiCycle(9), YerushalmiTractate.BAVA_KAMA, 12)
+        self.assertEqual(u"\u05d1\u05d1\u05d0 \u05e7\u05de\u05d0 "
+                         u"\u05d9\u05f4\u05d1", format(day, "%B %~d#H"))
+
+
+if __name__ == "__main__":
+    unittest.main()